@@ -0,0 +1,256 @@
+"""Макробенчмарк модели: боты играют полные партии в пуле процессов.
+
+Каждая партия идет в безголовой Simulation под управлением скриптового
+агента: он прокладывает путь к выходу через PathFinder, ведет локатор
+вдоль направления движения, запускает детектор при каждой готовности
+и запоминает найденные опасные зоны. Партии раздаются процессам
+multiprocessing.Pool; по итогам печатаются партии и шаги в секунду,
+среднее число шагов до выхода и доля смертей по каждому зерну
+лабиринта, а также время горячих путей модели в одной партии
+под cProfile.
+
+Запуск из корня проекта:
+    python -m benchmarks.bot_harness
+"""
+
+import cProfile
+import math
+import multiprocessing
+import os
+import pstats
+import random
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Set, Tuple
+from src.model.game_model import GameModel
+from src.model.input_frame import InputFrame
+from src.model.path_finder import PathFinder
+from src.model.player import Player
+from src.model.scanner import DetectorScanner, LocatorScanner
+from src.model.simulation import Simulation
+
+
+# зерна лабиринтов, партий на зерно и предел шагов одной партии
+SEEDS: List[int] = list(range(8))
+GAMES_PER_SEED: int = 4
+MAX_TICKS: int = 5000
+
+# количество процессов пула (по умолчанию по числу ядер)
+WORKERS: int = os.cpu_count() or 1
+
+# доля шагов со случайным движением вместо следования пути
+WANDER_RATE: float = 0.05
+
+# размах качания локатора вокруг направления движения (в радианах) и его период в шагах
+SWEEP_SPREAD: float = math.pi / 3
+SWEEP_PERIOD: int = 40
+
+# горячие пути модели для профиля
+HOT_PATHS: Dict[str, Callable[..., Any]] = {
+    "LocatorScanner.scan": LocatorScanner.scan,
+    "DetectorScanner.scan": DetectorScanner.scan,
+    "Player._check_collision": Player._check_collision,
+    "GameModel._update_particles_and_points": GameModel._update_particles_and_points
+}
+
+
+class ScriptedAgent:
+    """Скриптовый агент, проходящий лабиринт к выходу.
+
+    Агент знает стены лабиринта (как подсказка пути в игре), но не опасные
+    зоны: их он узнает только по попаданиям детектора. Рядом с известной
+    опасной зоной агент не срезает углы по диагонали.
+
+    Attributes:
+        simulation (Simulation): Симуляция, которой управляет агент
+        rng (random.Random): Генератор случайных решений агента
+        path (List[Tuple[int, int]]): Текущий путь к выходу
+        dangers (Set[Tuple[int, int]]): Найденные опасные клетки
+    """
+
+    def __init__(self, simulation: Simulation, rng: random.Random) -> None:
+        """Создает агента для начатой партии.
+
+        Args:
+            simulation: Симуляция со сброшенной моделью
+            rng: Генератор случайных решений агента
+        """
+        self.simulation = simulation
+        self.rng = rng
+        self.path: List[Tuple[int, int]] = []
+        self.dangers: Set[Tuple[int, int]] = set()
+        self._waypoint = 0
+        self._seen_time = -1
+        self._plan()
+
+    def act(self) -> InputFrame:
+        """Выбирает ввод на следующий шаг.
+
+        Returns:
+            InputFrame: Ввод агента
+        """
+        model = self.simulation.model
+        self._observe()
+        px, py = model.player.pos
+        target = self._target()
+
+        if self.rng.random() < WANDER_RATE:
+            move_x, move_y = self.rng.choice((-1, 0, 1)), self.rng.choice((-1, 0, 1))
+        else:
+            move_x, move_y = self._steer(target)
+
+        # локатор качается вокруг направления на цель, детектор бьет по ходу движения
+        heading = math.atan2(target[1] - py, target[0] - px)
+        phase = 2 * math.pi * self.simulation.steps / SWEEP_PERIOD
+        sweep = heading + SWEEP_SPREAD * math.sin(phase)
+        aim = (px + math.cos(sweep) * model.cell_size, py + math.sin(sweep) * model.cell_size)
+        detector = model.detector_scanner.is_ready(model.clock.ticks())
+        if detector:
+            aim = target
+        return InputFrame(move_x, move_y, aim, True, detector)
+
+    def _plan(self) -> None:
+        """Прокладывает путь от клетки игрока до выхода."""
+        model = self.simulation.model
+        self.path = PathFinder.find_path(model._player_cell(), model.grid.exit_pos, model.grid)
+        self._waypoint = 0
+
+    def _observe(self) -> None:
+        """Запоминает опасные клетки из новых попаданий детектора."""
+        model = self.simulation.model
+        xs, ys, times = model.detector_points.view()
+        fresh = times > self._seen_time
+        if not fresh.any():
+            return
+        cell_size = model.cell_size
+        for x, y in zip(xs[fresh].tolist(), ys[fresh].tolist()):
+            self.dangers.add((int(x // cell_size), int(y // cell_size)))
+        self._seen_time = int(times.max())
+
+    def _target(self) -> Tuple[float, float]:
+        """Возвращает центр следующей клетки пути, сдвигая путь по ходу игрока.
+
+        Returns:
+            Tuple[float, float]: Точка цели в пикселях (x, y)
+        """
+        model = self.simulation.model
+        cell = model._player_cell()
+        if cell not in self.path[self._waypoint:self._waypoint + 2]:
+            self._plan()
+
+        cell_size = model.cell_size
+        px, py = model.player.pos
+        while self._waypoint < len(self.path):
+            cx, cy = self.path[self._waypoint]
+            target = ((cx + 0.5) * cell_size, (cy + 0.5) * cell_size)
+            if cell != (cx, cy) or max(abs(target[0] - px), abs(target[1] - py)) > model.player.speed:
+                return target
+            self._waypoint += 1
+        return (px, py)
+
+    def _steer(self, target: Tuple[float, float]) -> Tuple[int, int]:
+        """Выбирает направление движения к цели.
+
+        Args:
+            target: Точка цели в пикселях (x, y)
+
+        Returns:
+            Tuple[int, int]: Направление по осям (-1, 0, 1)
+        """
+        model = self.simulation.model
+        px, py = model.player.pos
+        dead_zone = model.player.speed / 2
+        dx, dy = target[0] - px, target[1] - py
+        move_x = (dx > dead_zone) - (dx < -dead_zone)
+        move_y = (dy > dead_zone) - (dy < -dead_zone)
+
+        # у известной опасной зоны движение только по одной оси
+        if move_x and move_y:
+            cx, cy = model._player_cell()
+            near = any(
+                (cx + ox, cy + oy) in self.dangers
+                for ox in (-1, 0, 1) for oy in (-1, 0, 1)
+            )
+            if near:
+                if abs(dx) >= abs(dy):
+                    move_y = 0
+                else:
+                    move_x = 0
+        return move_x, move_y
+
+
+def play_game(task: Tuple[int, int]) -> Tuple[int, int, bool, bool]:
+    """Играет одну партию до победы, смерти или предела шагов.
+
+    Args:
+        task: Зерно лабиринта и номер партии на этом зерне
+
+    Returns:
+        Tuple[int, int, bool, bool]: Зерно, количество шагов, победа, смерть
+    """
+    seed, game = task
+    simulation = Simulation()
+    simulation.reset(seed=seed)
+    agent = ScriptedAgent(simulation, random.Random(seed * 1000 + game))
+    while not simulation.done and simulation.steps < MAX_TICKS:
+        simulation.step(agent.act())
+    model = simulation.model
+    return seed, simulation.steps, model.game_won, model.game_over
+
+
+def profile_hot_paths(seed: int) -> Dict[str, Tuple[int, float]]:
+    """Играет одну партию под cProfile и собирает время горячих путей.
+
+    Args:
+        seed: Зерно лабиринта
+
+    Returns:
+        Dict[str, Tuple[int, float]]: Для каждого горячего пути количество
+                                      вызовов и суммарное время в секундах
+    """
+    profiler = cProfile.Profile()
+    profiler.runcall(play_game, (seed, 0))
+    stats = pstats.Stats(profiler).stats
+    result: Dict[str, Tuple[int, float]] = {}
+    for name, function in HOT_PATHS.items():
+        # ключ статистики cProfile: (файл, первая строка, имя функции)
+        code = function.__code__
+        stat = stats.get((code.co_filename, code.co_firstlineno, code.co_name))
+        result[name] = (stat[1], stat[3]) if stat else (0, 0.0)
+    return result
+
+
+def main() -> None:
+    """Запускает партии в пуле процессов и печатает таблицы результатов."""
+    tasks = [(seed, game) for seed in SEEDS for game in range(GAMES_PER_SEED)]
+    start = time.perf_counter()
+    with multiprocessing.Pool(WORKERS) as pool:
+        results = pool.map(play_game, tasks)
+    elapsed = time.perf_counter() - start
+
+    per_seed: Dict[int, List[Tuple[int, bool, bool]]] = defaultdict(list)
+    for seed, ticks, won, died in results:
+        per_seed[seed].append((ticks, won, died))
+
+    print(f"{'seed':>6} {'games':>6} {'won':>5} {'died':>5} {'avg ticks to exit':>18} {'death rate':>11}")
+    for seed in SEEDS:
+        games = per_seed[seed]
+        won = [ticks for ticks, is_won, _ in games if is_won]
+        died = sum(1 for _, _, is_dead in games if is_dead)
+        average = f"{sum(won) / len(won):18.0f}" if won else f"{'-':>18}"
+        print(f"{seed:>6} {len(games):>6} {len(won):>5} {died:>5} {average} {died / len(games):11.2f}")
+
+    total_ticks = sum(ticks for _, ticks, _, _ in results)
+    print()
+    print(f"workers: {WORKERS}, games: {len(results)}, time: {elapsed:.2f} s")
+    print(f"games/s: {len(results) / elapsed:.2f}, ticks/s: {total_ticks / elapsed:.0f}")
+
+    print()
+    print(f"{'hot path':>40} {'calls':>8} {'total ms':>10} {'us/call':>9}")
+    for name, (calls, total) in profile_hot_paths(SEEDS[0]).items():
+        per_call = total / calls * 1e6 if calls else 0.0
+        print(f"{name:>40} {calls:>8} {total * 1000:10.1f} {per_call:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Бенчмарк безголовой симуляции.
+
+Шагает GameModel через Simulation со случайным вводом без pygame
+и выводит количество шагов в секунду для разных режимов сканеров.
+Импорт pygame заблокирован до загрузки модели, поэтому бенчмарк
+упадет с ImportError, если модель снова начнет зависеть от pygame.
+
+Запуск из корня проекта:
+    python -m benchmarks.headless_step
+"""
+
+import random
+import sys
+import time
+from typing import List, Tuple
+
+# модель должна работать без pygame: любой его импорт дальше завершится ошибкой
+sys.modules['pygame'] = None
+
+from src.model.input_frame import InputFrame
+from src.model.simulation import Simulation
+
+
+# количество шагов на режим и период смены направления движения
+STEPS: int = 5000
+TURN_EVERY: int = 30
+
+# режимы: (название, локатор включен, доля шагов с запуском детектора)
+MODES: List[Tuple[str, bool, float]] = [
+    ("movement", False, 0.0),
+    ("locator", True, 0.0),
+    ("locator+detector", True, 0.05)
+]
+
+
+def run(locator: bool, detector_rate: float, seed: int) -> float:
+    """Прогоняет симуляцию и возвращает количество шагов в секунду.
+
+    Args:
+        locator: Держать локатор включенным
+        detector_rate: Вероятность запуска детектора на шаге
+        seed: Зерно случайного ввода и лабиринта
+
+    Returns:
+        float: Шагов в секунду
+    """
+    rng = random.Random(seed)
+    simulation = Simulation()
+    simulation.reset(seed=seed)
+    move = (0, 0)
+
+    start = time.perf_counter()
+    for step in range(STEPS):
+        if step % TURN_EVERY == 0:
+            move = (rng.choice((-1, 0, 1)), rng.choice((-1, 0, 1)))
+        if simulation.done:
+            simulation.reset(seed=seed + step)
+        player = simulation.model.player.pos
+        frame = InputFrame(
+            move[0],
+            move[1],
+            (player[0] + rng.uniform(-100, 100), player[1] + rng.uniform(-100, 100)),
+            locator,
+            rng.random() < detector_rate
+        )
+        simulation.step(frame)
+    return STEPS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Запускает бенчмарк и печатает таблицу результатов."""
+    print(f"{'mode':>18} {'steps/s':>10}")
+    for name, locator, detector_rate in MODES:
+        print(f"{name:>18} {run(locator, detector_rate, seed=1):10.0f}")
+
+
+if __name__ == "__main__":
+    main()
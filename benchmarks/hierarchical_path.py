@@ -0,0 +1,73 @@
+"""Бенчмарк иерархического поиска пути.
+
+Сравнивает поиск GridAStar по всем клеткам с поиском HierarchicalPathFinder
+по абстрактному графу кластеров на больших лабиринтах. Для каждого размера
+выводится время построения обоих движков, среднее время запроса полного
+пути и запроса первых PREFIX клеток пути (HPA* восстанавливает клетки
+только запрошенных отрезков). Длины путей сверяются.
+
+Запуск из корня проекта:
+    python -m benchmarks.hierarchical_path
+"""
+
+import random
+import time
+from typing import List, Tuple
+from src.model.hierarchical_path_finder import HierarchicalPathFinder
+from src.model.maze import MazeGenerator
+from src.model.path_finder import GridAStar
+
+
+# размеры лабиринтов (cols, rows), количество запросов и длина префикса пути;
+# узкий лабиринт занимает одну колонку кластеров
+SIZES: List[Tuple[int, int]] = [(101, 101), (151, 151), (301, 301), (601, 601), (15, 1501)]
+QUERIES: int = 20
+PREFIX: int = 64
+
+
+def main() -> None:
+    """Запускает бенчмарк и печатает таблицу результатов."""
+    print(
+        f"{'size':>11} {'A* build':>9} {'HPA build':>10} "
+        f"{'A* ms':>8} {'HPA ms':>8} {'speedup':>8} {'HPA prefix':>11}"
+    )
+
+    for cols, rows in SIZES:
+        grid = MazeGenerator.generate_maze(cols, rows, seed=cols * rows)
+        rng = random.Random(cols)
+        open_cells = [
+            (x, y) for y in range(rows) for x in range(cols)
+            if grid.is_passable(x, y)
+        ]
+        starts = [rng.choice(open_cells) for _ in range(QUERIES)]
+
+        begin = time.perf_counter()
+        engine = GridAStar(grid)
+        engine_build_ms = (time.perf_counter() - begin) * 1000
+
+        begin = time.perf_counter()
+        planner = HierarchicalPathFinder(grid)
+        planner_build_ms = (time.perf_counter() - begin) * 1000
+
+        begin = time.perf_counter()
+        flat_paths = [engine.find(s, grid.exit_pos) for s in starts]
+        flat_ms = (time.perf_counter() - begin) * 1000 / QUERIES
+
+        begin = time.perf_counter()
+        hierarchical_paths = [planner.find_path(s, grid.exit_pos) for s in starts]
+        hierarchical_ms = (time.perf_counter() - begin) * 1000 / QUERIES
+
+        begin = time.perf_counter()
+        for s in starts:
+            planner.find_path(s, grid.exit_pos, PREFIX)
+        prefix_ms = (time.perf_counter() - begin) * 1000 / QUERIES
+
+        assert [len(p) for p in flat_paths] == [len(p) for p in hierarchical_paths]
+        print(
+            f"{cols:>5}x{rows:<5} {engine_build_ms:9.0f} {planner_build_ms:10.0f} "
+            f"{flat_ms:8.2f} {hierarchical_ms:8.2f} {flat_ms / hierarchical_ms:7.1f}x {prefix_ms:11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Бенчмарк генерации лабиринта.
+
+Сравнивает прежнюю постобработку лабиринта на списках (поиск опасных зон
+и тонких стен с проверкой принадлежности списку) с векторизованным этапом
+MazeGenerator._create_wall_layers на лабиринтах разного размера.
+
+Запуск из корня проекта:
+    python -m benchmarks.maze_generation
+"""
+
+import random
+import time
+from typing import Callable, List, Tuple
+from src.config import Config
+from src.model.maze import MazeGenerator
+from src.model.maze_grid import MazeGrid
+
+
+# размеры лабиринтов (cols, rows)
+SIZES: List[Tuple[int, int]] = [(33, 26), (100, 100), (300, 300), (1000, 1000)]
+
+# прежняя реализация квадратична, поэтому для больших лабиринтов не запускается
+LEGACY_MAX_CELLS: int = 100 * 100
+
+
+def legacy_post_process(maze: List[List[int]], cols: int, rows: int) -> None:
+    """Прежняя постобработка: опасные зоны и тонкие стены на списках.
+
+    Args:
+        maze: Матрица лабиринта (0 - проход, 1 - стена, 2 - выход)
+        cols: Количество колонок
+        rows: Количество строк
+    """
+    def is_border_cell(x: int, y: int) -> bool:
+        return (
+            (x > 0 and maze[y][x - 1] == 0) or
+            (x < cols - 1 and maze[y][x + 1] == 0) or
+            (y > 0 and maze[y - 1][x] == 0) or
+            (y < rows - 1 and maze[y + 1][x] == 0)
+        )
+
+    wall_cells = [
+        (x, y) for y in range(rows) for x in range(cols)
+        if maze[y][x] == 1 and is_border_cell(x, y)
+    ]
+    danger_zones = random.sample(
+        wall_cells,
+        int(len(wall_cells) * Config.DANGER_ZONE_RATIO)
+    )
+
+    thin_walls = [[0 for _ in range(cols)] for _ in range(rows)]
+    for y in range(rows):
+        for x in range(cols):
+            if maze[y][x] == 1 and (x, y) not in danger_zones:
+                if is_border_cell(x, y):
+                    thin_walls[y][x] = 1
+
+
+def carve(cols: int, rows: int) -> MazeGrid:
+    """Строит лабиринт до этапа постобработки.
+
+    Args:
+        cols: Количество колонок
+        rows: Количество строк
+
+    Returns:
+        MazeGrid: Сетка с проходами и выходом
+    """
+    grid = MazeGrid(cols, rows, Config.CELL_SIZE)
+    grid.flags[:] = MazeGrid.WALL
+    MazeGenerator._create_start_zone(grid)
+    MazeGenerator._generate_with_dfs(grid)
+    MazeGenerator._create_exit(grid)
+    return grid
+
+
+def to_lists(grid: MazeGrid) -> List[List[int]]:
+    """Переводит сетку в прежнюю матрицу лабиринта.
+
+    Args:
+        grid: Сетка лабиринта
+
+    Returns:
+        List[List[int]]: Матрица (0 - проход, 1 - стена, 2 - выход)
+    """
+    walls = (grid.flags & MazeGrid.WALL) != 0
+    exits = (grid.flags & MazeGrid.EXIT) != 0
+    return (walls * 1 + exits * 2).tolist()
+
+
+def measure(func: Callable[[], None], repeats: int) -> float:
+    """Возвращает лучшее время выполнения функции в миллисекундах.
+
+    Args:
+        func: Измеряемая функция
+        repeats: Количество повторов
+
+    Returns:
+        float: Лучшее время в миллисекундах
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    """Запускает бенчмарк и печатает таблицу результатов."""
+    print(f"{'size':>11} {'carve, ms':>11} {'legacy, ms':>11} {'vector, ms':>11} {'speedup':>8}")
+
+    for cols, rows in SIZES:
+        random.seed(cols * rows)
+        carve_ms = measure(lambda: carve(cols, rows), 1)
+        grid = carve(cols, rows)
+        repeats = 5 if cols * rows <= 100_000 else 1
+
+        def vectorized() -> None:
+            work = MazeGrid(cols, rows, Config.CELL_SIZE)
+            work.cells[:] = grid.cells
+            MazeGenerator._create_wall_layers(work)
+        vector_ms = measure(vectorized, repeats)
+
+        if cols * rows <= LEGACY_MAX_CELLS:
+            maze = to_lists(grid)
+            legacy_ms = measure(lambda: legacy_post_process(maze, cols, rows), repeats)
+            legacy_text = f"{legacy_ms:11.2f}"
+            speedup_text = f"{legacy_ms / vector_ms:7.0f}x"
+        else:
+            legacy_text = f"{'skipped':>11}"
+            speedup_text = f"{'-':>8}"
+
+        print(f"{cols:>5}x{rows:<5} {carve_ms:11.2f} {legacy_text} {vector_ms:11.2f} {speedup_text}")
+
+
+if __name__ == "__main__":
+    main()
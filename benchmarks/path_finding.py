@@ -0,0 +1,102 @@
+"""Бенчмарк поиска пути.
+
+Сравнивает прежний A* на словарях и кортежах с движком GridAStar
+на плоских индексах клеток. Для каждого размера лабиринта ищутся пути
+из одних и тех же случайных клеток до выхода.
+
+Запуск из корня проекта:
+    python -m benchmarks.path_finding
+"""
+
+import heapq
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+from src.model.maze import MazeGenerator
+from src.model.maze_grid import MazeGrid
+from src.model.path_finder import PathFinder
+
+
+# размеры лабиринтов (cols, rows) и количество запросов
+SIZES: List[Tuple[int, int]] = [(33, 26), (101, 101), (301, 301), (601, 601)]
+QUERIES: int = 20
+
+
+def legacy_find_path(
+    start: Tuple[int, int],
+    exit_pos: Tuple[int, int],
+    grid: MazeGrid
+) -> List[Tuple[int, int]]:
+    """Прежний A*: узлы-кортежи, три словаря и повторные записи в куче.
+
+    Args:
+        start: Начальная клетка (x, y)
+        exit_pos: Клетка выхода (x, y)
+        grid: Сетка лабиринта
+
+    Returns:
+        List[Tuple[int, int]]: Путь без начальной клетки
+    """
+    def heuristic(a: Tuple[int, int], b: Tuple[int, int]) -> int:
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    open_set = [(0, start)]
+    came_from: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {}
+    g_score: Dict[Tuple[int, int], float] = {start: 0}
+    f_score: Dict[Tuple[int, int], float] = {start: heuristic(start, exit_pos)}
+
+    while open_set:
+        current = heapq.heappop(open_set)[1]
+        if current == exit_pos:
+            path = []
+            while current in came_from:
+                path.append(current)
+                current = came_from[current]
+            path.reverse()
+            return path
+
+        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+            neighbor = (current[0] + dx, current[1] + dy)
+            if not grid.contains(neighbor[0], neighbor[1]):
+                continue
+            if grid.is_wall(neighbor[0], neighbor[1]):
+                continue
+            tentative_g_score = g_score[current] + 1
+            if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                f_score[neighbor] = tentative_g_score + heuristic(neighbor, exit_pos)
+                heapq.heappush(open_set, (f_score[neighbor], neighbor))
+    return []
+
+
+def main() -> None:
+    """Запускает бенчмарк и печатает таблицу результатов."""
+    print(f"{'size':>11} {'legacy, ms':>11} {'flat, ms':>11} {'speedup':>8}")
+
+    for cols, rows in SIZES:
+        grid = MazeGenerator.generate_maze(cols, rows, seed=cols * rows)
+        rng = random.Random(cols)
+        open_cells = [
+            (x, y) for y in range(rows) for x in range(cols)
+            if grid.is_passable(x, y)
+        ]
+        starts = [rng.choice(open_cells) for _ in range(QUERIES)]
+
+        # прогрев: создание движка и его буферов не входит в замер
+        PathFinder.engine(grid)
+
+        begin = time.perf_counter()
+        legacy_paths = [legacy_find_path(s, grid.exit_pos, grid) for s in starts]
+        legacy_ms = (time.perf_counter() - begin) * 1000 / QUERIES
+
+        begin = time.perf_counter()
+        flat_paths = [PathFinder.find_path(s, grid.exit_pos, grid) for s in starts]
+        flat_ms = (time.perf_counter() - begin) * 1000 / QUERIES
+
+        assert [len(p) for p in legacy_paths] == [len(p) for p in flat_paths]
+        print(f"{cols:>5}x{rows:<5} {legacy_ms:11.2f} {flat_ms:11.2f} {legacy_ms / flat_ms:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
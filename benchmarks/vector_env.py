@@ -0,0 +1,89 @@
+"""Бенчмарк векторной среды.
+
+Сравнивает шаги одной безголовой Simulation с шагами VectorEnv
+для разного количества сред при случайном вводе с включенными
+локатором и детектором и выводит количество шагов сред в секунду.
+
+Запуск из корня проекта:
+    python -m benchmarks.vector_env
+"""
+
+import math
+import random
+import time
+import numpy as np
+from typing import List
+from src.model.input_frame import InputFrame
+from src.model.simulation import Simulation
+from src.model.vector_env import VectorEnv
+
+
+# количество шагов на замер и количество сред векторной среды
+STEPS: int = 2000
+NUM_ENVS: List[int] = [1, 16, 64, 256, 1024]
+TURN_EVERY: int = 30
+
+
+def run_simulation(seed: int) -> float:
+    """Шагает одну Simulation и возвращает шаги в секунду.
+
+    Args:
+        seed: Зерно случайного ввода и лабиринта
+
+    Returns:
+        float: Шагов в секунду
+    """
+    rng = random.Random(seed)
+    simulation = Simulation()
+    simulation.reset(seed=seed)
+    move = (0, 0)
+
+    start = time.perf_counter()
+    for step in range(STEPS):
+        if step % TURN_EVERY == 0:
+            move = (rng.choice((-1, 0, 1)), rng.choice((-1, 0, 1)))
+        if simulation.done:
+            simulation.reset(seed=seed + step)
+        player = simulation.model.player.pos
+        angle = rng.uniform(-math.pi, math.pi)
+        aim = (player[0] + math.cos(angle) * 100, player[1] + math.sin(angle) * 100)
+        simulation.step(InputFrame(move[0], move[1], aim, True, True))
+    return STEPS / (time.perf_counter() - start)
+
+
+def run_vector(num_envs: int, seed: int) -> float:
+    """Шагает VectorEnv и возвращает шаги сред в секунду.
+
+    Args:
+        num_envs: Количество сред
+        seed: Зерно случайного ввода и лабиринтов
+
+    Returns:
+        float: Шагов сред в секунду
+    """
+    rng = np.random.default_rng(seed)
+    env = VectorEnv(num_envs, seed=seed)
+    env.reset()
+    steps = max(STEPS // num_envs, 50)
+    pressed = np.ones(num_envs, dtype=bool)
+    moves = np.zeros((num_envs, 2), dtype=np.int64)
+
+    start = time.perf_counter()
+    for step in range(steps):
+        if step % TURN_EVERY == 0:
+            moves = rng.integers(-1, 2, (num_envs, 2))
+        angles = rng.uniform(-math.pi, math.pi, num_envs)
+        env.step(moves, angles, pressed, pressed)
+    return steps * num_envs / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Запускает бенчмарк и печатает таблицу результатов."""
+    print(f"{'mode':>18} {'env steps/s':>12}")
+    print(f"{'Simulation':>18} {run_simulation(seed=1):12.0f}")
+    for num_envs in NUM_ENVS:
+        print(f"{f'VectorEnv x{num_envs}':>18} {run_vector(num_envs, seed=1):12.0f}")
+
+
+if __name__ == "__main__":
+    main()
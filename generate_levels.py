@@ -0,0 +1,142 @@
+"""Пакетная генерация лабиринтов.
+
+Этот модуль генерирует набор уровней параллельно в пуле процессов.
+Зерно каждого лабиринта определяется только общим зерном и номером
+лабиринта, поэтому результат воспроизводим и не зависит от числа
+процессов. Готовые записи пишутся в файл по мере поступления порциями.
+
+Запуск из корня проекта:
+    python generate_levels.py levels.pack --count 10000 --seed 1 --workers 8
+"""
+
+import argparse
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, List, Optional, Tuple
+from src.config import Config
+from src.model.level_pack import LevelPackWriter, encode_record
+from src.model.maze import MazeGenerator
+
+
+def maze_seed(base_seed: int, number: int) -> int:
+    """Вычисляет зерно лабиринта по общему зерну и номеру лабиринта.
+
+    Args:
+        base_seed: Общее зерно пакета
+        number: Номер лабиринта в пакете
+
+    Returns:
+        int: Зерно генерации лабиринта
+    """
+    return random.Random(f"{base_seed}:{number}").getrandbits(63)
+
+
+def generate_chunk(
+    base_seed: int,
+    first: int,
+    count: int,
+    cols: int,
+    rows: int
+) -> List[Tuple[bytes, int]]:
+    """Генерирует порцию лабиринтов в процессе-обработчике.
+
+    Args:
+        base_seed: Общее зерно пакета
+        first: Номер первого лабиринта порции
+        count: Количество лабиринтов в порции
+        cols: Количество колонок
+        rows: Количество строк
+
+    Returns:
+        List[Tuple[bytes, int]]: Закодированные записи и их зерна
+    """
+    records = []
+    for number in range(first, first + count):
+        seed = maze_seed(base_seed, number)
+        grid = MazeGenerator.generate_maze(cols, rows, seed)
+        records.append((encode_record(grid), seed))
+    return records
+
+
+def generate_levels(
+    path: str,
+    count: int,
+    base_seed: int,
+    cols: int,
+    rows: int,
+    workers: Optional[int] = None,
+    chunk_size: int = 64
+) -> float:
+    """Генерирует набор уровней в пуле процессов.
+
+    В работе одновременно находится не больше двух порций на процесс,
+    поэтому память не растет с количеством лабиринтов.
+
+    Args:
+        path: Путь к файлу набора
+        count: Количество лабиринтов
+        base_seed: Общее зерно пакета
+        cols: Количество колонок
+        rows: Количество строк
+        workers: Количество процессов (по умолчанию по числу ядер)
+        chunk_size: Количество лабиринтов в одной порции
+
+    Returns:
+        float: Скорость генерации в лабиринтах в секунду
+    """
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor, LevelPackWriter(path) as writer:
+        pending: Deque[Future] = deque()
+        next_number = 0
+
+        while next_number < count or pending:
+            # пополнение очереди порций
+            while next_number < count and len(pending) < workers * 2:
+                size = min(chunk_size, count - next_number)
+                pending.append(executor.submit(
+                    generate_chunk, base_seed, next_number, size, cols, rows
+                ))
+                next_number += size
+
+            # запись готовой порции в порядке номеров
+            for record, seed in pending.popleft().result():
+                writer.add_record(record, seed)
+
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Точка входа командной строки."""
+    parser = argparse.ArgumentParser(description="Generate a Sombre Maze level pack in parallel")
+    parser.add_argument('path')
+    parser.add_argument('--count', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--cols', type=int, default=Config.WIDTH // Config.CELL_SIZE)
+    parser.add_argument('--rows', type=int, default=Config.HEIGHT // Config.CELL_SIZE)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=64)
+    args = parser.parse_args()
+    if args.count < 0:
+        parser.error("--count must be non-negative")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    rate = generate_levels(
+        args.path,
+        args.count,
+        args.seed,
+        args.cols,
+        args.rows,
+        args.workers,
+        args.chunk_size
+    )
+    print(f"{args.path}: {args.count} mazes, {rate:.0f} mazes/sec")
+
+
+if __name__ == "__main__":
+    main()
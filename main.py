@@ -77,7 +77,7 @@ class Main:
         
         while running:
             # рассчитываем время, прошедшее с последнего кадра (в секундах)
-            dt = clock.tick(60) / 1000.0
+            dt = clock.tick(Config.FPS) / 1000.0
             
             if self.menu_controller.active:
                 # обработка событий и отрисовка меню
@@ -98,7 +98,8 @@ class Main:
                 if self.game_controller.return_to_menu:
                     self._return_to_menu()
         
-        # завершение работы Pygame при выходе из цикла
+        # завершение фоновых задач и работы Pygame при выходе из цикла
+        self.game_controller.close()
         pygame.quit()
 
     def _start_game(self) -> None:
@@ -110,6 +111,7 @@ class Main:
     def _return_to_menu(self) -> None:
         """Возвращает в главное меню и сбрасывает флаги."""
         self.menu_controller.active = True
+        self.menu_controller.idle = False
         self.game_controller.return_to_menu = False
 
 
@@ -33,6 +33,18 @@ class Config:
     START_ZONE_SIZE: int = 1
     DANGER_ZONE_RATIO: float = 0.3
     
+    # количество заранее сгенерированных лабиринтов
+    MAZE_POOL_SIZE: int = 2
+    
+    # иерархический поиск пути: сторона кластера и размер лабиринта,
+    # начиная с которого PathFinder ищет по абстрактному графу,
+    # а MazePool строит граф при генерации
+    PATH_CLUSTER_SIZE: int = 16
+    HIERARCHICAL_PATH_MIN_CELLS: int = 20000
+    
+    # количество потоков асинхронного поиска пути
+    PATH_SERVICE_WORKERS: int = 1
+    
     # игровые константы
     DIAGONAL_FACTOR: float = 0.7071  # 1/sqrt(2)
     MAX_GLOW: int = 10
@@ -40,7 +52,24 @@ class Config:
     GLOW_DECAY_RATE: int = 5
     PULSE_SPEED: float = 0.1
     
+    # частота кадров, частота шагов симуляции и предел шагов
+    # симуляции за кадр, после которого отставание отбрасывается
+    FPS: int = 60
+    SIMULATION_RATE: int = 60
+    SIMULATION_MAX_STEPS: int = 5
+    
+    # векторная среда: количество лабиринтов в наборе, количество секторов
+    # наблюдения вокруг игрока, предел шагов эпизода и награды за выход,
+    # опасную зону и шаг
+    ENV_MAZE_COUNT: int = 64
+    ENV_OBS_SECTORS: int = 32
+    ENV_MAX_STEPS: int = 3600
+    ENV_REWARD_EXIT: float = 1.0
+    ENV_REWARD_DANGER: float = -1.0
+    ENV_REWARD_STEP: float = -0.001
+    
     # настройки частиц
+    PARTICLE_CAPACITY: int = 1024
     PARTICLE_SIZE: int = 2
     PARTICLE_LIFETIME: float = 0.4
     PARTICLE_SPEED: float = 0.2
@@ -48,9 +77,12 @@ class Config:
     GAMEOVER_PARTICLE_SIZE: int = 15
     GAMEOVER_PARTICLE_LIFETIME: float = 2.0
     
+    # максимальное количество точек локатора и детектора
+    POINT_BUFFER_CAPACITY: int = 8192
+    
     # настройки локатора
     LOCATOR_SCAN_LENGTH: int = 200
-    LOCATOR_SCAN_STEP: int = 1
+    LOCATOR_SCAN_START: int = 5
     LOCATOR_ANGLE_VARIATION: float = 0.02
     LOCATOR_HIT_VARIATION: int = 2
     LOCATOR_PULSE_FACTOR: float = 1.5
@@ -69,12 +101,21 @@ class Config:
     DETECTOR_ALPHA: int = 150
     DETECTOR_LINE_ALPHA: int = 20
     DETECTOR_LINE_WIDTH: int = 1
+    DETECTOR_WAVE_CAPACITY: int = 16
+    DETECTOR_HIT_MAX_RADIUS: int = 6
+    
+    # сохранять точки волн детектора для отладки
+    DEBUG_WAVE_POINTS: bool = False
 
     # настройки отображения игры
+    SPRITE_ALPHA_LEVELS: int = 32
     PATH_LINE_WIDTH: int = 3
     FOG_ALPHA: int = 240
+    FOG_SOFT_EDGE: int = 0
     EXIT_PULSE_SIZE: int = 3
     EXIT_GLOW_ALPHA: int = 50
+    # доля измененной площади экрана, начиная с которой выводится весь кадр
+    DIRTY_RECT_MAX_RATIO: float = 0.5
     
     # настройки игрока
     PLAYER_DIRECTION_SIZE: float = 1.5
@@ -94,6 +135,10 @@ class Config:
     BUTTON_HEIGHT: int = 50
     SLIDER_KNOB_WIDTH: int = 20
     SLIDER_TEXT_OFFSET: int = 25
+    # количество поверхностей с текстом в кэше
+    TEXT_CACHE_SIZE: int = 256
+    # сколько меню без изменений ждет событие, миллисекунды
+    MENU_IDLE_TIMEOUT: int = 250
     
     # цвета
     BLACK: Tuple[int, int, int] = (0, 0, 0)
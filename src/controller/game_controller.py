@@ -5,11 +5,13 @@
 """
 
 import pygame
-import math
 from pygame import mixer
 from typing import Dict, Tuple, Any
+from src.model.clock import ManualClock
 from src.model.game_model import GameModel
-from src.model.particle import Particle
+from src.model.input_frame import InputFrame
+from src.model.maze_pool import MazePool
+from src.model.path_service import PathService
 from src.view.game_view import GameView
 from src.config import Config
 
@@ -28,6 +30,9 @@ class GameController:
         screen (pygame.Surface): Игровое окно для отрисовки
         sounds (Dict[str, pygame.mixer.Sound]): Словарь звуковых эффектов
         settings (Dict[str, Any]): Текущие настройки игры
+        maze_pool (MazePool): Пул заранее сгенерированных лабиринтов
+        path_service (PathService): Сервис асинхронного поиска пути
+        clock (ManualClock): Часы модели; идут только шагами симуляции
         model (GameModel): Модель игрового состояния
         view (GameView): Представление для отрисовки игры
         return_to_menu (bool): Флаг возврата в меню
@@ -35,6 +40,8 @@ class GameController:
         game_over_sound_played (bool): Флаг воспроизведения звука поражения
         locator_sound_playing (bool): Флаг активности звука локатора
         last_detector_time (int): Время последнего использования детектора
+        alpha (float): Доля шага симуляции, накопленная после последнего шага;
+                       используется для интерполяции при отрисовке
     """
     
     def __init__(self, screen: pygame.Surface, sounds: Dict[str, mixer.Sound]) -> None:
@@ -47,22 +54,45 @@ class GameController:
         self.screen = screen
         self.sounds = sounds
         self.settings = Config.load_settings()
-        self.model = GameModel(self.settings)
+        self.maze_pool = MazePool(Config.MAZE_POOL_SIZE)
+        self.path_service = PathService(Config.PATH_SERVICE_WORKERS)
+        self.clock = ManualClock()
+        self.model = GameModel(
+            self.settings, 
+            self.maze_pool, 
+            path_service=self.path_service, 
+            clock=self.clock
+        )
         self.view = GameView(screen)
         self.return_to_menu = False
         self.game_won_sound_played = False
         self.game_over_sound_played = False
         self.locator_sound_playing = False
         self.last_detector_time = 0
+        self.alpha = 1.0
+        self._accumulator = 0.0
 
     def start_game(self) -> None:
         """Начинает новую игру, сбрасывая все состояния."""
-        self.model = GameModel(self.settings)
+        self.clock = ManualClock()
+        self.model = GameModel(
+            self.settings, 
+            self.maze_pool, 
+            path_service=self.path_service, 
+            clock=self.clock
+        )
         self.return_to_menu = False
         self.game_won_sound_played = False
         self.game_over_sound_played = False
         self.locator_sound_playing = False
         self.last_detector_time = 0
+        self.alpha = 1.0
+        self._accumulator = 0.0
+
+    def close(self) -> None:
+        """Останавливает фоновую генерацию лабиринтов и поиск пути."""
+        self.maze_pool.close()
+        self.path_service.close()
 
     def handle_events(self) -> bool:
         """Обрабатывает игровые события.
@@ -137,8 +167,9 @@ class GameController:
             self.sounds['click'].play()
             self.model.show_path = not self.model.show_path
             if self.model.show_path:
-                self.model.find_path_to_exit()
+                self.model.request_path_to_exit()
             else:
+                self.model.cancel_path_requests()
                 self.model.path = []
             return True
                 
@@ -157,74 +188,9 @@ class GameController:
         Args:
             mouse_pos: Позиция курсора (x, y)
         """
-        current_time = pygame.time.get_ticks()
-        detector_cooldown = self.settings['detector_cooldown']
-        
-        if current_time - self.last_detector_time >= detector_cooldown:
+        if self.model.fire_detector(mouse_pos):
             self.sounds['detector'].play()
-            self._perform_detector_scan(current_time, mouse_pos)
-            self.last_detector_time = current_time
-
-    def _perform_detector_scan(
-        self, 
-        current_time: int, 
-        mouse_pos: Tuple[int, int]
-    ) -> None:
-        """Выполняет сканирование детектором и создает визуальные эффекты.
-        
-        Args:
-            current_time: Текущее время в миллисекундах
-            mouse_pos: Позиция курсора (x, y)
-        """
-        angle = math.atan2(
-            mouse_pos[1] - self.model.player.pos[1],
-            mouse_pos[0] - self.model.player.pos[0]
-        )
-        
-        # данные сканирования из модели
-        wave_points, hit_positions = self.model.add_detector_wave(
-            self.model.player.pos, 
-            angle
-        )
-        
-        # границы конуса сканирования
-        left_bound, right_bound = [], []
-        for dist in range(0, self.settings['fog_radius'], Config.DETECTOR_SCAN_STEP):
-            angle_left = angle - math.radians(Config.DETECTOR_ANGLE_MIN)
-            angle_right = angle + math.radians(Config.DETECTOR_ANGLE_MIN)
-            
-            left_bound.append((
-                self.model.player.pos[0] + math.cos(angle_left) * dist,
-                self.model.player.pos[1] + math.sin(angle_left) * dist,
-                current_time
-            ))
-            
-            right_bound.append((
-                self.model.player.pos[0] + math.cos(angle_right) * dist,
-                self.model.player.pos[1] + math.sin(angle_right) * dist,
-                current_time
-            ))
-
-        # данные волны в модели
-        self.model.detector_lines.append({
-            'points': wave_points,
-            'left_bound': left_bound,
-            'right_bound': right_bound,
-            'start_time': current_time,
-            'duration': Config.DETECTOR_WAVE_DURATION,
-            'hit_positions': hit_positions,
-            'hit_revealed': [False] * len(hit_positions)
-        })
-
-        # визуальные эффекты для опасных зон
-        for pos in hit_positions:
-            self.model.detector_points.append((*pos, current_time))
-            self.model.particles.append(Particle(
-                pos[0], pos[1],
-                self.settings['colors']['detector'],
-                Config.PARTICLE_SIZE,
-                Config.PARTICLE_LIFETIME
-            ))
+            self.last_detector_time = self.model.clock.ticks()
 
     def apply_settings(self, settings: Dict[str, Any]) -> None:
         """Применяет новые настройки игры.
@@ -248,16 +214,44 @@ class GameController:
         self.colors = settings['colors']
 
     def update(self, dt: float) -> None:
-        """Обновляет игровое состояние.
+        """Обновляет игровое состояние шагами фиксированной длины.
+        
+        Реальное время накапливается, и модель обновляется столько раз,
+        сколько целых шагов Config.SIMULATION_RATE в нем поместилось,
+        поэтому скорость игры не зависит от частоты кадров. Часы модели
+        сдвигаются на длину шага перед каждым шагом, так что перезарядка
+        сканеров и время жизни точек и волн тоже идут по времени
+        симуляции, а не по реальному. Если за кадр
+        набралось больше Config.SIMULATION_MAX_STEPS шагов, остаток
+        отбрасывается, чтобы медленный кадр не вызвал лавину шагов.
         
         Args:
             dt: Время, прошедшее с предыдущего обновления (в секундах)
         """
         mouse_pos = pygame.mouse.get_pos()
         keys_pressed = pygame.key.get_pressed()
+        frame = InputFrame(
+            keys_pressed[pygame.K_d] - keys_pressed[pygame.K_a],
+            keys_pressed[pygame.K_s] - keys_pressed[pygame.K_w],
+            mouse_pos,
+            self.model.left_mouse_down
+        )
         
         if not self.model.game_won and not self.model.game_over:
-            self.model.update(dt, mouse_pos, keys_pressed)
+            step = 1.0 / Config.SIMULATION_RATE
+            self._accumulator += dt
+            steps = 0
+            while self._accumulator >= step and steps < Config.SIMULATION_MAX_STEPS:
+                self.clock.advance(step * 1000)
+                self.model.update(step, frame)
+                self._accumulator -= step
+                steps += 1
+            if self._accumulator >= step:
+                self._accumulator = 0.0
+            self.alpha = self._accumulator / step
+        else:
+            # игра окончена: игрок неподвижен, интерполировать нечего
+            self.alpha = 1.0
         
         self._handle_locator_sound()
         self._play_game_status_sounds()
@@ -297,9 +291,8 @@ class GameController:
         """Отрисовывает текущее состояние игры."""
         game_state = {
             'player': self.model.player,
-            'maze': self.model.maze,
-            'thin_walls': self.model.thin_walls,
-            'danger_zones': self.model.danger_zones,
+            'player_pos': self.model.player.interpolate(self.alpha),
+            'grid': self.model.grid,
             'particles': self.model.particles,
             'locator_points': self.model.locator_points,
             'detector_points': self.model.detector_points,
@@ -311,6 +304,7 @@ class GameController:
             'cell_size': self.model.cell_size,
             'show_path': self.model.show_path,
             'path': self.model.path,
-            'point_lifetime': self.settings['point_lifetime']
+            'point_lifetime': self.settings['point_lifetime'],
+            'current_time': self.model.clock.ticks()
         }
         self.view.draw(game_state)
\ No newline at end of file
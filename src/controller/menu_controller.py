@@ -6,6 +6,7 @@
 
 import pygame
 from typing import Tuple, Dict
+from src.config import Config
 from src.model.menu_model import MenuModel
 from src.view.menu_view import MenuView
 from src.view.ui_elements import Slider
@@ -28,6 +29,7 @@ class MenuController:
         view (MenuView): Представление для отрисовки меню
         active (bool): Флаг активности меню
         start_game (bool): Флаг начала новой игры
+        idle (bool): Флаг того, что прошлый кадр меню ничего не изменил
     """
     
     def __init__(self, screen: pygame.Surface, sounds: Dict[str, pygame.mixer.Sound]) -> None:
@@ -43,6 +45,7 @@ class MenuController:
         self.view = MenuView(screen)
         self.active = True
         self.start_game = False
+        self.idle = False
 
     def handle_events(self) -> bool:
         """Обрабатывает события меню.
@@ -50,7 +53,12 @@ class MenuController:
         Returns:
             bool: False если приложение должно завершиться, иначе True
         """
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if not events and self.idle:
+            # меню не меняется без ввода: ждем событие вместо отрисовки кадров
+            events = [pygame.event.wait(Config.MENU_IDLE_TIMEOUT)] + pygame.event.get()
+            
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
             
@@ -212,8 +220,8 @@ class MenuController:
         pass
 
     def draw(self) -> None:
-        """Отрисовывает текущее состояние меню."""
-        self.view.draw(
+        """Отрисовывает изменения в состоянии меню."""
+        self.idle = not self.view.draw(
             current_menu=self.model.current_menu,
             main_buttons=self.model.main_menu_buttons,
             settings_sliders=self.model.settings_sliders,
@@ -0,0 +1,63 @@
+"""Часы игровой модели.
+
+Этот модуль содержит часы, от которых модель берет текущее время:
+- SystemClock: реальное время процесса
+- ManualClock: время, которое двигает вызывающий код (для безголового режима)
+"""
+
+import time
+
+
+class SystemClock:
+    """Часы реального времени в миллисекундах.
+
+    Отсчет идет от общего для процесса момента, поэтому все модели
+    и представления видят одно и то же время, как с pygame.time.get_ticks,
+    но без инициализации SDL.
+    """
+
+    # общий момент начала отсчета
+    _epoch: float = time.perf_counter()
+
+    def ticks(self) -> int:
+        """Возвращает текущее время.
+
+        Returns:
+            int: Время в миллисекундах
+        """
+        return int((time.perf_counter() - SystemClock._epoch) * 1000)
+
+
+class ManualClock:
+    """Часы, которые идут только при вызове advance.
+
+    Позволяют шагать модель быстрее реального времени и получать
+    одинаковые результаты при одинаковых входных данных.
+
+    Attributes:
+        time (float): Текущее время в миллисекундах
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        """Создает часы.
+
+        Args:
+            start: Начальное время в миллисекундах
+        """
+        self.time = start
+
+    def ticks(self) -> int:
+        """Возвращает текущее время.
+
+        Returns:
+            int: Время в миллисекундах
+        """
+        return int(self.time)
+
+    def advance(self, milliseconds: float) -> None:
+        """Сдвигает время вперед.
+
+        Args:
+            milliseconds: Сдвиг в миллисекундах
+        """
+        self.time += milliseconds
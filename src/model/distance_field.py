@@ -0,0 +1,116 @@
+"""Поле расстояний до выхода.
+
+Этот модуль содержит класс DistanceField, который один раз на лабиринт
+считает обходом в ширину расстояния от выхода до всех проходимых клеток.
+После этого путь из любой клетки строится спуском по градиенту без поиска.
+"""
+
+from array import array
+from collections import deque
+from typing import List, Tuple
+from src.model.maze_grid import MazeGrid
+
+
+class DistanceField:
+    """Плоский массив BFS-расстояний от целевой клетки.
+
+    Индексы совпадают с индексами буфера MazeGrid, поэтому рамка сетки
+    позволяет обходить соседей без проверки границ.
+
+    Attributes:
+        grid (MazeGrid): Сетка лабиринта
+        target (Tuple[int, int]): Клетка, от которой считаются расстояния
+        distances (array): Расстояния по индексам буфера (-1 для недостижимых)
+    """
+
+    def __init__(self, grid: MazeGrid, target: Tuple[int, int]) -> None:
+        """Строит поле расстояний от целевой клетки.
+
+        Args:
+            grid: Сетка лабиринта
+            target: Целевая клетка (x, y), обычно выход
+        """
+        self.grid = grid
+        self.target = target
+        self._offsets = (1, -1, grid.stride, -grid.stride)
+        self.distances = array('i', [-1]) * len(grid.buffer)
+        self._build()
+
+    def _build(self) -> None:
+        """Заполняет расстояния обходом в ширину от целевой клетки."""
+        blocked = MazeGrid.WALL | MazeGrid.OUTSIDE
+        buffer = self.grid.buffer
+        distances = self.distances
+        offsets = self._offsets
+
+        start = self.grid.index(*self.target)
+        distances[start] = 0
+        queue = deque([start])
+
+        while queue:
+            current = queue.popleft()
+            next_distance = distances[current] + 1
+            for offset in offsets:
+                neighbor = current + offset
+                if distances[neighbor] < 0 and not buffer[neighbor] & blocked:
+                    distances[neighbor] = next_distance
+                    queue.append(neighbor)
+
+    def distance(self, cell_x: int, cell_y: int) -> int:
+        """Возвращает расстояние от клетки до цели.
+
+        Args:
+            cell_x: X-координата клетки
+            cell_y: Y-координата клетки
+
+        Returns:
+            int: Количество шагов до цели или -1, если цель недостижима
+        """
+        if not self.grid.contains(cell_x, cell_y):
+            return -1
+        return self.distances[self.grid.index(cell_x, cell_y)]
+
+    def path_from(self, cell_x: int, cell_y: int) -> List[Tuple[int, int]]:
+        """Строит кратчайший путь от клетки до цели спуском по градиенту.
+
+        Путь, как и у PathFinder, не включает начальную клетку и включает
+        целевую. Если начальная клетка непроходима (например, игрок стоит
+        в опасной зоне), путь начинается с ближайшего проходимого соседа.
+
+        Args:
+            cell_x: X-координата начальной клетки
+            cell_y: Y-координата начальной клетки
+
+        Returns:
+            List[Tuple[int, int]]: Клетки пути или пустой список, если пути нет
+        """
+        if not self.grid.contains(cell_x, cell_y):
+            return []
+
+        distances = self.distances
+        offsets = self._offsets
+        position = self.grid.position
+        current = self.grid.index(cell_x, cell_y)
+        path = []
+
+        # старт в непроходимой клетке: шаг к лучшему проходимому соседу
+        if distances[current] < 0:
+            reachable = [
+                current + offset for offset in offsets
+                if distances[current + offset] >= 0
+            ]
+            if not reachable:
+                return []
+            current = min(reachable, key=distances.__getitem__)
+            path.append(position(current))
+
+        # спуск по убыванию расстояния до цели
+        while distances[current] > 0:
+            next_distance = distances[current] - 1
+            for offset in offsets:
+                if distances[current + offset] == next_distance:
+                    current += offset
+                    break
+            path.append(position(current))
+
+        return path
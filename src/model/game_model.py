@@ -4,15 +4,22 @@
 включая игрока, лабиринт, частицы, сканеры и логику игры.
 """
 
-from src.model.path_finder import PathFinder
+from src.model.clock import SystemClock
+from src.model.distance_field import DistanceField
+from src.model.input_frame import InputFrame
 from src.model.player import Player
 from src.model.maze import MazeGenerator
-from src.model.particle import Particle
+from src.model.maze_grid import MazeGrid
+from src.model.maze_pool import MazePool
+from src.model.level_pack import LevelPack
+from src.model.particle import ParticleSystem
+from src.model.path_service import PathService
+from src.model.point_buffer import PointBuffer
+from src.model.wave_store import WaveStore
 from src.model.scanner import LocatorScanner, DetectorScanner
-from src.utils import is_valid_cell
 from src.config import Config
 from typing import List, Tuple, Dict, Optional, Any
-import pygame
+import numpy as np
 import math
 
 
@@ -27,19 +34,27 @@ class GameModel:
     - Проверку условий победы/поражения
     - Поиск пути к выходу
     
+    Модель не зависит от pygame: время берется из переданных часов,
+    а ввод приходит кадрами InputFrame. С ManualClock модель можно
+    шагать без дисплея и звука и быстрее реального времени.
+    
     Attributes:
         settings (dict): Текущие настройки игры
+        maze_pool (Optional[MazePool]): Пул заранее сгенерированных лабиринтов
+        level_pack (Optional[LevelPack]): Набор готовых уровней
+        path_service (Optional[PathService]): Сервис асинхронного поиска пути
+        clock (Any): Часы модели (SystemClock или ManualClock)
         show_path (bool): Флаг отображения пути к выходу
-        path (List[Tuple[int, int]]): Рассчитанный путь к выходу
+        path (List[Tuple[int, int]]): Рассчитанный путь к выходу (остается
+                                      прежним, пока не готов новый)
         player (Player): Объект игрока
-        thin_walls (List[List[int]]): Матрица тонких стен
-        maze (List[List[int]]): Матрица лабиринта
-        danger_zones (List[Tuple[int, int]]): Список опасных зон
+        grid (MazeGrid): Сетка лабиринта с флагами клеток
+        distance_field (Optional[DistanceField]): Поле расстояний до выхода
         cell_size (int): Размер ячейки лабиринта
-        particles (List[Particle]): Список активных частиц
-        locator_points (List[Tuple[float, float, int]]): Точки локатора
-        detector_points (List[Tuple[float, float, int]]): Точки детектора
-        detector_lines (List[Dict]): Линии волн детектора
+        particles (ParticleSystem): Пул активных частиц
+        locator_points (PointBuffer): Точки локатора
+        detector_points (PointBuffer): Точки детектора
+        detector_lines (WaveStore): Волны детектора
         game_won (bool): Флаг победы в игре
         game_over (bool): Флаг поражения в игре
         left_mouse_down (bool): Флаг нажатия ЛКМ
@@ -47,26 +62,56 @@ class GameModel:
         detector_scanner (DetectorScanner): Сканер детектора
     """
     
-    def __init__(self, settings: Dict[str, Any]) -> None:
+    def __init__(
+        self, 
+        settings: Dict[str, Any], 
+        maze_pool: Optional[MazePool] = None,
+        level_pack: Optional[LevelPack] = None,
+        path_service: Optional[PathService] = None,
+        clock: Optional[Any] = None
+    ) -> None:
         """Инициализирует модель игры с заданными настройками.
         
         Args:
             settings: Словарь настроек игры
+            maze_pool: Пул готовых лабиринтов (без него лабиринт генерируется сразу)
+            level_pack: Набор уровней, из которого reset может брать лабиринты
+            path_service: Сервис поиска пути (без него путь ищется синхронно)
+            clock: Часы модели с методом ticks() (по умолчанию SystemClock)
         """
         self.settings = settings
+        self.clock = clock if clock is not None else SystemClock()
+        self.maze_pool = maze_pool
+        self.level_pack = level_pack
+        self.path_service = path_service
         self.reset()
         self.show_path = False
         self.path: List[Tuple[int, int]] = []
     
-    def reset(self) -> None:
-        """Сбрасывает игровое состояние к начальным значениям."""
+    def reset(self, level: Optional[int] = None, seed: Optional[int] = None) -> None:
+        """Сбрасывает игровое состояние к начальным значениям.
+        
+        Лабиринт берется из набора уровней по индексу или зерну, если они
+        заданы. Зерно, которого нет в наборе, генерирует лабиринт заново.
+        Без параметров лабиринт берется из пула или генерируется.
+        
+        Args:
+            level: Индекс лабиринта в наборе уровней
+            seed: Зерно лабиринта
+        """
+        if self.path_service is not None:
+            self.path_service.cancel()
+        
         self.player = Player(self.settings)
-        self.thin_walls, self.maze, self.danger_zones, self.cell_size = MazeGenerator.generate_maze()
+        self.grid = self._load_grid(level, seed)
+        self.cell_size = self.grid.cell_size
+        self.distance_field: Optional[DistanceField] = None
+        self._path_cell: Optional[Tuple[int, int]] = None
         
-        self.particles: List[Particle] = []
-        self.locator_points: List[Tuple[float, float, int]] = []
-        self.detector_points: List[Tuple[float, float, int]] = []
-        self.detector_lines: List[Dict] = []
+        self.particles = ParticleSystem()
+        self.locator_points = PointBuffer()
+        self.detector_points = PointBuffer()
+        self.detector_lines = WaveStore()
         
         self.game_won = False
         self.game_over = False
@@ -75,31 +120,57 @@ class GameModel:
         self.locator_scanner = LocatorScanner(self)
         self.detector_scanner = DetectorScanner(self)
     
-    def update(self, dt: float, mouse_pos: Tuple[int, int], keys_pressed: List[bool]) -> None:
-        """Обновляет состояние игры.
+    def _load_grid(self, level: Optional[int], seed: Optional[int]) -> MazeGrid:
+        """Выбирает источник лабиринта для нового уровня.
+        
+        Args:
+            level: Индекс лабиринта в наборе уровней
+            seed: Зерно лабиринта
+            
+        Returns:
+            MazeGrid: Сетка лабиринта
+        """
+        if level is not None and self.level_pack is not None:
+            return self.level_pack.load(level)
+        
+        if seed is not None:
+            if self.level_pack is not None:
+                index = self.level_pack.find(seed)
+                if index is not None:
+                    return self.level_pack.load(index)
+            return MazeGenerator.generate_maze(seed=seed)
+        
+        if self.maze_pool is not None:
+            return self.maze_pool.get()
+        return MazeGenerator.generate_maze()
+    
+    def update(self, dt: float, frame: InputFrame) -> None:
+        """Обновляет состояние игры на один шаг.
         
         Args:
             dt: Время, прошедшее с предыдущего обновления (в секундах)
-            mouse_pos: Позиция курсора мыши (x, y)
-            keys_pressed: Состояние нажатых клавиш
+            frame: Ввод за этот шаг
         """
-        current_time = pygame.time.get_ticks()
-        self._handle_locator_scan(current_time, mouse_pos)
-        self._handle_player_movement(keys_pressed)
+        current_time = self.clock.ticks()
+        self._handle_locator_scan(current_time, frame)
+        if frame.detector:
+            self.fire_detector(frame.aim)
+        self._handle_player_movement(frame)
+        self._update_path()
         self._check_game_status()
         self._update_particles_and_points(dt, current_time)
 
-    def _handle_locator_scan(self, current_time: int, mouse_pos: Tuple[int, int]) -> None:
+    def _handle_locator_scan(self, current_time: int, frame: InputFrame) -> None:
         """Обрабатывает сканирование локатором.
         
         Args:
             current_time: Текущее время в миллисекундах
-            mouse_pos: Позиция курсора мыши (x, y)
+            frame: Ввод за этот шаг
         """
-        if self.left_mouse_down:
+        if frame.locator:
             angle = math.atan2(
-                mouse_pos[1] - self.player.pos[1],
-                mouse_pos[0] - self.player.pos[0]
+                frame.aim[1] - self.player.pos[1],
+                frame.aim[0] - self.player.pos[0]
             )
             new_points = self.locator_scanner.scan(self.player.pos, angle)
             
@@ -116,55 +187,51 @@ class GameModel:
                     py - self.player.pos[1], 
                     px - self.player.pos[0]
                 )
-                self.particles.append(Particle(
+                self.particles.emit(
                     px, py, 
                     self.settings['colors']['locator'], 
                     Config.PARTICLE_SIZE, 
                     Config.PARTICLE_LIFETIME,
-                    [
-                        math.cos(part_angle) * Config.PARTICLE_SPEED,
-                        math.sin(part_angle) * Config.PARTICLE_SPEED
-                    ]
-                ))
+                    math.cos(part_angle) * Config.PARTICLE_SPEED,
+                    math.sin(part_angle) * Config.PARTICLE_SPEED
+                )
 
-    def _handle_player_movement(self, keys_pressed: List[bool]) -> None:
-        """Обрабатывает движение игрока на основе нажатых клавиш.
+    def _handle_player_movement(self, frame: InputFrame) -> None:
+        """Обрабатывает движение игрока по направлению из ввода.
         
         Args:
-            keys_pressed: Состояние нажатых клавиш
+            frame: Ввод за этот шаг
         """
-        move_x = keys_pressed[pygame.K_d] - keys_pressed[pygame.K_a]
-        move_y = keys_pressed[pygame.K_s] - keys_pressed[pygame.K_w]
-        
         game_state = {
-            'thin_walls': self.thin_walls,
+            'grid': self.grid,
             'cell_size': self.cell_size,
             'game_over': self.game_over,
             'game_won': self.game_won
         }
         
-        self.player.update_position(move_x, move_y, game_state)
+        self.player.update_position(frame.move_x, frame.move_y, game_state)
 
     def _check_game_status(self) -> None:
         """Проверяет условия победы или поражения."""
         cell_x = int(self.player.pos[0] // self.cell_size)
         cell_y = int(self.player.pos[1] // self.cell_size)
         
-        if is_valid_cell(cell_x, cell_y, self.maze):
-            if (cell_x, cell_y) in self.danger_zones and not self.game_over:
-                self._trigger_game_over()
-            elif self.maze[cell_y][cell_x] == 2 and not self.game_won:
-                self.game_won = True
+        flags = self.grid.at(cell_x, cell_y)
+        
+        if flags & MazeGrid.DANGER and not self.game_over:
+            self._trigger_game_over()
+        elif flags & MazeGrid.EXIT and not self.game_won:
+            self.game_won = True
     
     def _trigger_game_over(self) -> None:
         """Активирует состояние поражения и создает эффекты."""
         self.game_over = True
-        self.particles.append(Particle(
+        self.particles.emit(
             self.player.pos[0], self.player.pos[1], 
             Config.RED,
             Config.GAMEOVER_PARTICLE_SIZE, 
             Config.GAMEOVER_PARTICLE_LIFETIME
-        ))
+        )
 
     def _update_particles_and_points(self, dt: float, current_time: int) -> None:
         """Обновляет состояние частиц и временных точек.
@@ -174,70 +241,23 @@ class GameModel:
             current_time: Текущее время в миллисекундах
         """
         # обновление частиц
-        self.particles = [p for p in self.particles if p.update(dt)]
+        self.particles.update(dt)
         
         # обновление свечения игрока
         self.player.update_glow(dt)
         
-        # удаление устаревших точек локатора
-        self.locator_points = [
-            (x, y, t) for x, y, t in self.locator_points 
-            if current_time - t < self.settings['point_lifetime']
-        ]
-        
-        # удаление устаревших точек детектора
-        self.detector_points = [
-            (x, y, t) for x, y, t in self.detector_points 
-            if current_time - t < self.settings['point_lifetime']
-        ]
-
-    def get_wall_normal(
-        self, 
-        cell_x: int, 
-        cell_y: int, 
-        hit_x: float, 
-        hit_y: float
-    ) -> Tuple[int, int]:
-        """Определяет нормаль стены в точке столкновения.
+        # удаление устаревших точек локатора и детектора
+        self.locator_points.expire(current_time, self.settings['point_lifetime'])
+        self.detector_points.expire(current_time, self.settings['point_lifetime'])
         
-        Args:
-            cell_x: X-координата ячейки
-            cell_y: Y-координата ячейки
-            hit_x: X-координата точки столкновения
-            hit_y: Y-координата точки столкновения
-            
-        Returns:
-            Tuple[int, int]: Вектор нормали к стене
-        """
-        cell_left = cell_x * self.cell_size
-        cell_right = (cell_x + 1) * self.cell_size
-        cell_top = cell_y * self.cell_size
-        cell_bottom = (cell_y + 1) * self.cell_size
-        
-        # расчет расстояния до границ ячейки
-        dists = {
-            'left': abs(hit_x - cell_left),
-            'right': abs(hit_x - cell_right),
-            'top': abs(hit_y - cell_top),
-            'bottom': abs(hit_y - cell_bottom)
-        }
-        
-        # ближайшая граница
-        min_side = min(dists, key=dists.get)
-        if min_side == 'left': 
-            return (1, 0)
-        elif min_side == 'right': 
-            return (-1, 0)
-        elif min_side == 'top': 
-            return (0, 1)
-        else: 
-            return (0, -1)
-    
+        # удаление истекших волн детектора
+        self.detector_lines.expire(current_time)
+
     def add_detector_wave(
         self, 
         start_pos: Tuple[float, float], 
         angle: float
-    ) -> Tuple[List[Tuple[float, float, int]], List[Tuple[float, float]]]:
+    ) -> Tuple[Any, Any, Any]:
         """Добавляет волну детектора в указанном направлении.
         
         Args:
@@ -246,32 +266,144 @@ class GameModel:
             
         Returns:
             Tuple: 
-                - Список точек волны
-                - Список позиций обнаруженных опасных зон
+                - Точки волны (x, y, время)
+                - Позиции обнаруженных опасных клеток (x, y)
+                - Количество попаданий в каждую клетку
         """
         return self.detector_scanner.scan(start_pos, angle)
 
+    def fire_detector(self, aim: Tuple[float, float]) -> bool:
+        """Запускает детектор в сторону точки и создает его эффекты.
+        
+        Args:
+            aim: Точка прицеливания (x, y)
+            
+        Returns:
+            bool: True если волна запущена, False если детектор перезаряжается
+        """
+        current_time = self.clock.ticks()
+        if not self.detector_scanner.is_ready(current_time):
+            return False
+            
+        angle = math.atan2(
+            aim[1] - self.player.pos[1],
+            aim[0] - self.player.pos[0]
+        )
+        wave_points, hit_positions, hit_counts = self.add_detector_wave(
+            self.player.pos, 
+            angle
+        )
+        
+        # волна; точки границ конуса строятся при отрисовке
+        self.detector_lines.add(
+            self.player.pos,
+            angle,
+            self.settings['fog_radius'],
+            current_time,
+            Config.DETECTOR_WAVE_DURATION,
+            wave_points
+        )
+
+        # визуальные эффекты: одна точка и одна частица на опасную клетку,
+        # размер частицы растет с количеством попаданий
+        self.detector_points.extend(np.column_stack((
+            hit_positions, 
+            np.full(len(hit_positions), current_time)
+        )))
+        self.particles.emit_many(
+            hit_positions,
+            self.settings['colors']['detector'],
+            np.minimum(
+                Config.PARTICLE_SIZE + np.log2(hit_counts), 
+                Config.DETECTOR_HIT_MAX_RADIUS
+            ),
+            Config.PARTICLE_LIFETIME
+        )
+        return True
+
     def find_path_to_exit(self) -> None:
-        """Находит путь к выходу с помощью алгоритма A*."""
-        start_x = int(self.player.pos[0] // self.cell_size)
-        start_y = int(self.player.pos[1] // self.cell_size)
-        exit_pos = self._find_exit_position()
-        
-        if exit_pos:
-            self.path = PathFinder.find_path(
-                (start_x, start_y), 
-                exit_pos, 
-                self.maze
-            )
+        """Находит путь к выходу спуском по полю расстояний."""
+        cell = self._player_cell()
+        self.path = self._search_path(self.grid, cell)
+        self._path_cell = cell
+
+    def request_path_to_exit(self) -> None:
+        """Запрашивает путь к выходу из текущей клетки игрока.
+        
+        С сервисом поиска путь считается в рабочем потоке и попадает
+        в self.path в update(); до этого отображается прежний путь.
+        """
+        if self.path_service is None:
+            self.find_path_to_exit()
+            return
+        
+        cell = self._player_cell()
+        self.path_service.request(cell, self._search_path, self.grid, cell)
+        self._path_cell = cell
+
+    def cancel_path_requests(self) -> None:
+        """Отменяет незавершенные запросы пути."""
+        if self.path_service is not None:
+            self.path_service.cancel()
+        self._path_cell = None
+
+    def _update_path(self) -> None:
+        """Забирает готовый путь и запрашивает новый при смене клетки игрока."""
+        if not self.show_path:
+            return
+        
+        if self.path_service is not None:
+            result = self.path_service.poll()
+            if result is not None:
+                self.path = result[1]
+        
+        if self._player_cell() != self._path_cell:
+            self.request_path_to_exit()
+
+    def _player_cell(self) -> Tuple[int, int]:
+        """Возвращает клетку, в которой находится игрок.
+        
+        Returns:
+            Tuple[int, int]: Координаты клетки (x, y)
+        """
+        return (
+            int(self.player.pos[0] // self.cell_size),
+            int(self.player.pos[1] // self.cell_size)
+        )
 
-    def _find_exit_position(self) -> Optional[Tuple[int, int]]:
-        """Находит позицию выхода в лабиринте.
+    def _search_path(self, grid: MazeGrid, cell: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Строит путь до выхода; может выполняться в рабочем потоке.
+        
+        Сетка передается явно, чтобы поиск, начатый до рестарта,
+        не смешивал старый и новый лабиринты.
         
+        Args:
+            grid: Сетка лабиринта
+            cell: Начальная клетка (x, y)
+            
         Returns:
-            Optional[Tuple[int, int]]: Координаты выхода или None
+            List[Tuple[int, int]]: Путь до выхода или пустой список
         """
-        for y in range(len(self.maze)):
-            for x in range(len(self.maze[0])):
-                if self.maze[y][x] == 2:
-                    return (x, y)
-        return None
\ No newline at end of file
+        field = self._get_distance_field(grid)
+        return field.path_from(*cell) if field is not None else []
+
+    def _get_distance_field(self, grid: Optional[MazeGrid] = None) -> Optional[DistanceField]:
+        """Возвращает поле расстояний до выхода, строя его при первом запросе.
+        
+        Args:
+            grid: Сетка лабиринта (по умолчанию текущая)
+            
+        Returns:
+            Optional[DistanceField]: Поле расстояний или None, если выхода нет
+        """
+        if grid is None:
+            grid = self.grid
+        if grid.exit_pos is None:
+            return None
+        
+        field = self.distance_field
+        if field is None or field.grid is not grid:
+            field = DistanceField(grid, grid.exit_pos)
+            if grid is self.grid:
+                self.distance_field = field
+        return field
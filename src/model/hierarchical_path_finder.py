@@ -0,0 +1,531 @@
+"""Иерархический поиск пути (HPA*) для больших лабиринтов.
+
+Этот модуль содержит класс HierarchicalPathFinder, который делит лабиринт
+на квадратные кластеры и заранее строит абстрактный граф: входы между
+соседними кластерами и расстояния между входами внутри каждого кластера.
+Запрос ищет путь по абстрактному графу, а клетки пути восстанавливаются
+только для тех отрезков, которые действительно запрошены.
+"""
+
+import heapq
+import itertools
+import threading
+import weakref
+from array import array
+from collections import deque
+import numpy as np
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from src.config import Config
+from src.model.maze_grid import MazeGrid
+
+
+class HierarchicalPathFinder:
+    """Планировщик пути по абстрактному графу кластеров.
+
+    Узлы абстрактного графа - клетки по обе стороны входа между соседними
+    кластерами (индексы буфера MazeGrid). Ребра между кластерами имеют вес 1,
+    ребра внутри кластера - длину кратчайшего пути, не выходящего из него.
+    Найденный путь близок к кратчайшему, но не обязательно кратчайший.
+
+    Планировщик не хранит ссылку на сетку, поэтому его можно кэшировать
+    по слабой ссылке на нее.
+
+    Attributes:
+        cols (int): Количество колонок лабиринта
+        rows (int): Количество строк лабиринта
+        stride (int): Длина строки буфера сетки
+        cluster_size (int): Сторона кластера в клетках
+        cluster_cols (int): Количество кластеров по горизонтали
+        cluster_rows (int): Количество кластеров по вертикали
+    """
+
+    # вход длиннее этого значения дает два перехода по краям вместо одного
+    LONG_ENTRANCE: int = 6
+
+    _planners: "weakref.WeakKeyDictionary[MazeGrid, HierarchicalPathFinder]" = (
+        weakref.WeakKeyDictionary()
+    )
+    # кэш пополняется и из потока MazePool, и из главного потока
+    _planners_lock = threading.Lock()
+
+    def __init__(self, grid: MazeGrid, cluster_size: Optional[int] = None) -> None:
+        """Строит абстрактный граф лабиринта.
+
+        Args:
+            grid: Сетка лабиринта
+            cluster_size: Сторона кластера (по умолчанию из конфигурации)
+        """
+        self.cols = grid.cols
+        self.rows = grid.rows
+        self.stride = stride = grid.stride
+        self.cluster_size = cluster_size or Config.PATH_CLUSTER_SIZE
+        self.cluster_cols = -(-self.cols // self.cluster_size)
+        self.cluster_rows = -(-self.rows // self.cluster_size)
+        self._offsets = (stride, 1, -stride, -1)
+
+        # номер кластера для каждого индекса буфера (-1 для рамки)
+        size = len(grid.buffer)
+        nodes = np.arange(size, dtype=np.int32)
+        node_x = nodes % stride - 1
+        node_y = nodes // stride - 1
+        cluster_id = np.full(size, -1, dtype=np.int32)
+        inside = (node_x >= 0) & (node_x < self.cols) & (node_y >= 0) & (node_y < self.rows)
+        cluster_id[inside] = (
+            node_y[inside] // self.cluster_size * self.cluster_cols
+            + node_x[inside] // self.cluster_size
+        )
+        self._cluster_id = array('i', cluster_id.tobytes())
+        self._xs = array('i', node_x.tobytes())
+        self._ys = array('i', node_y.tobytes())
+
+        # карта стен; представление позволяет обновлять ее по кластерам
+        self._walls = bytearray(size)
+        self._wall_view = np.frombuffer(self._walls, dtype=np.uint8).reshape(-1, stride)
+
+        # абстрактный граф
+        count = self.cluster_cols * self.cluster_rows
+        self._cluster_nodes: List[Set[int]] = [set() for _ in range(count)]
+        self._edges: Dict[int, Dict[int, int]] = {}
+        self._node_refs: Dict[int, int] = {}
+        self._transitions: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+
+        self._read_walls(grid, 0, 0, self.cols, self.rows)
+        for cluster in range(count):
+            for neighbor in self._next_clusters(cluster):
+                self._build_border(cluster, neighbor)
+        for cluster in range(count):
+            self._connect_cluster(cluster)
+
+    @classmethod
+    def planner(cls, grid: MazeGrid) -> "HierarchicalPathFinder":
+        """Возвращает планировщик для сетки, создавая его при первом запросе.
+
+        Построение выполняется под блокировкой кэша, поэтому запрос
+        из другого потока дождется уже начатого построения, а не повторит его.
+
+        Args:
+            grid: Сетка лабиринта
+
+        Returns:
+            HierarchicalPathFinder: Планировщик с абстрактным графом этой сетки
+        """
+        with cls._planners_lock:
+            planner = cls._planners.get(grid)
+            if planner is None:
+                planner = cls(grid)
+                cls._planners[grid] = planner
+            return planner
+
+    def find_path(
+        self,
+        start: Tuple[int, int],
+        goal: Tuple[int, int],
+        max_length: Optional[int] = None
+    ) -> List[Tuple[int, int]]:
+        """Находит путь между клетками.
+
+        Args:
+            start: Координаты начальной клетки (x, y)
+            goal: Координаты целевой клетки (x, y)
+            max_length: Сколько первых клеток пути восстановить (по умолчанию весь путь)
+
+        Returns:
+            List[Tuple[int, int]]: Путь без начальной клетки, включая целевую,
+                                    или пустой список, если путь не найден
+        """
+        return list(itertools.islice(self.iter_path(start, goal), max_length))
+
+    def iter_path(
+        self,
+        start: Tuple[int, int],
+        goal: Tuple[int, int]
+    ) -> Iterator[Tuple[int, int]]:
+        """Выдает клетки пути, уточняя отрезки абстрактного пути по мере обхода.
+
+        Поиск по абстрактному графу выполняется при запросе первой клетки,
+        а каждый отрезок внутри кластера восстанавливается только при переходе
+        к нему.
+
+        Args:
+            start: Координаты начальной клетки (x, y)
+            goal: Координаты целевой клетки (x, y)
+
+        Yields:
+            Tuple[int, int]: Клетки пути без начальной, включая целевую
+        """
+        start_x, start_y = start
+        goal_x, goal_y = goal
+        if not (0 <= start_x < self.cols and 0 <= start_y < self.rows):
+            return
+        if not (0 <= goal_x < self.cols and 0 <= goal_y < self.rows):
+            return
+
+        source = (start_y + 1) * self.stride + start_x + 1
+        target = (goal_y + 1) * self.stride + goal_x + 1
+        if source == target or self._walls[target]:
+            return
+
+        if self._walls[source]:
+            # старт в стене (игрок в опасной зоне): первый шаг к лучшему соседу
+            candidates = [
+                self._abstract_path(source + offset, target)
+                for offset in self._offsets if not self._walls[source + offset]
+            ]
+            _, abstract = min(
+                [candidate for candidate in candidates if candidate[1]],
+                default=(0, [])
+            )
+            if abstract:
+                abstract.insert(0, source)
+        else:
+            _, abstract = self._abstract_path(source, target)
+
+        for current, following in zip(abstract, abstract[1:]):
+            yield from self._refine(current, following)
+
+    def update_cell(self, grid: MazeGrid, cell_x: int, cell_y: int) -> None:
+        """Перестраивает абстракцию кластера после изменения клетки.
+
+        Args:
+            grid: Сетка лабиринта, для которой создан планировщик
+            cell_x: X-координата измененной клетки
+            cell_y: Y-координата измененной клетки
+        """
+        self.rebuild_cluster(
+            grid,
+            cell_x // self.cluster_size,
+            cell_y // self.cluster_size
+        )
+
+    def rebuild_cluster(self, grid: MazeGrid, cluster_x: int, cluster_y: int) -> None:
+        """Перестраивает абстракцию одного кластера.
+
+        Перечитываются стены кластера, входы на его четырех границах
+        и расстояния внутри него. У соседних кластеров пересчитываются
+        только ребра новых узлов на общей границе.
+
+        Args:
+            grid: Сетка лабиринта, для которой создан планировщик
+            cluster_x: Номер кластера по горизонтали
+            cluster_y: Номер кластера по вертикали
+        """
+        size = self.cluster_size
+        cluster = cluster_y * self.cluster_cols + cluster_x
+        self._read_walls(
+            grid,
+            cluster_x * size,
+            cluster_y * size,
+            min((cluster_x + 1) * size, self.cols),
+            min((cluster_y + 1) * size, self.rows)
+        )
+
+        neighbors = self._adjacent_clusters(cluster)
+        for other in neighbors:
+            self._build_border(min(cluster, other), max(cluster, other))
+        self._connect_cluster(cluster)
+
+        # узлы соседа на общей границе пересоздаются вместе с входами
+        for other in neighbors:
+            border = self._transitions.get((min(cluster, other), max(cluster, other)), [])
+            for pair in border:
+                for node in pair:
+                    if self._cluster_id[node] == other:
+                        self._connect_node(node, other)
+
+    def _read_walls(self, grid: MazeGrid, x0: int, y0: int, x1: int, y1: int) -> None:
+        """Копирует непроходимость клеток прямоугольника из сетки.
+
+        Args:
+            grid: Сетка лабиринта
+            x0: Левая колонка
+            y0: Верхняя строка
+            x1: Колонка за правой границей
+            y1: Строка за нижней границей
+        """
+        blocked = MazeGrid.WALL | MazeGrid.OUTSIDE
+        if x0 == 0 and y0 == 0 and x1 == self.cols and y1 == self.rows:
+            self._wall_view[:] = (grid.cells & blocked) != 0
+        else:
+            region = grid.cells[y0 + 1:y1 + 1, x0 + 1:x1 + 1]
+            self._wall_view[y0 + 1:y1 + 1, x0 + 1:x1 + 1] = (region & blocked) != 0
+
+    def _next_clusters(self, cluster: int) -> List[int]:
+        """Возвращает соседей кластера справа и снизу.
+
+        Args:
+            cluster: Номер кластера
+
+        Returns:
+            List[int]: Номера соседних кластеров
+        """
+        result = []
+        if cluster % self.cluster_cols + 1 < self.cluster_cols:
+            result.append(cluster + 1)
+        if cluster + self.cluster_cols < len(self._cluster_nodes):
+            result.append(cluster + self.cluster_cols)
+        return result
+
+    def _adjacent_clusters(self, cluster: int) -> List[int]:
+        """Возвращает всех соседей кластера по сторонам.
+
+        Args:
+            cluster: Номер кластера
+
+        Returns:
+            List[int]: Номера соседних кластеров
+        """
+        result = self._next_clusters(cluster)
+        if cluster % self.cluster_cols > 0:
+            result.append(cluster - 1)
+        if cluster >= self.cluster_cols:
+            result.append(cluster - self.cluster_cols)
+        return result
+
+    def _build_border(self, first: int, second: int) -> None:
+        """Заново находит входы на границе двух соседних кластеров.
+
+        Args:
+            first: Номер левого или верхнего кластера
+            second: Номер правого или нижнего кластера
+        """
+        for pair in self._transitions.pop((first, second), []):
+            self._remove_transition(*pair)
+
+        size = self.cluster_size
+        walls = self._walls
+        cluster_x = first % self.cluster_cols
+        cluster_y = first // self.cluster_cols
+
+        # пары клеток по обе стороны границы: соседи в одной строке кластеров
+        # разделены вертикальной границей (при одной колонке кластеров
+        # номер нижнего соседа тоже равен first + 1)
+        if second // self.cluster_cols == cluster_y:
+            x = (cluster_x + 1) * size - 1
+            rows = range(cluster_y * size, min((cluster_y + 1) * size, self.rows))
+            inner = [(y + 1) * self.stride + x + 1 for y in rows]
+            step = 1
+        else:
+            y = (cluster_y + 1) * size - 1
+            columns = range(cluster_x * size, min((cluster_x + 1) * size, self.cols))
+            inner = [(y + 1) * self.stride + x + 1 for x in columns]
+            step = self.stride
+
+        # непрерывные отрезки проходимых пар образуют входы
+        transitions = []
+        run: List[int] = []
+        for node in inner + [-1]:
+            if node >= 0 and not walls[node] and not walls[node + step]:
+                run.append(node)
+                continue
+            if run:
+                if len(run) < self.LONG_ENTRANCE:
+                    chosen = [run[len(run) // 2]]
+                else:
+                    chosen = [run[0], run[-1]]
+                transitions.extend((node_a, node_a + step) for node_a in chosen)
+                run = []
+
+        for pair in transitions:
+            self._add_transition(*pair)
+        if transitions:
+            self._transitions[(first, second)] = transitions
+
+    def _add_transition(self, first: int, second: int) -> None:
+        """Добавляет переход между клетками соседних кластеров.
+
+        Args:
+            first: Индекс клетки первого кластера
+            second: Индекс клетки второго кластера
+        """
+        for node in (first, second):
+            if node not in self._edges:
+                self._edges[node] = {}
+                self._cluster_nodes[self._cluster_id[node]].add(node)
+            self._node_refs[node] = self._node_refs.get(node, 0) + 1
+        self._edges[first][second] = 1
+        self._edges[second][first] = 1
+
+    def _remove_transition(self, first: int, second: int) -> None:
+        """Удаляет переход и узлы, на которые больше не ссылается ни один вход.
+
+        Args:
+            first: Индекс клетки первого кластера
+            second: Индекс клетки второго кластера
+        """
+        edges = self._edges
+        edges[first].pop(second, None)
+        edges[second].pop(first, None)
+        for node in (first, second):
+            self._node_refs[node] -= 1
+            if self._node_refs[node]:
+                continue
+            del self._node_refs[node]
+            for neighbor in edges.pop(node):
+                edges[neighbor].pop(node, None)
+            self._cluster_nodes[self._cluster_id[node]].discard(node)
+
+    def _connect_cluster(self, cluster: int) -> None:
+        """Пересчитывает ребра между узлами внутри кластера.
+
+        Args:
+            cluster: Номер кластера
+        """
+        edges = self._edges
+        nodes = self._cluster_nodes[cluster]
+        for node in nodes:
+            for other in [n for n in edges[node] if n in nodes]:
+                del edges[node][other]
+        for node in nodes:
+            self._connect_node(node, cluster)
+
+    def _connect_node(self, node: int, cluster: int) -> None:
+        """Соединяет узел с достижимыми узлами своего кластера.
+
+        Args:
+            node: Индекс узла
+            cluster: Номер кластера узла
+        """
+        distances, _ = self._cluster_search(node, cluster)
+        edges = self._edges
+        for other in self._cluster_nodes[cluster]:
+            if other != node and other in distances:
+                edges[node][other] = distances[other]
+                edges[other][node] = distances[other]
+
+    def _cluster_search(
+        self,
+        source: int,
+        cluster: int,
+        goal: int = -1
+    ) -> Tuple[Dict[int, int], Dict[int, int]]:
+        """Выполняет обход в ширину, не выходящий за пределы кластера.
+
+        Начальная клетка может быть стеной (игрок в опасной зоне).
+
+        Args:
+            source: Индекс начальной клетки
+            cluster: Номер кластера
+            goal: Индекс клетки, на которой обход останавливается (по умолчанию
+                  обходится весь кластер)
+
+        Returns:
+            Tuple:
+                - Расстояния до достижимых клеток кластера
+                - Родители клеток в дереве обхода
+        """
+        walls, cluster_id = self._walls, self._cluster_id
+        offsets = self._offsets
+        distances = {source: 0}
+        parents = {source: -1}
+        queue = deque([source])
+
+        while queue:
+            current = queue.popleft()
+            next_distance = distances[current] + 1
+            for offset in offsets:
+                neighbor = current + offset
+                if (neighbor not in distances and not walls[neighbor]
+                        and cluster_id[neighbor] == cluster):
+                    distances[neighbor] = next_distance
+                    parents[neighbor] = current
+                    if neighbor == goal:
+                        return distances, parents
+                    queue.append(neighbor)
+        return distances, parents
+
+    def _abstract_path(self, source: int, target: int) -> Tuple[int, List[int]]:
+        """Ищет путь A* по абстрактному графу с временными узлами старта и цели.
+
+        Args:
+            source: Индекс проходимой начальной клетки
+            target: Индекс проходимой целевой клетки
+
+        Returns:
+            Tuple:
+                - Длина пути в клетках
+                - Индексы узлов пути от старта до цели или пустой список
+        """
+        if source == target:
+            return 0, [target]
+
+        # временные ребра старта и цели к узлам своих кластеров
+        source_cluster = self._cluster_id[source]
+        target_cluster = self._cluster_id[target]
+        reached, _ = self._cluster_search(source, source_cluster)
+        source_links = {
+            node: reached[node]
+            for node in self._cluster_nodes[source_cluster] if node in reached
+        }
+        if target in reached:
+            source_links[target] = reached[target]
+        reached, _ = self._cluster_search(target, target_cluster)
+        target_links = {
+            node: reached[node]
+            for node in self._cluster_nodes[target_cluster] if node in reached
+        }
+
+        xs, ys = self._xs, self._ys
+        goal_x, goal_y = xs[target], ys[target]
+        edges = self._edges
+        empty: Dict[int, int] = {}
+        g_score = {source: 0}
+        parent = {source: -1}
+        closed: Set[int] = set()
+        # при равных f первым раскрывается узел с большей g-оценкой
+        open_set = [(abs(xs[source] - goal_x) + abs(ys[source] - goal_y), 0, source)]
+
+        while open_set:
+            _, current_g, current = heapq.heappop(open_set)
+            current_g = -current_g
+            if current == target:
+                path = []
+                while current >= 0:
+                    path.append(current)
+                    current = parent[current]
+                path.reverse()
+                return current_g, path
+            if current in closed:
+                continue
+            closed.add(current)
+
+            links = list(edges.get(current, empty).items())
+            if current == source:
+                links.extend(source_links.items())
+            if current in target_links:
+                links.append((target, target_links[current]))
+
+            for neighbor, cost in links:
+                tentative_g_score = current_g + cost
+                if neighbor == current or tentative_g_score >= g_score.get(neighbor, tentative_g_score + 1):
+                    continue
+                g_score[neighbor] = tentative_g_score
+                parent[neighbor] = current
+                f_score = tentative_g_score + abs(xs[neighbor] - goal_x) + abs(ys[neighbor] - goal_y)
+                heapq.heappush(open_set, (f_score, -tentative_g_score, neighbor))
+        return 0, []
+
+    def _refine(self, current: int, following: int) -> Iterator[Tuple[int, int]]:
+        """Восстанавливает клетки одного отрезка абстрактного пути.
+
+        Args:
+            current: Индекс начального узла отрезка
+            following: Индекс конечного узла отрезка
+
+        Yields:
+            Tuple[int, int]: Клетки отрезка без начальной, включая конечную
+        """
+        xs, ys = self._xs, self._ys
+        cluster = self._cluster_id[current]
+
+        # переход между кластерами - соседние клетки
+        if cluster != self._cluster_id[following]:
+            yield (xs[following], ys[following])
+            return
+
+        _, parents = self._cluster_search(current, cluster, following)
+        segment = []
+        node = following
+        while node != current:
+            segment.append((xs[node], ys[node]))
+            node = parents[node]
+        yield from reversed(segment)
@@ -0,0 +1,24 @@
+"""Кадр пользовательского ввода.
+
+Этот модуль содержит класс InputFrame, в котором модель получает ввод
+за один шаг симуляции независимо от источника (клавиатура, бот, тест).
+"""
+
+from typing import NamedTuple, Tuple
+
+
+class InputFrame(NamedTuple):
+    """Ввод за один шаг симуляции.
+
+    Attributes:
+        move_x (int): Направление движения по X (-1, 0, 1)
+        move_y (int): Направление движения по Y (-1, 0, 1)
+        aim (Tuple[float, float]): Точка прицеливания сканеров (x, y)
+        locator (bool): Локатор включен (удержание ЛКМ)
+        detector (bool): Запуск детектора на этом шаге (нажатие ПКМ)
+    """
+    move_x: int = 0
+    move_y: int = 0
+    aim: Tuple[float, float] = (0.0, 0.0)
+    locator: bool = False
+    detector: bool = False
@@ -0,0 +1,296 @@
+"""Архив заранее сгенерированных лабиринтов.
+
+Этот модуль содержит двоичный формат набора уровней (level pack):
+- LevelPackWriter: потоковая запись лабиринтов в файл
+- LevelPack: чтение лабиринтов через mmap без разбора всего файла
+
+Формат файла (little-endian):
+    заголовок  magic "SMLP", версия u16, резерв u16, количество u32,
+               смещение индекса u64
+    записи     для каждого лабиринта: cols u16, rows u16, cell_size u16,
+               резерв u16, exit_x u16, exit_y u16 (0xFFFF, если выхода нет)
+               и битовые плоскости
+               флагов WALL, THIN_WALL, DANGER, EXIT, START
+               (по ceil(cols * rows / 8) байт на плоскость)
+    индекс     для каждого лабиринта: смещение записи u64, зерно i64
+               (-1, если зерно неизвестно, поэтому зерна неотрицательны)
+
+Наборы генерирует generate_levels.py в корне проекта. Просмотр набора:
+    python -m src.model.level_pack levels.pack
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import numpy as np
+from typing import BinaryIO, Dict, List, Optional, Tuple
+from src.model.maze_grid import MazeGrid
+
+
+MAGIC: bytes = b'SMLP'
+VERSION: int = 2
+HEADER = struct.Struct('<4sHHIQ')
+RECORD_HEADER = struct.Struct('<HHHHHH')
+
+# координата выхода в записи лабиринта без выхода
+NO_EXIT: int = 0xFFFF
+INDEX_DTYPE = np.dtype([('offset', '<u8'), ('seed', '<i8')])
+
+# флаги, сохраняемые битовыми плоскостями (в порядке записи)
+PLANE_FLAGS: Tuple[int, ...] = (
+    MazeGrid.WALL,
+    MazeGrid.THIN_WALL,
+    MazeGrid.DANGER,
+    MazeGrid.EXIT,
+    MazeGrid.START
+)
+
+
+def encode_record(grid: MazeGrid) -> bytes:
+    """Кодирует лабиринт в запись набора уровней.
+
+    Args:
+        grid: Сетка лабиринта
+
+    Returns:
+        bytes: Заголовок записи и битовые плоскости флагов
+
+    Raises:
+        ValueError: Если размеры лабиринта не помещаются в поля u16 записи
+    """
+    # значение NO_EXIT зарезервировано, поэтому координаты выхода меньше него
+    if not (0 < grid.cols < NO_EXIT and 0 < grid.rows < NO_EXIT and 0 < grid.cell_size <= 0xFFFF):
+        raise ValueError(
+            f"maze {grid.cols}x{grid.rows} with cell size {grid.cell_size} "
+            "does not fit a level pack record"
+        )
+    exit_x, exit_y = grid.exit_pos if grid.exit_pos is not None else (NO_EXIT, NO_EXIT)
+    parts = [RECORD_HEADER.pack(grid.cols, grid.rows, grid.cell_size, 0, exit_x, exit_y)]
+    for flag in PLANE_FLAGS:
+        parts.append(np.packbits((grid.flags & flag) != 0).tobytes())
+    return b''.join(parts)
+
+
+class LevelPackWriter:
+    """Потоковая запись лабиринтов в набор уровней.
+
+    Записи пишутся в файл сразу при добавлении, в памяти остается только
+    индекс смещений. Индекс и итоговый заголовок записываются при закрытии.
+
+    Attributes:
+        path (str): Путь к файлу набора
+        count (int): Количество записанных лабиринтов
+    """
+
+    def __init__(self, path: str) -> None:
+        """Создает файл набора и резервирует место под заголовок.
+
+        Args:
+            path: Путь к файлу набора
+        """
+        self.path = path
+        self.count = 0
+        self._file: BinaryIO = open(path, 'wb')
+        self._index: List[Tuple[int, int]] = []
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0, 0, 0))
+
+    def add(self, grid: MazeGrid) -> int:
+        """Добавляет лабиринт в набор.
+
+        Args:
+            grid: Сетка лабиринта
+
+        Returns:
+            int: Индекс лабиринта в наборе
+
+        Raises:
+            ValueError: Если лабиринт или его зерно не помещаются в набор
+        """
+        return self.add_record(encode_record(grid), grid.seed)
+
+    def add_record(self, record: bytes, seed: Optional[int]) -> int:
+        """Добавляет в набор уже закодированную запись лабиринта.
+
+        Args:
+            record: Запись, полученная из encode_record
+            seed: Зерно лабиринта (None, если неизвестно)
+
+        Returns:
+            int: Индекс лабиринта в наборе
+
+        Raises:
+            ValueError: Если зерно отрицательное или не помещается в i64
+        """
+        # -1 в индексе означает отсутствие зерна
+        if seed is not None and not 0 <= seed < 2 ** 63:
+            raise ValueError(f"seed {seed} cannot be stored in a level pack")
+        offset = self._file.tell()
+        self._file.write(record)
+        self._index.append((offset, seed if seed is not None else -1))
+        self.count += 1
+        return self.count - 1
+
+    def close(self) -> None:
+        """Записывает индекс и заголовок и закрывает файл."""
+        if self._file.closed:
+            return
+
+        index_offset = self._file.tell()
+        index = np.array(self._index, dtype=INDEX_DTYPE)
+        self._file.write(index.tobytes())
+
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0, self.count, index_offset))
+        self._file.close()
+
+    def __enter__(self) -> "LevelPackWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class LevelPack:
+    """Чтение набора уровней через отображение файла в память.
+
+    Индекс читается как представление NumPy поверх mmap, поэтому открытие
+    набора не зависит от его размера, а загрузка лабиринта по индексу
+    затрагивает только его запись.
+
+    Attributes:
+        path (str): Путь к файлу набора
+        count (int): Количество лабиринтов в наборе
+        index (np.ndarray): Индекс записей (offset, seed)
+    """
+
+    def __init__(self, path: str) -> None:
+        """Открывает набор уровней.
+
+        Args:
+            path: Путь к файлу набора
+
+        Raises:
+            ValueError: Если файл не является набором уровней
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        if os.fstat(self._file.fileno()).st_size < HEADER.size:
+            self._file.close()
+            raise ValueError(f"{path} is not a level pack")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, count, index_offset = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a level pack")
+
+        self.count = count
+        self.index = np.frombuffer(
+            self._mmap,
+            dtype=INDEX_DTYPE,
+            count=count,
+            offset=index_offset
+        )
+        self._seed_lookup: Optional[Dict[int, int]] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def load(self, index: int) -> MazeGrid:
+        """Загружает лабиринт по индексу.
+
+        Args:
+            index: Индекс лабиринта в наборе
+
+        Returns:
+            MazeGrid: Сетка лабиринта
+
+        Raises:
+            IndexError: Если индекс вне набора
+        """
+        if not 0 <= index < self.count:
+            raise IndexError(f"level index {index} out of range")
+
+        offset = int(self.index[index]['offset'])
+        seed = int(self.index[index]['seed'])
+        cols, rows, cell_size, _, exit_x, exit_y = RECORD_HEADER.unpack_from(self._mmap, offset)
+
+        grid = MazeGrid(cols, rows, cell_size)
+        grid.seed = seed if seed >= 0 else None
+        grid.exit_pos = (exit_x, exit_y) if exit_x != NO_EXIT else None
+
+        cells = cols * rows
+        plane_size = (cells + 7) // 8
+        plane_offset = offset + RECORD_HEADER.size
+        flags = np.zeros((rows, cols), dtype=np.uint8)
+        for flag in PLANE_FLAGS:
+            plane = np.frombuffer(self._mmap, dtype=np.uint8, count=plane_size, offset=plane_offset)
+            bits = np.unpackbits(plane, count=cells).reshape(rows, cols)
+            flags |= bits * np.uint8(flag)
+            plane_offset += plane_size
+
+        grid.flags[:] = flags
+        return grid
+
+    def find(self, seed: int) -> Optional[int]:
+        """Ищет индекс лабиринта по зерну.
+
+        Args:
+            seed: Зерно генерации
+
+        Returns:
+            Optional[int]: Индекс лабиринта или None, если его нет в наборе
+        """
+        if self._seed_lookup is None:
+            self._seed_lookup = {
+                int(s): i for i, s in enumerate(self.index['seed'].tolist()) if s >= 0
+            }
+        return self._seed_lookup.get(seed)
+
+    def load_seed(self, seed: int) -> MazeGrid:
+        """Загружает лабиринт по зерну.
+
+        Args:
+            seed: Зерно генерации
+
+        Returns:
+            MazeGrid: Сетка лабиринта
+
+        Raises:
+            KeyError: Если лабиринта с таким зерном нет в наборе
+        """
+        index = self.find(seed)
+        if index is None:
+            raise KeyError(seed)
+        return self.load(index)
+
+    def close(self) -> None:
+        """Закрывает отображение и файл набора."""
+        # представление индекса держит ссылку на буфер mmap
+        self.index = np.empty(0, dtype=INDEX_DTYPE)
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "LevelPack":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def main() -> None:
+    """Точка входа командной строки: печатает сводку по набору уровней."""
+    parser = argparse.ArgumentParser(description="Print a Sombre Maze level pack summary")
+    parser.add_argument('path')
+    args = parser.parse_args()
+
+    with LevelPack(args.path) as pack:
+        print(f"{args.path}: {pack.count} mazes")
+        if pack.count:
+            first = pack.load(0)
+            print(f"first maze: {first.cols}x{first.rows}, seed {first.seed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,10 @@
 """
 
 import random
-from typing import Tuple, List
+import numpy as np
+from typing import Any, Optional
 from src.config import Config
-from src.utils import is_valid_cell
+from src.model.maze_grid import MazeGrid
 
 
 class MazeGenerator:
@@ -17,71 +18,79 @@ class MazeGenerator:
     - Генерацию лабиринта алгоритмом поиска в глубину
     - Размещение стартовой зоны по центру
     - Создание выхода на границах лабиринта
-    - Распределение опасных зон
-    - Определение тонких стен
+    - Распределение опасных зон и тонких стен векторизованным этапом
     """
     
     @staticmethod
-    def generate_maze() -> Tuple[List[List[int]], List[List[int]], List[Tuple[int, int]], int]:
+    def generate_maze(
+        cols: Optional[int] = None, 
+        rows: Optional[int] = None,
+        seed: Optional[int] = None
+    ) -> MazeGrid:
         """Генерирует лабиринт с опасными зонами и выходом.
         
+        Если задан seed, генерация использует собственный экземпляр
+        random.Random и не затрагивает глобальный генератор, поэтому
+        лабиринты можно строить параллельно в разных потоках.
+        
+        Args:
+            cols: Количество колонок (по умолчанию по ширине экрана)
+            rows: Количество строк (по умолчанию по высоте экрана)
+            seed: Зерно генератора случайных чисел (по умолчанию глобальный random)
+        
         Returns:
-            Tuple: 
-                thin_walls: Матрица тонких стен (1 - стена, 0 - проход)
-                maze: Основная матрица лабиринта (0 - проход, 1 - стена, 2 - выход)
-                danger_zones: Список координат опасных зон
-                cell_size: Размер ячейки лабиринта
+            MazeGrid: Сетка лабиринта с флагами стен, тонких стен,
+                      опасных зон, выхода и стартовой зоны
         """
-        cols = Config.WIDTH // Config.CELL_SIZE
-        rows = Config.HEIGHT // Config.CELL_SIZE
-        cell_size = Config.CELL_SIZE
+        if cols is None:
+            cols = Config.WIDTH // Config.CELL_SIZE
+        if rows is None:
+            rows = Config.HEIGHT // Config.CELL_SIZE
         
-        # матрицы лабиринта и тонких стен
-        maze = [[1 for _ in range(cols)] for _ in range(rows)]
-        thin_walls = [[0 for _ in range(cols)] for _ in range(rows)]
+        rng = random.Random(seed) if seed is not None else random
+        
+        # сетка лабиринта, изначально полностью из стен
+        grid = MazeGrid(cols, rows, Config.CELL_SIZE)
+        grid.flags[:] = MazeGrid.WALL
+        grid.seed = seed
         
         # центральная стартовая зона
-        MazeGenerator._create_start_zone(maze, cols, rows)
+        MazeGenerator._create_start_zone(grid)
         
         # генерация лабиринта
-        MazeGenerator._generate_with_dfs(maze, cols, rows)
+        MazeGenerator._generate_with_dfs(grid, rng)
         
         # создание выхода
-        MazeGenerator._create_exit(maze, cols, rows)
-        
-        # создание опасных зон
-        danger_zones = MazeGenerator._create_danger_zones(maze, cols, rows)
+        MazeGenerator._create_exit(grid, rng)
         
-        # создание тонких стен
-        MazeGenerator._create_thin_walls(maze, thin_walls, danger_zones, cols, rows)
+        # создание опасных зон и тонких стен
+        MazeGenerator._create_wall_layers(grid, rng)
         
-        return thin_walls, maze, danger_zones, cell_size
+        return grid
     
     @staticmethod
-    def _create_start_zone(maze: List[List[int]], cols: int, rows: int) -> None:
+    def _create_start_zone(grid: MazeGrid) -> None:
         """Создает стартовую зону в центре лабиринта.
         
         Args:
-            maze: Матрица лабиринта
-            cols: Количество колонок
-            rows: Количество строк
+            grid: Сетка лабиринта
         """
-        center_x, center_y = cols // 2, rows // 2
+        center_x, center_y = grid.cols // 2, grid.rows // 2
         for y in range(center_y - Config.START_ZONE_SIZE, center_y + Config.START_ZONE_SIZE + 1):
             for x in range(center_x - Config.START_ZONE_SIZE, center_x + Config.START_ZONE_SIZE + 1):
-                if is_valid_cell(x, y, maze):
-                    maze[y][x] = 0
+                if grid.contains(x, y):
+                    grid.clear_flag(x, y, MazeGrid.WALL)
+                    grid.set_flag(x, y, MazeGrid.START)
     
     @staticmethod
-    def _generate_with_dfs(maze: List[List[int]], cols: int, rows: int) -> None:
+    def _generate_with_dfs(grid: MazeGrid, rng: Any = random) -> None:
         """Генерирует лабиринт с использованием алгоритма поиска в глубину.
         
         Args:
-            maze: Матрица лабиринта
-            cols: Количество колонок
-            rows: Количество строк
+            grid: Сетка лабиринта
+            rng: Генератор случайных чисел (random.Random или модуль random)
         """
-        center_x, center_y = cols // 2, rows // 2
+        center_x, center_y = grid.cols // 2, grid.rows // 2
         stack = [(center_x, center_y)]
         
         while stack:
@@ -91,97 +100,73 @@ class MazeGenerator:
             # проверяем возможные направления
             for dx, dy in [(-2, 0), (2, 0), (0, -2), (0, 2)]:
                 nx, ny = x + dx, y + dy
-                if is_valid_cell(nx, ny, maze) and maze[ny][nx] == 1:
+                if grid.contains(nx, ny) and grid.is_wall(nx, ny):
                     neighbors.append((nx, ny))
             
             if neighbors:
-                nx, ny = random.choice(neighbors)
-                maze[ny][nx] = 0
-                maze[(ny + y) // 2][(nx + x) // 2] = 0
+                nx, ny = rng.choice(neighbors)
+                grid.clear_flag(nx, ny, MazeGrid.WALL)
+                grid.clear_flag((nx + x) // 2, (ny + y) // 2, MazeGrid.WALL)
                 stack.append((nx, ny))
             else:
                 stack.pop()
     
     @staticmethod
-    def _create_exit(maze: List[List[int]], cols: int, rows: int) -> None:
+    def _create_exit(grid: MazeGrid, rng: Any = random) -> None:
         """Создает выход на одной из границ лабиринта.
         
         Args:
-            maze: Матрица лабиринта
-            cols: Количество колонок
-            rows: Количество строк
+            grid: Сетка лабиринта
+            rng: Генератор случайных чисел (random.Random или модуль random)
         """
-        exit_side = random.randint(0, 3)
+        cols, rows = grid.cols, grid.rows
+        exit_side = rng.randint(0, 3)
         exit_pos = {
-            0: (random.randint(1, cols - 2), 0),         # верхняя граница
-            1: (cols - 1, random.randint(1, rows - 2)),  # правая граница
-            2: (random.randint(1, cols - 2), rows - 1),  # нижняя граница
-            3: (0, random.randint(1, rows - 2))          # левая граница
+            0: (rng.randint(1, cols - 2), 0),         # верхняя граница
+            1: (cols - 1, rng.randint(1, rows - 2)),  # правая граница
+            2: (rng.randint(1, cols - 2), rows - 1),  # нижняя граница
+            3: (0, rng.randint(1, rows - 2))          # левая граница
         }
         exit_x, exit_y = exit_pos[exit_side]
-        if is_valid_cell(exit_x, exit_y, maze):
-            maze[exit_y][exit_x] = 2
+        if grid.contains(exit_x, exit_y):
+            grid.clear_flag(exit_x, exit_y, MazeGrid.WALL)
+            grid.set_flag(exit_x, exit_y, MazeGrid.EXIT)
+            grid.exit_pos = (exit_x, exit_y)
     
     @staticmethod
-    def _create_danger_zones(maze: List[List[int]], cols: int, rows: int) -> List[Tuple[int, int]]:
-        """Создает опасные зоны на границах проходимых областей.
+    def _create_wall_layers(grid: MazeGrid, rng: Any = random) -> None:
+        """Размечает опасные зоны и тонкие стены за один проход по массивам.
+        
+        Пограничные стены находятся сдвигом маски проходов на одну клетку
+        в каждую сторону (рамка сетки делает сдвиги безопасными). Опасные зоны
+        выбираются случайной выборкой из массива индексов пограничных стен
+        (генератор NumPy засевается из rng, поэтому зерно сохраняет
+        воспроизводимость), остальные пограничные стены становятся тонкими.
         
         Args:
-            maze: Матрица лабиринта
-            cols: Количество колонок
-            rows: Количество строк
-            
-        Returns:
-            List[Tuple[int, int]]: Список координат опасных зон
+            grid: Сетка лабиринта
+            rng: Генератор случайных чисел (random.Random или модуль random)
         """
-        wall_cells = [
-            (x, y) for y in range(rows) for x in range(cols)
-            if maze[y][x] == 1 and MazeGenerator._is_border_cell(x, y, maze)
-        ]
-        
-        return random.sample(
-            wall_cells, 
-            int(len(wall_cells) * Config.DANGER_ZONE_RATIO)
+        cells = grid.cells
+        
+        # проходы: клетки без стены, не являющиеся выходом и рамкой
+        corridor = (cells & (MazeGrid.WALL | MazeGrid.EXIT | MazeGrid.OUTSIDE)) == 0
+        border = (
+            corridor[1:-1, :-2] | corridor[1:-1, 2:] |
+            corridor[:-2, 1:-1] | corridor[2:, 1:-1]
         )
-    
-    @staticmethod
-    def _create_thin_walls(
-        maze: List[List[int]], 
-        thin_walls: List[List[int]], 
-        danger_zones: List[Tuple[int, int]], 
-        cols: int, 
-        rows: int
-    ) -> None:
-        """Создает матрицу тонких стен.
+        border_walls = border & ((grid.flags & MazeGrid.WALL) != 0)
         
-        Args:
-            maze: Основная матрица лабиринта
-            thin_walls: Матрица тонких стен
-            danger_zones: Список опасных зон
-            cols: Количество колонок
-            rows: Количество строк
-        """
-        for y in range(rows):
-            for x in range(cols):
-                if maze[y][x] == 1 and (x, y) not in danger_zones:
-                    if MazeGenerator._is_border_cell(x, y, maze):
-                        thin_walls[y][x] = 1
-    
-    @staticmethod
-    def _is_border_cell(x: int, y: int, maze: List[List[int]]) -> bool:
-        """Проверяет, граничит ли клетка с проходимой зоной.
+        # случайная выборка опасных зон среди пограничных стен
+        candidates = np.flatnonzero(border_walls)
+        count = int(len(candidates) * Config.DANGER_ZONE_RATIO)
+        sampler = np.random.default_rng(rng.getrandbits(64))
+        chosen = candidates[sampler.choice(len(candidates), count, replace=False)]
         
-        Args:
-            x: X-координата клетки
-            y: Y-координата клетки
-            maze: Матрица лабиринта
-            
-        Returns:
-            bool: True если клетка граничит с проходом, иначе False
-        """
-        return (
-            (x > 0 and maze[y][x - 1] == 0) or 
-            (x < len(maze[0]) - 1 and maze[y][x + 1] == 0) or
-            (y > 0 and maze[y - 1][x] == 0) or 
-            (y < len(maze) - 1 and maze[y + 1][x] == 0)
-        )
\ No newline at end of file
+        danger = np.zeros(border_walls.size, dtype=bool)
+        danger[chosen] = True
+        danger = danger.reshape(border_walls.shape)
+        thin = border_walls & ~danger
+        
+        grid.flags |= danger.view(np.uint8) * np.uint8(MazeGrid.DANGER)
+        grid.flags |= thin.view(np.uint8) * np.uint8(MazeGrid.THIN_WALL)
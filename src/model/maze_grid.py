@@ -0,0 +1,197 @@
+"""Компактная сетка лабиринта.
+
+Этот модуль содержит класс MazeGrid, который хранит все клетки лабиринта
+в едином непрерывном буфере uint8 с битовыми флагами и рамкой-ограничителем.
+"""
+
+import numpy as np
+from typing import List, Optional, Tuple
+
+
+class MazeGrid:
+    """Сетка лабиринта с битовыми флагами клеток.
+
+    Клетки хранятся построчно в одном bytearray размером (rows + 2) x (cols + 2).
+    Внешний слой клеток помечен флагом OUTSIDE, поэтому обход соседей любой
+    клетки лабиринта не требует проверки границ. Массивы NumPy cells и flags
+    являются представлениями того же буфера без копирования.
+
+    Attributes:
+        cols (int): Количество колонок лабиринта
+        rows (int): Количество строк лабиринта
+        cell_size (int): Размер ячейки лабиринта в пикселях
+        stride (int): Длина строки буфера с учетом рамки
+        buffer (bytearray): Буфер флагов клеток
+        cells (np.ndarray): Представление буфера (rows + 2, cols + 2) с рамкой
+        flags (np.ndarray): Представление клеток лабиринта (rows, cols) без рамки
+        exit_pos (Optional[Tuple[int, int]]): Координаты выхода
+        seed (Optional[int]): Зерно, из которого сгенерирован лабиринт
+    """
+
+    # флаги клеток
+    WALL: int = 0x01
+    THIN_WALL: int = 0x02
+    DANGER: int = 0x04
+    EXIT: int = 0x08
+    START: int = 0x10
+    OUTSIDE: int = 0x20
+
+    def __init__(self, cols: int, rows: int, cell_size: int) -> None:
+        """Создает пустую сетку с рамкой-ограничителем.
+
+        Args:
+            cols: Количество колонок
+            rows: Количество строк
+            cell_size: Размер ячейки в пикселях
+        """
+        self.cols = cols
+        self.rows = rows
+        self.cell_size = cell_size
+        self.stride = cols + 2
+        self.buffer = bytearray(self.stride * (rows + 2))
+        self.cells = np.frombuffer(self.buffer, dtype=np.uint8).reshape(rows + 2, cols + 2)
+        self.flags = self.cells[1:-1, 1:-1]
+        self.exit_pos: Optional[Tuple[int, int]] = None
+        self.seed: Optional[int] = None
+
+        # рамка из клеток за пределами лабиринта
+        self.cells[0, :] = MazeGrid.OUTSIDE
+        self.cells[-1, :] = MazeGrid.OUTSIDE
+        self.cells[:, 0] = MazeGrid.OUTSIDE
+        self.cells[:, -1] = MazeGrid.OUTSIDE
+
+    def index(self, cell_x: int, cell_y: int) -> int:
+        """Возвращает индекс клетки в буфере.
+
+        Args:
+            cell_x: X-координата клетки (от -1 до cols включительно)
+            cell_y: Y-координата клетки (от -1 до rows включительно)
+
+        Returns:
+            int: Индекс клетки в buffer
+        """
+        return (cell_y + 1) * self.stride + cell_x + 1
+
+    def position(self, index: int) -> Tuple[int, int]:
+        """Возвращает координаты клетки по индексу в буфере.
+
+        Args:
+            index: Индекс клетки в buffer
+
+        Returns:
+            Tuple[int, int]: Координаты клетки (cell_x, cell_y)
+        """
+        row, col = divmod(index, self.stride)
+        return col - 1, row - 1
+
+    def contains(self, cell_x: int, cell_y: int) -> bool:
+        """Проверяет, находится ли клетка в пределах лабиринта.
+
+        Args:
+            cell_x: X-координата клетки
+            cell_y: Y-координата клетки
+
+        Returns:
+            bool: True если клетка валидна, иначе False
+        """
+        return 0 <= cell_x < self.cols and 0 <= cell_y < self.rows
+
+    def at(self, cell_x: int, cell_y: int) -> int:
+        """Возвращает флаги клетки.
+
+        Args:
+            cell_x: X-координата клетки
+            cell_y: Y-координата клетки
+
+        Returns:
+            int: Флаги клетки или OUTSIDE для клеток за пределами лабиринта
+        """
+        if -1 <= cell_x <= self.cols and -1 <= cell_y <= self.rows:
+            return self.buffer[(cell_y + 1) * self.stride + cell_x + 1]
+        return MazeGrid.OUTSIDE
+
+    def set_flag(self, cell_x: int, cell_y: int, flag: int) -> None:
+        """Устанавливает флаг клетки лабиринта.
+
+        Args:
+            cell_x: X-координата клетки
+            cell_y: Y-координата клетки
+            flag: Устанавливаемый флаг
+        """
+        self.buffer[self.index(cell_x, cell_y)] |= flag
+
+    def clear_flag(self, cell_x: int, cell_y: int, flag: int) -> None:
+        """Сбрасывает флаг клетки лабиринта.
+
+        Args:
+            cell_x: X-координата клетки
+            cell_y: Y-координата клетки
+            flag: Сбрасываемый флаг
+        """
+        self.buffer[self.index(cell_x, cell_y)] &= ~flag & 0xFF
+
+    def is_wall(self, cell_x: int, cell_y: int) -> bool:
+        """Проверяет, является ли клетка стеной лабиринта.
+
+        Args:
+            cell_x: X-координата клетки
+            cell_y: Y-координата клетки
+
+        Returns:
+            bool: True если клетка является стеной, иначе False
+        """
+        return bool(self.at(cell_x, cell_y) & MazeGrid.WALL)
+
+    def is_thin_wall(self, cell_x: int, cell_y: int) -> bool:
+        """Проверяет, является ли клетка тонкой стеной.
+
+        Args:
+            cell_x: X-координата клетки
+            cell_y: Y-координата клетки
+
+        Returns:
+            bool: True если клетка является тонкой стеной, иначе False
+        """
+        return bool(self.at(cell_x, cell_y) & MazeGrid.THIN_WALL)
+
+    def is_danger(self, cell_x: int, cell_y: int) -> bool:
+        """Проверяет, является ли клетка опасной зоной.
+
+        Args:
+            cell_x: X-координата клетки
+            cell_y: Y-координата клетки
+
+        Returns:
+            bool: True если клетка опасна, иначе False
+        """
+        return bool(self.at(cell_x, cell_y) & MazeGrid.DANGER)
+
+    def is_exit(self, cell_x: int, cell_y: int) -> bool:
+        """Проверяет, является ли клетка выходом.
+
+        Args:
+            cell_x: X-координата клетки
+            cell_y: Y-координата клетки
+
+        Returns:
+            bool: True если клетка является выходом, иначе False
+        """
+        return bool(self.at(cell_x, cell_y) & MazeGrid.EXIT)
+
+    def is_passable(self, cell_x: int, cell_y: int) -> bool:
+        """Проверяет, можно ли проложить путь через клетку.
+
+        Args:
+            cell_x: X-координата клетки
+            cell_y: Y-координата клетки
+
+        Returns:
+            bool: True если клетка лежит в лабиринте и не является стеной
+        """
+        return not self.at(cell_x, cell_y) & (MazeGrid.WALL | MazeGrid.OUTSIDE)
+
+    @property
+    def danger_zones(self) -> List[Tuple[int, int]]:
+        """Список координат опасных зон (x, y)."""
+        ys, xs = np.nonzero(self.flags & MazeGrid.DANGER)
+        return list(zip(xs.tolist(), ys.tolist()))
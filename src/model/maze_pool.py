@@ -0,0 +1,109 @@
+"""Фоновая подготовка лабиринтов.
+
+Этот модуль содержит класс MazePool, который заранее генерирует лабиринты
+в фоновом потоке, чтобы рестарт игры не тратил кадр на генерацию.
+"""
+
+import queue
+import random
+import threading
+from typing import Optional
+from src.config import Config
+from src.model.hierarchical_path_finder import HierarchicalPathFinder
+from src.model.maze import MazeGenerator
+from src.model.maze_grid import MazeGrid
+
+
+class MazePool:
+    """Ограниченная очередь готовых лабиринтов с фоновым пополнением.
+
+    Каждый лабиринт генерируется собственным экземпляром random.Random
+    с зерном, которое выдает главный генератор пула. Глобальный random
+    не используется, а любой выданный лабиринт воспроизводится по grid.seed.
+
+    Attributes:
+        size (int): Максимальное количество готовых лабиринтов в очереди
+        cols (Optional[int]): Количество колонок генерируемых лабиринтов
+        rows (Optional[int]): Количество строк генерируемых лабиринтов
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        seed: Optional[int] = None,
+        cols: Optional[int] = None,
+        rows: Optional[int] = None
+    ) -> None:
+        """Создает пул и запускает фоновый поток генерации.
+
+        Args:
+            size: Максимальное количество готовых лабиринтов
+            seed: Зерно главного генератора (по умолчанию случайное)
+            cols: Количество колонок (по умолчанию по ширине экрана)
+            rows: Количество строк (по умолчанию по высоте экрана)
+        """
+        self.size = size
+        self.cols = cols
+        self.rows = rows
+        self._seeds = random.Random(seed)
+        self._seeds_lock = threading.Lock()
+        self._ready: "queue.Queue[MazeGrid]" = queue.Queue(maxsize=size)
+        self._stopped = threading.Event()
+        self._worker = threading.Thread(
+            target=self._fill,
+            name="maze-pool",
+            daemon=True
+        )
+        self._worker.start()
+
+    def get(self) -> MazeGrid:
+        """Возвращает готовый лабиринт.
+
+        Если очередь пуста, лабиринт генерируется синхронно.
+
+        Returns:
+            MazeGrid: Сгенерированный лабиринт
+        """
+        try:
+            return self._ready.get_nowait()
+        except queue.Empty:
+            return self._generate()
+
+    def close(self) -> None:
+        """Останавливает фоновый поток генерации."""
+        self._stopped.set()
+        self._worker.join(timeout=1.0)
+
+    def _next_seed(self) -> int:
+        """Выдает зерно для следующего лабиринта.
+
+        Returns:
+            int: Зерно генерации
+        """
+        with self._seeds_lock:
+            return self._seeds.getrandbits(63)
+
+    def _generate(self) -> MazeGrid:
+        """Генерирует лабиринт с очередным зерном.
+
+        Для больших лабиринтов здесь же строится абстрактный граф
+        иерархического поиска пути, чтобы не тратить на него кадр в игре.
+
+        Returns:
+            MazeGrid: Сгенерированный лабиринт
+        """
+        grid = MazeGenerator.generate_maze(self.cols, self.rows, self._next_seed())
+        if grid.cols * grid.rows >= Config.HIERARCHICAL_PATH_MIN_CELLS:
+            HierarchicalPathFinder.planner(grid)
+        return grid
+
+    def _fill(self) -> None:
+        """Пополняет очередь, пока пул не остановлен."""
+        while not self._stopped.is_set():
+            grid = self._generate()
+            while not self._stopped.is_set():
+                try:
+                    self._ready.put(grid, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
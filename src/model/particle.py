@@ -1,94 +1,212 @@
-"""Класс для визуальных частиц (эффектов).
+"""Система визуальных частиц (эффектов).
 
-Этот модуль содержит класс Particle, который реализует поведение
-и отрисовку визуальных частиц для игровых эффектов.
+Этот модуль содержит класс ParticleSystem, который хранит все частицы
+в столбцах NumPy (структура массивов) и обновляет их одним векторным шагом.
 """
 
-from pygame import gfxdraw
-from typing import Tuple, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 from src.config import Config
-import pygame
+import numpy as np
 
 
-class Particle:
-    """Класс для представления визуальных частиц.
-    
+class ParticleSystem:
+    """Пул частиц в заранее выделенных столбцах NumPy.
+
     Частицы используются для создания различных визуальных эффектов:
     - Следы от сканирования
     - Эффекты столкновений
     - Анимации победы/поражения
-    
+
+    Живые частицы всегда занимают первые count строк столбцов. После
+    обновления мертвые частицы удаляются маской со сдвигом живых к началу,
+    поэтому свободные строки - это непрерывный хвост столбцов, из которого
+    излучатели берут место без создания объектов. При нехватке места
+    столбцы увеличиваются вдвое.
+
     Attributes:
-        x (float): X-координата центра частицы
-        y (float): Y-координата центра частицы
-        color (Tuple[int, int, int]): Базовый цвет частицы (RGB)
-        radius (float): Начальный радиус частицы
-        lifetime (float): Полное время жизни частицы в секундах
-        age (float): Текущий возраст частицы в секундах
-        velocity (List[float]): Вектор скорости частицы [vx, vy]
+        capacity (int): Количество выделенных строк
+        count (int): Количество живых частиц
+        x (np.ndarray): X-координаты центров частиц
+        y (np.ndarray): Y-координаты центров частиц
+        vx (np.ndarray): X-составляющие скорости
+        vy (np.ndarray): Y-составляющие скорости
+        age (np.ndarray): Возраст частиц в секундах
+        lifetime (np.ndarray): Полное время жизни в секундах
+        radius (np.ndarray): Радиусы частиц
+        color_index (np.ndarray): Индексы цветов в палитре
+        palette (List[Tuple[int, int, int]]): Палитра цветов частиц (RGB)
     """
-    
-    def __init__(
-        self, 
-        x: float, 
-        y: float, 
-        color: Tuple[int, int, int], 
-        radius: float, 
-        lifetime: float, 
-        velocity: Optional[List[float]] = None
+
+    # столбцы пула и их типы
+    COLUMNS: Dict[str, type] = {
+        'x': np.float32,
+        'y': np.float32,
+        'vx': np.float32,
+        'vy': np.float32,
+        'age': np.float32,
+        'lifetime': np.float32,
+        'radius': np.float32,
+        'color_index': np.uint8
+    }
+
+    def __init__(self, capacity: int = Config.PARTICLE_CAPACITY) -> None:
+        """Выделяет столбцы пула.
+
+        Args:
+            capacity: Начальное количество строк
+        """
+        self.capacity = capacity
+        self.count = 0
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        self.palette: List[Tuple[int, int, int]] = []
+        self._palette_index: Dict[Tuple[int, int, int], int] = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def emit(
+        self,
+        x: float,
+        y: float,
+        color: Tuple[int, int, int],
+        radius: float,
+        lifetime: float,
+        vx: float = 0.0,
+        vy: float = 0.0
     ) -> None:
-        """Инициализирует частицу с заданными параметрами.
-        
+        """Добавляет одну частицу.
+
         Args:
             x: Начальная X-координата
             y: Начальная Y-координата
             color: Базовый цвет (RGB)
-            radius: Начальный радиус
+            radius: Радиус
             lifetime: Время жизни в секундах
-            velocity: Начальная скорость [vx, vy] (по умолчанию [0, 0])
+            vx: Начальная X-составляющая скорости
+            vy: Начальная Y-составляющая скорости
         """
-        self.x = x
-        self.y = y
-        self.color = color
-        self.radius = radius
-        self.lifetime = lifetime
-        self.age = 0.0
-        self.velocity = velocity or [0.0, 0.0]
-        
-    def update(self, dt: float) -> bool:
-        """Обновляет состояние частицы.
-        
+        row = self._allocate(1)
+        self.x[row] = x
+        self.y[row] = y
+        self.vx[row] = vx
+        self.vy[row] = vy
+        self.age[row] = 0.0
+        self.lifetime[row] = lifetime
+        self.radius[row] = radius
+        self.color_index[row] = self._color(color)
+
+    def emit_many(
+        self,
+        positions: np.ndarray,
+        color: Tuple[int, int, int],
+        radius: Union[float, np.ndarray],
+        lifetime: float,
+        velocities: Optional[np.ndarray] = None
+    ) -> None:
+        """Добавляет пачку частиц одного цвета.
+
+        Args:
+            positions: Массив (N, 2) начальных координат
+            color: Базовый цвет (RGB)
+            radius: Радиус, общий или массив (N,) для каждой частицы
+            lifetime: Время жизни в секундах
+            velocities: Массив (N, 2) скоростей (по умолчанию нулевые)
+        """
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 2)
+        amount = len(positions)
+        if not amount:
+            return
+
+        start = self._allocate(amount)
+        rows = slice(start, start + amount)
+        self.x[rows] = positions[:, 0]
+        self.y[rows] = positions[:, 1]
+        if velocities is None:
+            self.vx[rows] = 0.0
+            self.vy[rows] = 0.0
+        else:
+            velocities = np.asarray(velocities, dtype=np.float32).reshape(-1, 2)
+            self.vx[rows] = velocities[:, 0]
+            self.vy[rows] = velocities[:, 1]
+        self.age[rows] = 0.0
+        self.lifetime[rows] = lifetime
+        self.radius[rows] = radius
+        self.color_index[rows] = self._color(color)
+
+    def update(self, dt: float) -> None:
+        """Обновляет все частицы одним векторным шагом и удаляет мертвые.
+
         Args:
             dt: Время, прошедшее с предыдущего обновления (в секундах)
-            
+        """
+        count = self.count
+        if not count:
+            return
+
+        step = dt * Config.PARTICLE_SPEED_FACTOR
+        self.age[:count] += dt
+        self.x[:count] += self.vx[:count] * step
+        self.y[:count] += self.vy[:count] * step
+
+        alive = self.age[:count] < self.lifetime[:count]
+        survivors = int(np.count_nonzero(alive))
+        if survivors == count:
+            return
+
+        # сжатие: живые частицы сдвигаются к началу столбцов
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            column[:survivors] = column[:count][alive]
+        self.count = survivors
+
+    def clear(self) -> None:
+        """Удаляет все частицы."""
+        self.count = 0
+
+    def _allocate(self, amount: int) -> int:
+        """Занимает строки из свободного хвоста столбцов.
+
+        Args:
+            amount: Количество строк
+
         Returns:
-            bool: True если частица еще "жива", False если время истекло
+            int: Индекс первой занятой строки
         """
-        self.age += dt
-        
-        # обновление позиции на основе скорости
-        self.x += self.velocity[0] * dt * Config.PARTICLE_SPEED_FACTOR
-        self.y += self.velocity[1] * dt * Config.PARTICLE_SPEED_FACTOR
-        
-        # проверка времени жизни
-        return self.age < self.lifetime
-        
-    def draw(self, surface: pygame.Surface) -> None:
-        """Отрисовывает частицу на указанной поверхности.
-        
+        start = self.count
+        if start + amount > self.capacity:
+            self._grow(start + amount)
+        self.count += amount
+        return start
+
+    def _grow(self, required: int) -> None:
+        """Увеличивает столбцы вдвое, пока в них не поместится required строк.
+
         Args:
-            surface: Поверхность Pygame для отрисовки
+            required: Необходимое количество строк
+        """
+        capacity = max(self.capacity, 1)
+        while capacity < required:
+            capacity *= 2
+        for name, dtype in self.COLUMNS.items():
+            column = np.zeros(capacity, dtype=dtype)
+            column[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, column)
+        self.capacity = capacity
+
+    def _color(self, color: Tuple[int, int, int]) -> int:
+        """Возвращает индекс цвета в палитре, добавляя новый цвет.
+
+        Args:
+            color: Цвет (RGB)
+
+        Returns:
+            int: Индекс цвета
         """
-        # рассчитываем прозрачность на основе оставшегося времени жизни
-        alpha = int(255 * (1 - self.age / self.lifetime))
-        
-        particle_color = (*self.color, alpha)
-        
-        # отрисовываем частицу как заполненный круг
-        gfxdraw.filled_circle(
-            surface, 
-            int(self.x), 
-            int(self.y), 
-            int(self.radius), 
-            particle_color
-        )
\ No newline at end of file
+        color = tuple(color)
+        index = self._palette_index.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self._palette_index[color] = index
+        return index
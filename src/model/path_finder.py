@@ -1,86 +1,305 @@
 """Модуль для поиска пути с использованием алгоритма A*.
 
 Этот модуль содержит класс PathFinder, который реализует алгоритм A*
-для поиска кратчайшего пути от начальной точки до выхода в лабиринте.
+для поиска кратчайшего пути от начальной точки до выхода в лабиринте,
+и движок GridAStar, который выполняет поиск на плоских индексах клеток.
 """
 
 import heapq
-from typing import List, Tuple, Dict, Optional
+import weakref
+from array import array
+import numpy as np
+from typing import List, Optional, Tuple
+from src.config import Config
+from src.model.hierarchical_path_finder import HierarchicalPathFinder
+from src.model.maze_grid import MazeGrid
+
+
+class GridAStar:
+    """Движок A* на плоских целочисленных индексах клеток.
+    
+    Узлы совпадают с индексами буфера MazeGrid. Буферы g-оценок, родителей
+    и битовые карты посещений выделяются один раз на лабиринт и переиспользуются
+    между запросами. Рамка сетки позволяет обходить соседей по заранее
+    рассчитанным смещениям без проверки границ.
+    
+    Движок не хранит ссылку на сетку, поэтому его можно кэшировать
+    по слабой ссылке на нее.
+    
+    Attributes:
+        cols (int): Количество колонок лабиринта
+        rows (int): Количество строк лабиринта
+        stride (int): Длина строки буфера сетки
+        size (int): Количество узлов (размер буфера сетки)
+    """
+    
+    def __init__(self, grid: MazeGrid) -> None:
+        """Выделяет буферы поиска для лабиринта.
+        
+        Args:
+            grid: Сетка лабиринта
+        """
+        self.cols = grid.cols
+        self.rows = grid.rows
+        self.stride = stride = grid.stride
+        self.size = len(grid.buffer)
+        
+        # координаты узлов для эвристики и восстановления пути
+        nodes = np.arange(self.size, dtype=np.int32)
+        self._node_x = nodes % stride - 1
+        self._node_y = nodes // stride - 1
+        self._xs = array('i', self._node_x.tobytes())
+        self._ys = array('i', self._node_y.tobytes())
+        
+        # эвристика кэшируется для последней цели (обычно это выход)
+        self._heuristic_goal: Optional[Tuple[int, int]] = None
+        self._heuristic: List[int] = []
+        
+        self._g_score = array('i', [0]) * self.size
+        self._unreached = array('i', [self.size]) * self.size
+        self._parent = array('i', [-1]) * self.size
+        self._visited = bytearray(self.size)
+        self.refresh(grid)
+    
+    def refresh(self, grid: MazeGrid) -> None:
+        """Перечитывает проходимость клеток после изменения сетки.
+        
+        Args:
+            grid: Сетка лабиринта, для которой создан движок
+        """
+        blocked = MazeGrid.WALL | MazeGrid.OUTSIDE
+        self._walls = walls = ((grid.cells & blocked) != 0).tobytes()
+        
+        # проходимые соседи (вниз, вправо, вверх, влево) каждого узла
+        stride = self.stride
+        offsets = (stride, 1, -stride, -1)
+        empty: Tuple[int, ...] = ()
+        self._neighbors = [empty] * self.size
+        self._corridor = bytearray(self.size)
+        for node in range(stride, self.size - stride):
+            if not walls[node]:
+                self._neighbors[node] = tuple(
+                    node + offset for offset in offsets if not walls[node + offset]
+                )
+                self._corridor[node] = len(self._neighbors[node]) == 2
+    
+    def find(
+        self, 
+        start: Tuple[int, int], 
+        goal: Tuple[int, int]
+    ) -> List[Tuple[int, int]]:
+        """Находит кратчайший путь между клетками.
+        
+        Битовая карта посещений на старте запроса копируется из карты стен,
+        поэтому одна проверка отсекает и стены, и закрытые узлы. Соседи
+        с той же f-оценкой, что у текущего узла, раскрываются сразу
+        через стек, минуя кучу: при согласованной эвристике это не нарушает
+        оптимальность пути. Клетки коридоров (ровно два проходимых соседа)
+        проходятся цепочкой без кучи: через такую клетку есть только один
+        путь дальше, поэтому ее можно закрыть сразу.
+        
+        Args:
+            start: Координаты начальной клетки (x, y)
+            goal: Координаты целевой клетки (x, y)
+            
+        Returns:
+            List[Tuple[int, int]]: Путь без начальной клетки, включая целевую,
+                                    или пустой список, если путь не найден
+        """
+        start_x, start_y = start
+        target_x, target_y = goal
+        if not (0 <= start_x < self.cols and 0 <= start_y < self.rows):
+            return []
+        if not (0 <= target_x < self.cols and 0 <= target_y < self.rows):
+            return []
+        
+        size = self.size
+        neighbors = self._neighbors
+        corridor = self._corridor
+        heuristic = self._heuristic_to(goal)
+        g_score, parent = self._g_score, self._parent
+        visited = self._visited
+        visited[:] = self._walls
+        g_score[:] = self._unreached
+        
+        source = (start_y + 1) * self.stride + start_x + 1
+        target = (target_y + 1) * self.stride + target_x + 1
+        
+        # стартовая клетка может быть стеной (игрок в опасной зоне)
+        visited[source] = 0
+        g_score[source] = 0
+        
+        # элемент кучи кодирует пару (f, узел) одним целым числом
+        f_current = abs(start_x - target_x) + abs(start_y - target_y)
+        stack = [source]
+        open_set: List[int] = []
+        heappush, heappop = heapq.heappush, heapq.heappop
+        
+        while True:
+            if stack:
+                current = stack.pop()
+            elif open_set:
+                item = heappop(open_set)
+                f_current, current = divmod(item, size)
+            else:
+                return []
+            
+            if visited[current]:
+                continue
+            if current == target:
+                return self._reconstruct_path(source, target)
+            visited[current] = 1
+            
+            tentative_g_score = g_score[current] + 1
+            for neighbor in neighbors[current] or self._wall_neighbors(current):
+                if visited[neighbor] or tentative_g_score >= g_score[neighbor]:
+                    continue
+                g_score[neighbor] = tentative_g_score
+                parent[neighbor] = current
+                
+                # проход по коридору: клетка с двумя соседями закрывается сразу
+                previous, walk_g_score = current, tentative_g_score
+                while corridor[neighbor] and neighbor != target:
+                    first, second = neighbors[neighbor]
+                    if first == previous:
+                        following = second
+                    elif second == previous:
+                        following = first
+                    else:
+                        break
+                    visited[neighbor] = 1
+                    walk_g_score += 1
+                    if visited[following] or walk_g_score >= g_score[following]:
+                        neighbor = -1
+                        break
+                    g_score[following] = walk_g_score
+                    parent[following] = neighbor
+                    previous, neighbor = neighbor, following
+                if neighbor < 0:
+                    continue
+                
+                f_score = walk_g_score + heuristic[neighbor]
+                if f_score == f_current:
+                    stack.append(neighbor)
+                else:
+                    heappush(open_set, f_score * size + neighbor)
+    
+    def _heuristic_to(self, goal: Tuple[int, int]) -> List[int]:
+        """Возвращает манхэттенские расстояния всех узлов до цели.
+        
+        Args:
+            goal: Координаты целевой клетки (x, y)
+            
+        Returns:
+            List[int]: Эвристика по индексам узлов
+        """
+        if self._heuristic_goal != goal:
+            distances = np.abs(self._node_x - goal[0]) + np.abs(self._node_y - goal[1])
+            self._heuristic = distances.tolist()
+            self._heuristic_goal = goal
+        return self._heuristic
+    
+    def _wall_neighbors(self, node: int) -> Tuple[int, ...]:
+        """Возвращает проходимых соседей узла-стены (старт в опасной зоне).
+        
+        Args:
+            node: Индекс узла
+            
+        Returns:
+            Tuple[int, ...]: Индексы проходимых соседей
+        """
+        stride = self.stride
+        return tuple(
+            node + offset for offset in (stride, 1, -stride, -1)
+            if not self._walls[node + offset]
+        )
+    
+    def _reconstruct_path(self, source: int, target: int) -> List[Tuple[int, int]]:
+        """Восстанавливает путь по массиву родителей.
+        
+        Args:
+            source: Индекс начальной клетки
+            target: Индекс целевой клетки
+            
+        Returns:
+            List[Tuple[int, int]]: Путь от старта (не включая его) до цели
+        """
+        xs, ys, parent = self._xs, self._ys, self._parent
+        path = []
+        current = target
+        while current != source:
+            path.append((xs[current], ys[current]))
+            current = parent[current]
+        path.reverse()
+        return path
 
 
 class PathFinder:
-    """Класс, реализующий алгоритм A* для поиска пути в лабиринте."""
+    """Класс, реализующий алгоритм A* для поиска пути в лабиринте.
+    
+    Поиск выполняет GridAStar, движки кэшируются для каждой сетки
+    и освобождаются вместе с ней. В лабиринтах от
+    Config.HIERARCHICAL_PATH_MIN_CELLS клеток запрос уходит
+    в HierarchicalPathFinder: поиск по абстрактному графу там быстрее
+    поиска по всем клеткам (см. benchmarks/hierarchical_path.py).
+    """
+    
+    _engines: "weakref.WeakKeyDictionary[MazeGrid, GridAStar]" = weakref.WeakKeyDictionary()
     
     @staticmethod
     def find_path(
         start: Tuple[int, int], 
         exit_pos: Tuple[int, int], 
-        maze: List[List[int]]
+        grid: MazeGrid
     ) -> List[Tuple[int, int]]:
-        """Находит кратчайший путь от начальной точки до выхода в лабиринте.
+        """Находит путь от начальной точки до выхода в лабиринте.
         
-        Использует алгоритм A* с манхэттенским расстоянием в качестве эвристики.
+        Использует алгоритм A* с манхэттенским расстоянием в качестве эвристики;
+        в больших лабиринтах - иерархический поиск, путь которого близок
+        к кратчайшему.
         
         Args:
             start: Координаты начальной точки (x, y)
             exit_pos: Координаты точки выхода (x, y)
-            maze: Матрица лабиринта (0 - проход, 1 - стена)
+            grid: Сетка лабиринта
             
         Returns:
             List[Tuple[int, int]]: Список точек пути от старта до выхода,
                                     или пустой список если путь не найден.
         """
-        # очередь с приоритетом
-        open_set = []
-        heapq.heappush(open_set, (0, start))
-        
-        # словари для хранения информации о пути и стоимости
-        came_from: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {}
-        g_score: Dict[Tuple[int, int], float] = {start: 0}
-        f_score: Dict[Tuple[int, int], float] = {start: PathFinder.heuristic(start, exit_pos)}
-        
-        while open_set:
-            # узел с наименьшей f_score
-            current = heapq.heappop(open_set)[1]
+        if grid.cols * grid.rows >= Config.HIERARCHICAL_PATH_MIN_CELLS:
+            return HierarchicalPathFinder.planner(grid).find_path(start, exit_pos)
+        return PathFinder.engine(grid).find(start, exit_pos)
+    
+    @staticmethod
+    def engine(grid: MazeGrid) -> GridAStar:
+        """Возвращает движок поиска для сетки, создавая его при первом запросе.
+        
+        Args:
+            grid: Сетка лабиринта
             
-            if current == exit_pos:
-                return PathFinder.reconstruct_path(came_from, current)
-                
-            # проверка всех соседей текущей клетки
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                neighbor = (current[0] + dx, current[1] + dy)
-                
-                # пропуск невалидных клеток и стен
-                if not PathFinder.is_valid_cell(neighbor[0], neighbor[1], maze):
-                    continue
-                if maze[neighbor[1]][neighbor[0]] == 1:
-                    continue
-                    
-                # расчет временной g_score
-                tentative_g_score = g_score[current] + 1
-                
-                # если нашли лучший путь к соседу, обновляем данные
-                if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
-                    came_from[neighbor] = current
-                    g_score[neighbor] = tentative_g_score
-                    f_score[neighbor] = tentative_g_score + PathFinder.heuristic(neighbor, exit_pos)
-                    heapq.heappush(open_set, (f_score[neighbor], neighbor))
-                    
-        return []  # путь не найден
+        Returns:
+            GridAStar: Движок поиска с буферами для этой сетки
+        """
+        engine = PathFinder._engines.get(grid)
+        if engine is None:
+            engine = GridAStar(grid)
+            PathFinder._engines[grid] = engine
+        return engine
 
     @staticmethod
-    def is_valid_cell(cell_x: int, cell_y: int, maze: List[List[int]]) -> bool:
+    def is_valid_cell(cell_x: int, cell_y: int, grid: MazeGrid) -> bool:
         """Проверяет, находится ли клетка в пределах лабиринта.
         
         Args:
             cell_x: X-координата клетки
             cell_y: Y-координата клетки
-            maze: Матрица лабиринта
+            grid: Сетка лабиринта
             
         Returns:
             bool: True если клетка валидна, иначе False
         """
-        return (0 <= cell_x < len(maze[0])) and (0 <= cell_y < len(maze))
+        return grid.contains(cell_x, cell_y)
     
     @staticmethod
     def heuristic(a: Tuple[int, int], b: Tuple[int, int]) -> int:
@@ -94,24 +313,3 @@ class PathFinder:
             int: Манхэттенское расстояние |x1-x2| + |y1-y2|
         """
         return abs(a[0] - b[0]) + abs(a[1] - b[1])
-    
-    @staticmethod
-    def reconstruct_path(
-        came_from: Dict[Tuple[int, int], Tuple[int, int]], 
-        current: Tuple[int, int]
-    ) -> List[Tuple[int, int]]:
-        """Восстанавливает путь от текущей точки до старта.
-        
-        Args:
-            came_from: Словарь связей "узел -> предыдущий узел"
-            current: Конечная точка пути
-            
-        Returns:
-            List[Tuple[int, int]]: Путь от старта до конечной точки
-        """
-        path = []
-        while current in came_from:
-            path.append(current)
-            current = came_from[current]
-        path.reverse()
-        return path
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""Асинхронный поиск пути.
+
+Этот модуль содержит класс PathService, который выполняет поиск пути
+в пуле рабочих потоков и возвращает futures. Результаты забираются
+игровым циклом в безопасной точке кадра, а не в обработчике событий.
+"""
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class PathService:
+    """Очередь запросов поиска пути с отменой устаревших запросов.
+
+    Каждый запрос помечается ключом (обычно клеткой игрока). Новый запрос
+    с другим ключом отменяет еще не начатые запросы. Уже выполняющийся
+    поиск прервать нельзя, но его результат отбрасывается, если к моменту
+    опроса готов более новый.
+
+    Attributes:
+        workers (int): Количество рабочих потоков
+    """
+
+    def __init__(self, workers: int = 1) -> None:
+        """Создает пул рабочих потоков.
+
+        Args:
+            workers: Количество рабочих потоков
+        """
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="path-service"
+        )
+        self._pending: List[Tuple[Hashable, Future]] = []
+
+    def request(self, key: Hashable, search: Callable[..., Any], *args: Any) -> Future:
+        """Ставит поиск в очередь.
+
+        Args:
+            key: Ключ запроса; запросы с другим ключом считаются устаревшими
+            search: Функция поиска, выполняемая в рабочем потоке
+            *args: Аргументы функции поиска
+
+        Returns:
+            Future: Результат поиска
+        """
+        for pending_key, future in self._pending:
+            if pending_key == key and not future.done():
+                return future
+            if pending_key != key:
+                future.cancel()
+        self._pending = [item for item in self._pending if not item[1].cancelled()]
+
+        future = self._executor.submit(search, *args)
+        self._pending.append((key, future))
+        return future
+
+    def poll(self) -> Optional[Tuple[Hashable, Any]]:
+        """Забирает самый свежий завершенный результат.
+
+        Вызывается из игрового цикла. Запросы старше возвращенного
+        отбрасываются, более новые остаются в очереди. Исключение
+        из рабочего потока не доходит до игрового цикла: неудачный
+        запрос записывается в лог и отбрасывается.
+
+        Returns:
+            Optional[Tuple[Hashable, Any]]: Ключ и результат запроса
+                                            или None, если готовых нет
+        """
+        latest = -1
+        for position, (_, future) in enumerate(self._pending):
+            if future.done():
+                latest = position
+        if latest < 0:
+            return None
+
+        key, future = self._pending[latest]
+        self._pending = self._pending[latest + 1:]
+        try:
+            return key, future.result()
+        except Exception:
+            logger.exception("Path search for %r failed", key)
+            return None
+
+    def cancel(self) -> None:
+        """Отменяет все запросы; их результаты больше не будут выданы."""
+        for _, future in self._pending:
+            future.cancel()
+        self._pending = []
+
+    def close(self) -> None:
+        """Отменяет запросы и останавливает рабочие потоки."""
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
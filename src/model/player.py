@@ -5,8 +5,7 @@
 """
 
 from src.config import Config
-from src.utils import is_valid_cell
-from typing import Dict, List, Any
+from typing import Dict, List, Tuple, Any
 
 
 class Player:
@@ -26,6 +25,7 @@ class Player:
         glow (float): Уровень свечения игрока (для визуальных эффектов)
         color (Tuple[int, int, int]): Цвет игрока (RGB)
         last_valid_pos (List[float]): Последняя валидная позиция без коллизий
+        prev_pos (List[float]): Позиция до последнего шага симуляции
     """
     
     def __init__(self, settings: Dict[str, Any]) -> None:
@@ -47,6 +47,7 @@ class Player:
         self.glow = 0.0
         self.color = settings['colors']['player']
         self.last_valid_pos = self.pos.copy()
+        self.prev_pos = self.pos.copy()
     
     def update_position(
         self, 
@@ -61,6 +62,7 @@ class Player:
             dy: Изменение позиции по оси Y (-1, 0, 1)
             game_state: Текущее состояние игры
         """
+        self.prev_pos = self.pos.copy()
         if game_state['game_over'] or game_state['game_won']:
             return
         
@@ -111,17 +113,14 @@ class Player:
             bool: True если есть коллизия, иначе False
         """
         cell_size = game_state['cell_size']
-        thin_walls = game_state['thin_walls']
+        grid = game_state['grid']
         
         # ячейка, в которой находится игрок
         cell_x = int(pos[0] // cell_size)
         cell_y = int(pos[1] // cell_size)
         
         # проверка коллизии с тонкими стенами
-        if is_valid_cell(cell_x, cell_y, thin_walls):
-            return thin_walls[cell_y][cell_x] == 1
-            
-        return False
+        return grid.is_thin_wall(cell_x, cell_y)
 
     def _try_slide_movement(
         self, 
@@ -149,6 +148,20 @@ class Player:
             if not self._check_collision(y_pos, game_state):
                 self.pos = y_pos
     
+    def interpolate(self, alpha: float) -> Tuple[float, float]:
+        """Возвращает позицию между двумя последними шагами симуляции.
+        
+        Args:
+            alpha: Доля шага, прошедшая после последнего шага (0..1)
+            
+        Returns:
+            Tuple[float, float]: Позиция для отрисовки (x, y)
+        """
+        return (
+            self.prev_pos[0] + (self.pos[0] - self.prev_pos[0]) * alpha,
+            self.prev_pos[1] + (self.pos[1] - self.prev_pos[1]) * alpha
+        )
+    
     def update_glow(self, dt: float) -> None:
         """Обновляет уровень свечения игрока.
         
@@ -0,0 +1,111 @@
+"""Кольцевой буфер временных точек.
+
+Этот модуль содержит класс PointBuffer, который хранит точки сканирования
+(x, y, время создания) в параллельных массивах NumPy ограниченного размера.
+"""
+
+import numpy as np
+from typing import Iterable, Iterator, Tuple
+from src.config import Config
+
+
+class PointBuffer:
+    """Ограниченный буфер точек, упорядоченных по времени создания.
+
+    Точки добавляются в хвост в порядке времени, поэтому устаревшие
+    всегда лежат в голове: удаление только сдвигает голову, а граница
+    находится двоичным поиском. Живые точки всегда занимают непрерывный
+    срез массивов, который представление читает без копирования. Массивы
+    выделены с двойным запасом; когда хвост доходит до конца, живые точки
+    переносятся в начало. При превышении емкости вытесняются самые старые.
+
+    Attributes:
+        capacity (int): Максимальное количество точек
+    """
+
+    def __init__(self, capacity: int = Config.POINT_BUFFER_CAPACITY) -> None:
+        """Выделяет массивы буфера.
+
+        Args:
+            capacity: Максимальное количество точек
+        """
+        self.capacity = capacity
+        self._xs = np.zeros(capacity * 2, dtype=np.float32)
+        self._ys = np.zeros(capacity * 2, dtype=np.float32)
+        self._times = np.zeros(capacity * 2, dtype=np.int64)
+        self._head = 0
+        self._tail = 0
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    def __iter__(self) -> Iterator[Tuple[float, float, int]]:
+        xs, ys, times = self.view()
+        return zip(xs.tolist(), ys.tolist(), times.tolist())
+
+    def append(self, point: Tuple[float, float, int]) -> None:
+        """Добавляет точку.
+
+        Args:
+            point: Точка (x, y, время создания)
+        """
+        self.extend((point,))
+
+    def extend(self, points: Iterable[Tuple[float, float, int]]) -> None:
+        """Добавляет точки в порядке времени создания.
+
+        Args:
+            points: Точки (x, y, время создания) или массив (N, 3)
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        amount = len(points)
+        if not amount:
+            return
+
+        # в буфер помещаются только самые новые точки
+        if amount > self.capacity:
+            points = points[-self.capacity:]
+            amount = self.capacity
+
+        # вытеснение самых старых точек
+        overflow = len(self) + amount - self.capacity
+        if overflow > 0:
+            self._head += overflow
+
+        # перенос живых точек в начало массивов
+        if self._tail + amount > len(self._times):
+            live = len(self)
+            for column in (self._xs, self._ys, self._times):
+                column[:live] = column[self._head:self._tail]
+            self._head, self._tail = 0, live
+
+        rows = slice(self._tail, self._tail + amount)
+        self._xs[rows] = points[:, 0]
+        self._ys[rows] = points[:, 1]
+        self._times[rows] = points[:, 2]
+        self._tail += amount
+
+    def expire(self, current_time: int, lifetime: int) -> None:
+        """Удаляет точки, время жизни которых истекло.
+
+        Args:
+            current_time: Текущее время в миллисекундах
+            lifetime: Время жизни точек в миллисекундах
+        """
+        times = self._times[self._head:self._tail]
+        self._head += int(np.searchsorted(times, current_time - lifetime, side='right'))
+        if self._head == self._tail:
+            self._head = self._tail = 0
+
+    def clear(self) -> None:
+        """Удаляет все точки."""
+        self._head = self._tail = 0
+
+    def view(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Возвращает живые точки как срезы массивов без копирования.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Координаты x, y и время создания
+        """
+        rows = slice(self._head, self._tail)
+        return self._xs[rows], self._ys[rows], self._times[rows]
@@ -0,0 +1,132 @@
+"""Трассировка лучей по сетке лабиринта.
+
+Этот модуль содержит класс RayCaster, который реализует точный обход
+клеток вдоль луча (алгоритм Amanatides–Woo) вместо попиксельного шага.
+"""
+
+import math
+from typing import Callable, NamedTuple, Optional, Tuple
+
+
+class RayHit(NamedTuple):
+    """Результат трассировки луча.
+
+    Attributes:
+        x (float): X-координата точки попадания
+        y (float): Y-координата точки попадания
+        cell_x (int): X-координата клетки, в которую попал луч
+        cell_y (int): Y-координата клетки, в которую попал луч
+        normal (Tuple[int, int]): Нормаль грани, через которую луч вошел в клетку
+        distance (float): Расстояние от начала луча до точки попадания
+    """
+    x: float
+    y: float
+    cell_x: int
+    cell_y: int
+    normal: Tuple[int, int]
+    distance: float
+
+
+class RayCaster:
+    """Класс для трассировки лучей по клеткам лабиринта.
+
+    Луч проходит только через клетки, границы которых он пересекает,
+    поэтому на длине в 200 пикселей при размере клетки 30 проверяется
+    около 7 клеток вместо 200 точек.
+    """
+
+    @staticmethod
+    def cast(
+        start_pos: Tuple[float, float],
+        angle: float,
+        max_distance: float,
+        cell_size: int,
+        is_blocking: Callable[[int, int], bool],
+        min_distance: float = 0.0
+    ) -> Optional[RayHit]:
+        """Ищет первую блокирующую клетку вдоль луча.
+
+        Нормаль совпадает с направлением шага луча через грань, которой
+        он вошел в клетку: для левой грани (1, 0), для правой (-1, 0),
+        для верхней (0, 1), для нижней (0, -1).
+
+        Args:
+            start_pos: Начальная позиция луча (x, y)
+            angle: Угол луча в радианах
+            max_distance: Максимальная длина луча
+            cell_size: Размер ячейки лабиринта
+            is_blocking: Функция, проверяющая клетку (cell_x, cell_y) на преграду
+            min_distance: Расстояние от start_pos, с которого начинается проверка
+
+        Returns:
+            Optional[RayHit]: Данные о попадании или None, если преграды нет
+        """
+        dir_x = math.cos(angle)
+        dir_y = math.sin(angle)
+
+        # точка, с которой начинается обход
+        origin_x = start_pos[0] + dir_x * min_distance
+        origin_y = start_pos[1] + dir_y * min_distance
+        max_t = max_distance - min_distance
+
+        cell_x = math.floor(origin_x / cell_size)
+        cell_y = math.floor(origin_y / cell_size)
+
+        # луч начинается внутри преграды
+        if is_blocking(cell_x, cell_y):
+            if abs(dir_x) >= abs(dir_y):
+                normal = (1 if dir_x > 0 else -1, 0)
+            else:
+                normal = (0, 1 if dir_y > 0 else -1)
+            return RayHit(origin_x, origin_y, cell_x, cell_y, normal, min_distance)
+
+        # шаг по клеткам и расстояние до ближайших границ по каждой оси
+        if dir_x > 0:
+            step_x = 1
+            t_max_x = ((cell_x + 1) * cell_size - origin_x) / dir_x
+            t_delta_x = cell_size / dir_x
+        elif dir_x < 0:
+            step_x = -1
+            t_max_x = (cell_x * cell_size - origin_x) / dir_x
+            t_delta_x = -cell_size / dir_x
+        else:
+            step_x = 0
+            t_max_x = t_delta_x = math.inf
+
+        if dir_y > 0:
+            step_y = 1
+            t_max_y = ((cell_y + 1) * cell_size - origin_y) / dir_y
+            t_delta_y = cell_size / dir_y
+        elif dir_y < 0:
+            step_y = -1
+            t_max_y = (cell_y * cell_size - origin_y) / dir_y
+            t_delta_y = -cell_size / dir_y
+        else:
+            step_y = 0
+            t_max_y = t_delta_y = math.inf
+
+        # обход клеток до первой преграды или конца луча
+        while True:
+            if t_max_x < t_max_y:
+                t = t_max_x
+                cell_x += step_x
+                t_max_x += t_delta_x
+                normal = (step_x, 0)
+            else:
+                t = t_max_y
+                cell_y += step_y
+                t_max_y += t_delta_y
+                normal = (0, step_y)
+
+            if t > max_t:
+                return None
+
+            if is_blocking(cell_x, cell_y):
+                return RayHit(
+                    origin_x + dir_x * t,
+                    origin_y + dir_y * t,
+                    cell_x,
+                    cell_y,
+                    normal,
+                    min_distance + t
+                )
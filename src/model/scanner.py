@@ -5,12 +5,13 @@
 - DetectorScanner: для широкого сканирования опасных зон
 """
 
-import pygame
 import math
 import random
+import numpy as np
 from src.config import Config
-from typing import List, Tuple, Any
-from src.utils import is_valid_cell
+from typing import List, Optional, Tuple, Any
+from src.model.maze_grid import MazeGrid
+from src.model.ray_caster import RayCaster
 
 
 class Scanner:
@@ -23,9 +24,14 @@ class Scanner:
     
     Attributes:
         game_model (GameModel): Ссылка на модель игры
-        last_scan_time (int): Время последнего сканирования (в мс)
+        last_scan_time (Optional[int]): Время последнего сканирования (в мс)
+                                        или None, если сканер еще не срабатывал
     """
     
+    # ключ настройки с временем перезарядки сканера
+    cooldown_key: str = ''
+    
+    
     def __init__(self, game_model: Any) -> None:
         """Инициализирует сканер с ссылкой на модель игры.
         
@@ -33,7 +39,7 @@ class Scanner:
             game_model: Экземпляр GameModel
         """
         self.game_model = game_model
-        self.last_scan_time = 0
+        self.last_scan_time: Optional[int] = None
 
     def scan(self, start_pos: Tuple[float, float], angle: float) -> Any:
         """Выполняет сканирование в заданном направлении.
@@ -49,6 +55,20 @@ class Scanner:
         """
         raise NotImplementedError("Subclasses must implement this method")
         
+    def is_ready(self, current_time: int) -> bool:
+        """Проверяет, что перезарядка сканера закончилась.
+        
+        Args:
+            current_time: Текущее время в миллисекундах
+            
+        Returns:
+            bool: True если сканер можно запустить
+        """
+        if self.last_scan_time is None:
+            return True
+        cooldown = self.game_model.settings[self.cooldown_key]
+        return current_time - self.last_scan_time >= cooldown
+        
     def _get_cell_at_position(self, x: float, y: float) -> Tuple[int, int]:
         """Возвращает координаты клетки по позиции.
         
@@ -71,7 +91,7 @@ class Scanner:
         Returns:
             bool: True если клетка валидна, иначе False
         """
-        return is_valid_cell(cell_x, cell_y, self.game_model.maze)
+        return self.game_model.grid.contains(cell_x, cell_y)
         
     def _is_wall(self, cell_x: int, cell_y: int) -> bool:
         """Проверяет, является ли клетка стеной.
@@ -83,9 +103,7 @@ class Scanner:
         Returns:
             bool: True если клетка является стеной, иначе False
         """
-        if not self._is_valid_cell(cell_x, cell_y):
-            return False
-        return self.game_model.thin_walls[cell_y][cell_x] == 1
+        return self.game_model.grid.is_thin_wall(cell_x, cell_y)
         
     def _is_danger_zone(self, cell_x: int, cell_y: int) -> bool:
         """Проверяет, является ли клетка опасной зоной.
@@ -97,12 +115,14 @@ class Scanner:
         Returns:
             bool: True если клетка опасна, иначе False
         """
-        return (cell_x, cell_y) in self.game_model.danger_zones
+        return self.game_model.grid.is_danger(cell_x, cell_y)
 
 
 class LocatorScanner(Scanner):
     """Реализация сканера для локатора (точечное сканирование)."""
     
+    cooldown_key = 'locator_cooldown'
+    
     def scan(
         self, 
         start_pos: Tuple[float, float], 
@@ -118,10 +138,10 @@ class LocatorScanner(Scanner):
             List[Tuple[float, float, int]]: Список обнаруженных точек 
                                             (x, y, время создания)
         """
-        current_time = pygame.time.get_ticks()
+        current_time = self.game_model.clock.ticks()
         
         # проверка времени перезарядки
-        if current_time - self.last_scan_time < self.game_model.settings['locator_cooldown']:
+        if not self.is_ready(current_time):
             return []
             
         self.last_scan_time = current_time
@@ -132,76 +152,220 @@ class LocatorScanner(Scanner):
             Config.LOCATOR_ANGLE_VARIATION
         )
         
-        closest_hit = None
-        closest_dist = float('inf')
-        
-        # скан лучом до первой преграды
-        for dist in range(5, Config.LOCATOR_SCAN_LENGTH, Config.LOCATOR_SCAN_STEP):
-            x = start_pos[0] + math.cos(angle) * dist
-            y = start_pos[1] + math.sin(angle) * dist
-            
-            cell_x, cell_y = self._get_cell_at_position(x, y)
-            
-            # проверка, является ли клетка стеной или выходом
-            if self._is_valid_cell(cell_x, cell_y) and (
-                self._is_wall(cell_x, cell_y) or 
-                self.game_model.maze[cell_y][cell_x] == 2
-            ):
-                if dist < closest_dist:
-                    closest_dist = dist
-                    closest_hit = (x, y, cell_x, cell_y)
-                break
+        # трассировка луча по клеткам до первой преграды
+        hit = RayCaster.cast(
+            start_pos,
+            angle,
+            Config.LOCATOR_SCAN_LENGTH,
+            self.game_model.cell_size,
+            self._is_locator_target,
+            Config.LOCATOR_SCAN_START
+        )
         
         # если найдено столкновение, создаем точку с небольшим смещением
-        if closest_hit:
-            x, y, cell_x, cell_y = closest_hit
-            normal = self.game_model.get_wall_normal(cell_x, cell_y, x, y)
-            
-            # случайное смещение для визуального эффекта
-            offset_x = normal[0] * random.uniform(
+        if hit:
+            # случайное смещение вдоль нормали грани для визуального эффекта
+            offset_x = hit.normal[0] * random.uniform(
                 -Config.LOCATOR_HIT_VARIATION, 
                 Config.LOCATOR_HIT_VARIATION
             )
-            offset_y = normal[1] * random.uniform(
+            offset_y = hit.normal[1] * random.uniform(
                 -Config.LOCATOR_HIT_VARIATION, 
                 Config.LOCATOR_HIT_VARIATION
             )
             
             return [(
-                x + offset_x,
-                y + offset_y,
+                hit.x + offset_x,
+                hit.y + offset_y,
                 current_time
             )]
             
         return []
 
+    def _is_locator_target(self, cell_x: int, cell_y: int) -> bool:
+        """Проверяет, останавливает ли клетка луч локатора.
+        
+        Args:
+            cell_x: X-координата клетки
+            cell_y: Y-координата клетки
+            
+        Returns:
+            bool: True если клетка является стеной или выходом, иначе False
+        """
+        return bool(
+            self.game_model.grid.at(cell_x, cell_y) & 
+            (MazeGrid.THIN_WALL | MazeGrid.EXIT)
+        )
+
 
 class DetectorScanner(Scanner):
-    """Реализация сканера для детектора (широкое сканирование)."""
+    """Реализация сканера для детектора (широкое сканирование).
+    
+    По умолчанию весь конус лучей считается одной операцией над массивами
+    NumPy по представлению сетки лабиринта. Поточечный обход лучей в цикле оставлен как запасной режим.
+    
+    Attributes:
+        vectorized (bool): Флаг векторизованного режима сканирования
+    """
+    
+    cooldown_key = 'detector_cooldown'
+    
+    def __init__(self, game_model: Any) -> None:
+        """Инициализирует сканер и предрассчитывает сетку углов и дистанций.
+        
+        Args:
+            game_model: Экземпляр GameModel
+        """
+        super().__init__(game_model)
+        self.vectorized = True
+        
+        # смещения углов лучей и дистанции шагов вдоль луча
+        self._angle_deltas = np.radians(np.arange(
+            Config.DETECTOR_ANGLE_MIN,
+            Config.DETECTOR_ANGLE_MAX,
+            Config.DETECTOR_ANGLE_STEP
+        ))
+        self._distances = np.arange(
+            0,
+            Config.DETECTOR_SCAN_LENGTH,
+            Config.DETECTOR_SCAN_STEP,
+            dtype=np.float64
+        )
     
     def scan(
         self, 
         start_pos: Tuple[float, float], 
         angle: float
-    ) -> Tuple[List[Tuple[float, float, int]], List[Tuple[float, float]]]:
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Выполняет широкое сканирование в заданном направлении.
         
+        Попадания лучей в опасные зоны сводятся по клеткам: каждая
+        обнаруженная клетка дает одну позицию (центр масс попаданий)
+        и количество попаданий в нее.
+        
         Args:
             start_pos: Начальная позиция сканирования (x, y)
             angle: Угол сканирования в радианах
             
         Returns:
             Tuple: 
-                - Список точек волны (x, y, время)
-                - Список позиций опасных зон (x, y)
+                - Точки волны (x, y, время): массив формы (N, 3)
+                - Позиции обнаруженных опасных клеток (x, y): массив формы (K, 2)
+                - Количество попаданий в каждую клетку: массив формы (K,)
         """
-        current_time = pygame.time.get_ticks()
+        current_time = self.game_model.clock.ticks()
         
         # проверка времени перезарядки
-        if current_time - self.last_scan_time < self.game_model.settings['detector_cooldown']:
-            return [], []
+        if not self.is_ready(current_time):
+            return np.empty((0, 3), dtype=np.float64), *self._aggregate_hits(np.empty((0, 2)))
             
         self.last_scan_time = current_time
+        
+        if self.vectorized:
+            wave_points, hit_positions = self._cast_cone(start_pos, angle, current_time)
+        else:
+            wave_points, hit_positions = self._cast_rays(start_pos, angle, current_time)
+        return wave_points, *self._aggregate_hits(hit_positions)
+    
+    def _aggregate_hits(self, hit_positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Сводит попадания лучей по клеткам лабиринта.
+        
+        Args:
+            hit_positions: Позиции попаданий (x, y), массив (M, 2)
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Центры масс попаданий по клеткам (K, 2)
+                                           и количество попаданий в клетку (K,)
+        """
+        hits = np.asarray(hit_positions, dtype=np.float64).reshape(-1, 2)
+        if not len(hits):
+            return hits, np.zeros(0, dtype=np.int64)
+        
+        # ключ клетки: индекс в буфере сетки (с отбрасыванием дробной части, как int())
+        grid = self.game_model.grid
+        cells = hits.astype(np.int64) // self.game_model.cell_size
+        keys = cells[:, 1] * grid.stride + cells[:, 0]
+        _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        
+        centroids = np.empty((len(counts), 2), dtype=np.float64)
+        centroids[:, 0] = np.bincount(inverse, weights=hits[:, 0]) / counts
+        centroids[:, 1] = np.bincount(inverse, weights=hits[:, 1]) / counts
+        return centroids, counts
+    
+    def _cast_cone(
+        self, 
+        start_pos: Tuple[float, float], 
+        angle: float, 
+        current_time: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Сканирует весь конус одной операцией над массивами.
+        
+        Каждая строка матрицы выборок соответствует лучу, каждый столбец
+        шагу вдоль луча. Первая стена и выход за границы находятся через
+        накопительную сумму по лучу.
+        
+        Args:
+            start_pos: Начальная позиция сканирования (x, y)
+            angle: Угол сканирования в радианах
+            current_time: Текущее время в миллисекундах
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Точки волны (N, 3) и
+                                           позиции опасных зон (M, 2)
+        """
+        grid = self.game_model.grid
+        cell_size = self.game_model.cell_size
+        
+        # координаты всех выборок: лучи x шаги
+        angles = angle + self._angle_deltas
+        xs = start_pos[0] + np.cos(angles)[:, None] * self._distances
+        ys = start_pos[1] + np.sin(angles)[:, None] * self._distances
+        
+        # клетки выборок (с отбрасыванием дробной части, как int()),
+        # выборки за границами сводятся к рамке сетки с флагом OUTSIDE
+        cells_x = np.clip(xs.astype(np.int64) // cell_size + 1, 0, grid.cols + 1)
+        cells_y = np.clip(ys.astype(np.int64) // cell_size + 1, 0, grid.rows + 1)
+        codes = grid.cells[cells_y, cells_x]
+        
+        inside = (codes & MazeGrid.OUTSIDE) == 0
+        stops = (codes & MazeGrid.WALL) != 0
+        dangers = (codes & MazeGrid.DANGER) != 0
+        
+        # луч обрывается до выборки за границей и после первой стены
+        outside_seen = np.cumsum(~inside, axis=1) > 0
+        wall_before = (np.cumsum(stops, axis=1) - stops) > 0
+        keep = ~outside_seen & ~wall_before
+        
+        wave_points = np.empty((int(keep.sum()), 3), dtype=np.float64)
+        wave_points[:, 0] = xs[keep]
+        wave_points[:, 1] = ys[keep]
+        wave_points[:, 2] = current_time
+        
+        hits = keep & dangers
+        hit_positions = np.column_stack((xs[hits], ys[hits]))
+        
+        return wave_points, hit_positions
+    
+    def _cast_rays(
+        self, 
+        start_pos: Tuple[float, float], 
+        angle: float, 
+        current_time: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Сканирует конус, обходя лучи и шаги в цикле.
+        
+        Результат имеет те же формы, что и у _cast_cone, поэтому
+        режимы взаимозаменяемы для вызывающего кода.
+        
+        Args:
+            start_pos: Начальная позиция сканирования (x, y)
+            angle: Угол сканирования в радианах
+            current_time: Текущее время в миллисекундах
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Точки волны (N, 3) и
+                                           позиции опасных зон (M, 2)
+        """
         wave_points = []
         hit_positions = []
         
@@ -227,7 +391,10 @@ class DetectorScanner(Scanner):
                     hit_positions.append((x, y))
                 
                 # прерываем луч при столкновении со стеной
-                if self._is_wall(cell_x, cell_y) or self.game_model.maze[cell_y][cell_x] == 1:
+                if self.game_model.grid.is_wall(cell_x, cell_y):
                     break
             
-        return wave_points, hit_positions
\ No newline at end of file
+        return (
+            np.array(wave_points, dtype=np.float64).reshape(-1, 3),
+            np.array(hit_positions, dtype=np.float64).reshape(-1, 2)
+        )
@@ -0,0 +1,78 @@
+"""Безголовая симуляция игры.
+
+Этот модуль содержит класс Simulation, который шагает GameModel
+с фиксированным шагом по ручным часам, без дисплея, звука и pygame.
+"""
+
+import copy
+from typing import Any, Dict, Optional
+from src.config import Config
+from src.model.clock import ManualClock
+from src.model.game_model import GameModel
+from src.model.input_frame import InputFrame
+from src.model.level_pack import LevelPack
+
+
+class Simulation:
+    """Модель игры, которую шагает вызывающий код.
+
+    Каждый шаг сдвигает ручные часы на длину шага и обновляет модель
+    с переданным вводом так же, как GameController в окне, поэтому
+    симуляция идет с любой скоростью и подходит для пакетных прогонов,
+    бенчмарков и ботов.
+
+    Attributes:
+        settings (Dict[str, Any]): Настройки игры
+        step_time (float): Длина шага в секундах
+        clock (ManualClock): Часы модели
+        model (GameModel): Модель игры
+        steps (int): Количество шагов с последнего сброса
+    """
+
+    def __init__(
+        self,
+        settings: Optional[Dict[str, Any]] = None,
+        level_pack: Optional[LevelPack] = None,
+        rate: int = Config.SIMULATION_RATE
+    ) -> None:
+        """Создает модель с ручными часами.
+
+        Args:
+            settings: Настройки игры (по умолчанию Config.DEFAULT_SETTINGS)
+            level_pack: Набор уровней для reset по индексу или зерну
+            rate: Количество шагов в секунду игрового времени
+        """
+        self.settings = settings if settings is not None else copy.deepcopy(Config.DEFAULT_SETTINGS)
+        self.step_time = 1.0 / rate
+        self.clock = ManualClock()
+        self.model = GameModel(self.settings, level_pack=level_pack, clock=self.clock)
+        self.steps = 0
+
+    @property
+    def done(self) -> bool:
+        """Игра окончена победой или поражением."""
+        return self.model.game_won or self.model.game_over
+
+    def reset(self, level: Optional[int] = None, seed: Optional[int] = None) -> None:
+        """Начинает новую игру.
+
+        Args:
+            level: Индекс лабиринта в наборе уровней
+            seed: Зерно лабиринта
+        """
+        self.model.reset(level, seed)
+        self.steps = 0
+
+    def step(self, frame: InputFrame) -> None:
+        """Выполняет один шаг симуляции.
+
+        После окончания игры модель, как и в окне, не обновляется.
+
+        Args:
+            frame: Ввод за этот шаг
+        """
+        self.clock.advance(self.step_time * 1000)
+        self.model.left_mouse_down = frame.locator
+        if not self.done:
+            self.model.update(self.step_time, frame)
+        self.steps += 1
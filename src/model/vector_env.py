@@ -0,0 +1,456 @@
+"""Векторная среда для обучения агентов.
+
+Этот модуль содержит класс VectorEnv, который хранит лабиринты
+и N игроков в общих массивах и шагает движение, коллизии и сканеры
+всех сред одной операцией NumPy, без GameModel и pygame.
+"""
+
+import copy
+import math
+import random
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
+from src.config import Config
+from src.model.maze import MazeGenerator
+from src.model.maze_grid import MazeGrid
+from src.model.maze_pool import MazePool
+
+
+class VectorEnv:
+    """Пакет из N независимых игр в стиле векторных сред gym.
+
+    Набор из M лабиринтов готовится один раз (из пула или по зернам)
+    и хранится в одном массиве (M, rows + 2, cols + 2) с рамкой MazeGrid.
+    Среда хранит только индекс своего лабиринта, поэтому флаги клеток
+    для всех сред читаются одной индексацией, а перезапуск эпизода
+    не генерирует и не копирует лабиринт.
+
+    Шаг повторяет GameModel.update: сначала локатор и детектор из текущей
+    позиции, затем движение со скольжением вдоль тонких стен как
+    в Player.update_position, затем проверка опасной зоны и выхода.
+    Частицы, точки и волны нужны только для отрисовки и не моделируются.
+
+    Локатор трассирует луч по клеткам тем же обходом, что и RayCaster,
+    детектор сэмплирует конус лучей так же, как DetectorScanner._cast_cone.
+    Перезарядка сканеров считается по игровому времени среды.
+
+    Наблюдение - результаты сканов текущего шага в секторах вокруг игрока:
+    сектор 0 смотрит вдоль оси X, сектора идут по возрастанию угла.
+    Каналы OBS_WALL, OBS_DANGER и OBS_EXIT хранят расстояние до ближайшего
+    попадания в долях длины сканера (1.0 - попаданий нет), канал OBS_SCANNED
+    равен 1.0 для секторов, в которые пришелся хотя бы один луч.
+
+    Закончившиеся среды сразу перезапускаются со случайным лабиринтом
+    из набора: строка наблюдения такой среды относится уже к новому
+    эпизоду, а последнее наблюдение закончившегося эпизода копируется
+    в info['final_observation'] до перезапуска. Массивы наблюдений,
+    наград и флагов выделяются один раз и перезаписываются каждым шагом.
+
+    Attributes:
+        num_envs (int): Количество сред
+        settings (Dict[str, Any]): Настройки игры
+        step_time (float): Длина шага в миллисекундах
+        max_steps (int): Предел шагов эпизода
+        sectors (int): Количество секторов наблюдения
+        cols (int): Количество колонок лабиринтов
+        rows (int): Количество строк лабиринтов
+        cell_size (int): Размер ячейки лабиринтов
+        mazes (np.ndarray): Флаги клеток набора лабиринтов (M, rows + 2, cols + 2)
+        seeds (List[Optional[int]]): Зерна лабиринтов набора
+        maze_index (np.ndarray): Индексы лабиринтов сред в наборе (N,)
+        positions (np.ndarray): Позиции игроков (N, 2)
+        steps (np.ndarray): Шаги текущих эпизодов (N,)
+        observations (np.ndarray): Наблюдения (N, 4, sectors)
+    """
+
+    # каналы наблюдения
+    OBS_WALL: int = 0
+    OBS_DANGER: int = 1
+    OBS_EXIT: int = 2
+    OBS_SCANNED: int = 3
+
+    def __init__(
+        self,
+        num_envs: int,
+        settings: Optional[Dict[str, Any]] = None,
+        maze_pool: Optional[MazePool] = None,
+        seed: Optional[int] = None,
+        maze_count: int = Config.ENV_MAZE_COUNT,
+        rate: int = Config.SIMULATION_RATE,
+        max_steps: int = Config.ENV_MAX_STEPS,
+        sectors: int = Config.ENV_OBS_SECTORS
+    ) -> None:
+        """Создает среды и готовит набор лабиринтов.
+
+        Args:
+            num_envs: Количество сред
+            settings: Настройки игры (по умолчанию Config.DEFAULT_SETTINGS)
+            maze_pool: Пул готовых лабиринтов (по умолчанию лабиринты
+                       генерируются по зернам из seed)
+            seed: Зерно лабиринтов, выбора лабиринтов и отклонения локатора
+            maze_count: Количество лабиринтов в наборе
+            rate: Количество шагов в секунду игрового времени
+            max_steps: Предел шагов эпизода
+            sectors: Количество секторов наблюдения
+        """
+        self.num_envs = num_envs
+        self.settings = settings if settings is not None else copy.deepcopy(Config.DEFAULT_SETTINGS)
+        self.maze_pool = maze_pool
+        self.step_time = 1000.0 / rate
+        self.max_steps = max_steps
+        self.sectors = sectors
+        self._seeds = random.Random(seed)
+        self._rng = np.random.default_rng(seed)
+
+        self.speed = float(self.settings['player_speed'])
+        self.speed_diagonal = self.speed * Config.DIAGONAL_FACTOR
+        self._locator_cooldown = self.settings['locator_cooldown']
+        self._detector_cooldown = self.settings['detector_cooldown']
+
+        # лучи детектора и шаги вдоль них, как в DetectorScanner
+        self._detector_deltas = np.radians(np.arange(
+            Config.DETECTOR_ANGLE_MIN,
+            Config.DETECTOR_ANGLE_MAX,
+            Config.DETECTOR_ANGLE_STEP
+        ))
+        self._detector_distances = np.arange(
+            0,
+            Config.DETECTOR_SCAN_LENGTH,
+            Config.DETECTOR_SCAN_STEP,
+            dtype=np.float64
+        )
+
+        grids = [self._next_grid() for _ in range(maze_count)]
+        self.cols = grids[0].cols
+        self.rows = grids[0].rows
+        self.cell_size = grids[0].cell_size
+        if any((grid.cols, grid.rows, grid.cell_size) != (self.cols, self.rows, self.cell_size) for grid in grids):
+            raise ValueError("All mazes in VectorEnv must have the same size")
+        self.mazes = np.stack([grid.cells for grid in grids])
+        self.seeds: List[Optional[int]] = [grid.seed for grid in grids]
+        self.maze_index = np.zeros(num_envs, dtype=np.int64)
+
+        self.positions = np.zeros((num_envs, 2), dtype=np.float64)
+        self.steps = np.zeros(num_envs, dtype=np.int64)
+        self._time = np.zeros(num_envs, dtype=np.float64)
+        self._locator_time = np.full(num_envs, -np.inf)
+        self._detector_time = np.full(num_envs, -np.inf)
+
+        self.observations = np.empty((num_envs, 4, sectors), dtype=np.float32)
+        self._rewards = np.zeros(num_envs, dtype=np.float32)
+        self._terminated = np.zeros(num_envs, dtype=bool)
+        self._truncated = np.zeros(num_envs, dtype=bool)
+        self._won = np.zeros(num_envs, dtype=bool)
+        self._episode_steps = np.zeros(num_envs, dtype=np.int64)
+        self._final_observations = np.zeros((num_envs, 4, sectors), dtype=np.float32)
+        self._final_mask = np.zeros(num_envs, dtype=bool)
+
+    def reset(self) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Начинает новые эпизоды во всех средах.
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, Any]]: Наблюдения (N, 4, sectors)
+                                               и словарь: 'maze_index' - индексы
+                                               лабиринтов сред в наборе (N,)
+        """
+        self._reset_envs(np.arange(self.num_envs))
+        self._clear_observations()
+        return self.observations, {'maze_index': self.maze_index}
+
+    def step(
+        self,
+        moves: np.ndarray,
+        angles: np.ndarray,
+        locator: Optional[np.ndarray] = None,
+        detector: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]:
+        """Выполняет один шаг во всех средах.
+
+        Args:
+            moves: Направления движения по осям (N, 2), значения -1, 0, 1
+            angles: Углы прицеливания сканеров в радианах (N,)
+            locator: Локатор включен (N,), по умолчанию выключен везде
+            detector: Запуск детектора (N,), по умолчанию не запускается
+
+        Returns:
+            Tuple:
+                - Наблюдения (N, 4, sectors)
+                - Награды (N,)
+                - Эпизод закончен выходом или опасной зоной (N,)
+                - Эпизод прерван по пределу шагов (N,)
+                - Словарь: 'won' - эпизод закончен выходом (N,),
+                  'episode_steps' - длина закончившихся эпизодов (N,),
+                  'maze_index' - индексы лабиринтов сред в наборе (N,),
+                  'final_observation' - последние наблюдения закончившихся
+                  эпизодов (N, 4, sectors), 'final_observation_mask' - строка
+                  final_observation заполнена на этом шаге (N,)
+        """
+        moves = np.asarray(moves, dtype=np.int64).reshape(self.num_envs, 2)
+        angles = np.asarray(angles, dtype=np.float64).reshape(self.num_envs)
+        self._time += self.step_time
+        self.steps += 1
+
+        self._clear_observations()
+        if locator is not None:
+            fired = self._ready(locator, self._locator_time, self._locator_cooldown)
+            self._scan_locator(np.flatnonzero(fired), angles)
+        if detector is not None:
+            fired = self._ready(detector, self._detector_time, self._detector_cooldown)
+            self._scan_detector(np.flatnonzero(fired), angles)
+        self._move(moves)
+
+        flags = self._flags_at(np.arange(self.num_envs), *self._cells_of(self.positions))
+        dead = (flags & MazeGrid.DANGER) != 0
+        self._won[:] = ~dead & ((flags & MazeGrid.EXIT) != 0)
+        np.logical_or(dead, self._won, out=self._terminated)
+        np.logical_and(self.steps >= self.max_steps, ~self._terminated, out=self._truncated)
+
+        self._rewards.fill(Config.ENV_REWARD_STEP)
+        self._rewards[dead] = Config.ENV_REWARD_DANGER
+        self._rewards[self._won] = Config.ENV_REWARD_EXIT
+
+        # автоматический перезапуск закончившихся сред
+        done = np.flatnonzero(self._terminated | self._truncated)
+        self._episode_steps.fill(0)
+        self._final_mask.fill(False)
+        if len(done):
+            self._episode_steps[done] = self.steps[done]
+            # последнее наблюдение эпизода, пока его не перезаписал перезапуск
+            self._final_observations[done] = self.observations[done]
+            self._final_mask[done] = True
+            self._reset_envs(done)
+            self.observations[done, :self.OBS_SCANNED] = 1.0
+            self.observations[done, self.OBS_SCANNED] = 0.0
+
+        info = {
+            'won': self._won,
+            'episode_steps': self._episode_steps,
+            'maze_index': self.maze_index,
+            'final_observation': self._final_observations,
+            'final_observation_mask': self._final_mask
+        }
+        return self.observations, self._rewards, self._terminated, self._truncated, info
+
+    def _next_grid(self) -> MazeGrid:
+        """Берет очередной лабиринт из пула или генерирует его по зерну.
+
+        Returns:
+            MazeGrid: Сетка лабиринта
+        """
+        if self.maze_pool is not None:
+            return self.maze_pool.get()
+        return MazeGenerator.generate_maze(seed=self._seeds.getrandbits(63))
+
+    def _reset_envs(self, envs: np.ndarray) -> None:
+        """Выбирает средам случайные лабиринты из набора и сбрасывает состояние.
+
+        Args:
+            envs: Индексы сред
+        """
+        self.maze_index[envs] = self._rng.integers(0, len(self.mazes), len(envs))
+
+        # стартовая позиция, как в Player
+        self.positions[envs] = (Config.WIDTH // 2, Config.HEIGHT // 2)
+        self.steps[envs] = 0
+        self._time[envs] = 0.0
+        self._locator_time[envs] = -np.inf
+        self._detector_time[envs] = -np.inf
+
+    def _clear_observations(self) -> None:
+        """Сбрасывает наблюдения перед сканами шага."""
+        self.observations[:, :self.OBS_SCANNED] = 1.0
+        self.observations[:, self.OBS_SCANNED] = 0.0
+
+    def _ready(self, pressed: np.ndarray, last_time: np.ndarray, cooldown: float) -> np.ndarray:
+        """Выбирает среды, в которых сканер запускается на этом шаге.
+
+        Args:
+            pressed: Сканер включен (N,)
+            last_time: Время последнего срабатывания сканера (N,), изменяется на месте
+            cooldown: Время перезарядки в миллисекундах
+
+        Returns:
+            np.ndarray: Маска сред, в которых сканер сработал (N,)
+        """
+        fired = np.asarray(pressed, dtype=bool) & (self._time - last_time >= cooldown)
+        last_time[fired] = self._time[fired]
+        return fired
+
+    def _cells_of(self, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Возвращает клетки позиций с округлением вниз, как в Player.
+
+        Args:
+            positions: Позиции (M, 2)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Координаты клеток x и y (M,)
+        """
+        cells = np.floor_divide(positions, self.cell_size).astype(np.int64)
+        return cells[:, 0], cells[:, 1]
+
+    def _flags_at(self, envs: np.ndarray, cell_x: np.ndarray, cell_y: np.ndarray) -> np.ndarray:
+        """Читает флаги клеток; клетки за пределами сводятся к рамке OUTSIDE.
+
+        Args:
+            envs: Индексы сред (M,)
+            cell_x: X-координаты клеток (M,)
+            cell_y: Y-координаты клеток (M,)
+
+        Returns:
+            np.ndarray: Флаги клеток (M,)
+        """
+        return self.mazes[
+            self.maze_index[envs],
+            np.clip(cell_y + 1, 0, self.rows + 1),
+            np.clip(cell_x + 1, 0, self.cols + 1)
+        ]
+
+    def _move(self, moves: np.ndarray) -> None:
+        """Сдвигает игроков со скольжением вдоль тонких стен.
+
+        Args:
+            moves: Направления движения по осям (N, 2)
+        """
+        envs = np.arange(self.num_envs)
+        diagonal = (moves[:, 0] != 0) & (moves[:, 1] != 0)
+        speed = np.where(diagonal, self.speed_diagonal, self.speed)
+        moved = self.positions + moves * speed[:, None]
+
+        # скольжение только по X или только по Y из прежней позиции
+        slide_x = self.positions.copy()
+        slide_x[:, 0] += moves[:, 0] * self.speed
+        slide_y = self.positions.copy()
+        slide_y[:, 1] += moves[:, 1] * self.speed
+
+        free = (self._flags_at(envs, *self._cells_of(moved)) & MazeGrid.THIN_WALL) == 0
+        free_x = (moves[:, 0] != 0) & ((self._flags_at(envs, *self._cells_of(slide_x)) & MazeGrid.THIN_WALL) == 0)
+        free_y = (moves[:, 1] != 0) & ((self._flags_at(envs, *self._cells_of(slide_y)) & MazeGrid.THIN_WALL) == 0)
+
+        result = np.where(free_y[:, None], slide_y, self.positions)
+        result = np.where(free_x[:, None], slide_x, result)
+        self.positions = np.where(free[:, None], moved, result)
+
+    def _mark(self, envs: np.ndarray, channel: int, angles: np.ndarray, values: np.ndarray) -> None:
+        """Записывает ближайшие попадания лучей в сектора наблюдения.
+
+        Args:
+            envs: Индексы сред лучей (M,)
+            channel: Канал наблюдения
+            angles: Углы лучей в радианах (M,)
+            values: Расстояния в долях длины сканера (M,), 1.0 - попадания нет
+        """
+        sector = (np.mod(angles, 2 * math.pi) * (self.sectors / (2 * math.pi))).astype(np.int64) % self.sectors
+        flat = self.observations.reshape(-1)
+        base = (envs * 4) * self.sectors + sector
+        np.minimum.at(flat, base + channel * self.sectors, values.astype(np.float32))
+        flat[base + self.OBS_SCANNED * self.sectors] = 1.0
+
+    def _scan_locator(self, envs: np.ndarray, angles: np.ndarray) -> None:
+        """Трассирует лучи локатора всех сработавших сред одновременно.
+
+        Обход клеток повторяет RayCaster.cast: на каждой итерации все
+        незавершенные лучи переходят через ближайшую границу клетки.
+
+        Args:
+            envs: Индексы сред, в которых сработал локатор
+            angles: Углы прицеливания всех сред (N,)
+        """
+        if not len(envs):
+            return
+
+        cell_size = self.cell_size
+        min_distance = Config.LOCATOR_SCAN_START
+        max_t = Config.LOCATOR_SCAN_LENGTH - min_distance
+        target = MazeGrid.THIN_WALL | MazeGrid.EXIT
+
+        ray_angles = angles[envs] + self._rng.uniform(
+            -Config.LOCATOR_ANGLE_VARIATION,
+            Config.LOCATOR_ANGLE_VARIATION,
+            len(envs)
+        )
+        dir_x = np.cos(ray_angles)
+        dir_y = np.sin(ray_angles)
+        origin_x = self.positions[envs, 0] + dir_x * min_distance
+        origin_y = self.positions[envs, 1] + dir_y * min_distance
+        cell_x = np.floor(origin_x / cell_size).astype(np.int64)
+        cell_y = np.floor(origin_y / cell_size).astype(np.int64)
+
+        # шаг по клеткам и расстояние до ближайших границ по каждой оси
+        step_x = np.sign(dir_x).astype(np.int64)
+        step_y = np.sign(dir_y).astype(np.int64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_max_x = np.where(step_x != 0, ((cell_x + (step_x > 0)) * cell_size - origin_x) / dir_x, np.inf)
+            t_max_y = np.where(step_y != 0, ((cell_y + (step_y > 0)) * cell_size - origin_y) / dir_y, np.inf)
+            t_delta_x = np.where(step_x != 0, cell_size / np.abs(dir_x), np.inf)
+            t_delta_y = np.where(step_y != 0, cell_size / np.abs(dir_y), np.inf)
+
+        distance = np.full(len(envs), np.inf)
+        flags = self._flags_at(envs, cell_x, cell_y)
+
+        # луч начинается внутри преграды
+        start_hit = (flags & target) != 0
+        distance[start_hit] = min_distance
+        hit_flags = np.where(start_hit, flags, 0)
+        active = ~start_hit
+
+        while active.any():
+            along_x = t_max_x < t_max_y
+            t = np.where(along_x, t_max_x, t_max_y)
+            cell_x += np.where(active & along_x, step_x, 0)
+            cell_y += np.where(active & ~along_x, step_y, 0)
+            t_max_x = np.where(active & along_x, t_max_x + t_delta_x, t_max_x)
+            t_max_y = np.where(active & ~along_x, t_max_y + t_delta_y, t_max_y)
+
+            active &= t <= max_t
+            flags = self._flags_at(envs, cell_x, cell_y)
+            hit = active & ((flags & target) != 0)
+            distance[hit] = min_distance + t[hit]
+            hit_flags[hit] = flags[hit]
+            active &= ~hit
+
+        values = np.minimum(distance / Config.LOCATOR_SCAN_LENGTH, 1.0)
+        exits = (hit_flags & MazeGrid.EXIT) != 0
+        self._mark(envs, self.OBS_WALL, ray_angles, np.where(exits, 1.0, values))
+        self._mark(envs, self.OBS_EXIT, ray_angles, np.where(exits, values, 1.0))
+
+    def _scan_detector(self, envs: np.ndarray, angles: np.ndarray) -> None:
+        """Сканирует конусы детектора всех сработавших сред одновременно.
+
+        Выборки образуют массив (среды, лучи, шаги); обрыв лучей у рамки
+        и после первой стены находится накопительной суммой, как
+        в DetectorScanner._cast_cone.
+
+        Args:
+            envs: Индексы сред, в которых сработал детектор
+            angles: Углы прицеливания всех сред (N,)
+        """
+        if not len(envs):
+            return
+
+        cell_size = self.cell_size
+        distances = self._detector_distances
+        ray_angles = angles[envs, None] + self._detector_deltas
+        xs = self.positions[envs, 0, None, None] + np.cos(ray_angles)[:, :, None] * distances
+        ys = self.positions[envs, 1, None, None] + np.sin(ray_angles)[:, :, None] * distances
+
+        # клетки выборок с отбрасыванием дробной части, как int()
+        cells_x = np.clip(xs.astype(np.int64) // cell_size + 1, 0, self.cols + 1)
+        cells_y = np.clip(ys.astype(np.int64) // cell_size + 1, 0, self.rows + 1)
+        codes = self.mazes[self.maze_index[envs, None, None], cells_y, cells_x]
+
+        inside = (codes & MazeGrid.OUTSIDE) == 0
+        stops = (codes & MazeGrid.WALL) != 0
+        outside_seen = np.cumsum(~inside, axis=2) > 0
+        wall_before = (np.cumsum(stops, axis=2) - stops) > 0
+        keep = ~outside_seen & ~wall_before
+
+        # ближайшая стена и ближайшая опасная зона на каждом луче
+        length = Config.DETECTOR_SCAN_LENGTH
+        dangers = keep & ((codes & MazeGrid.DANGER) != 0)
+        walls = keep & stops & ~dangers
+        wall_distance = np.where(walls.any(axis=2), distances[walls.argmax(axis=2)] / length, 1.0)
+        danger_distance = np.where(dangers.any(axis=2), distances[dangers.argmax(axis=2)] / length, 1.0)
+
+        ray_envs = np.repeat(envs, ray_angles.shape[1])
+        self._mark(ray_envs, self.OBS_WALL, ray_angles.ravel(), wall_distance.ravel())
+        self._mark(ray_envs, self.OBS_DANGER, ray_angles.ravel(), danger_distance.ravel())
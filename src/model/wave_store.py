@@ -0,0 +1,144 @@
+"""Хранилище волн детектора.
+
+Этот модуль содержит класс WaveStore, который хранит волны детектора
+в компактных массивах NumPy фиксированной емкости и удаляет истекшие.
+"""
+
+import math
+import numpy as np
+from typing import List, Optional, Tuple
+from src.config import Config
+
+
+class WaveStore:
+    """Кольцевое хранилище волн детектора.
+
+    Волна описывается началом, углом, длиной и временем запуска;
+    точки границ конуса вычисляются из этих параметров при отрисовке,
+    поэтому волна занимает несколько чисел вместо списков кортежей.
+    Волны запускаются в порядке времени и живут одинаковое время,
+    поэтому истекшие всегда лежат в голове кольца. При заполнении
+    новая волна вытесняет самую старую.
+
+    Точки волны из сканера нужны только для отладки и сохраняются,
+    если включен keep_points.
+
+    Attributes:
+        capacity (int): Максимальное количество волн
+        keep_points (bool): Сохранять ли точки волн для отладки
+        origin (np.ndarray): Начальные позиции волн (capacity, 2)
+        angle (np.ndarray): Углы направления волн в радианах
+        length (np.ndarray): Длины границ конуса
+        start_time (np.ndarray): Время запуска волн в миллисекундах
+        duration (np.ndarray): Длительность волн в миллисекундах
+        points (List[Optional[np.ndarray]]): Точки волн (только при keep_points)
+    """
+
+    def __init__(
+        self,
+        capacity: int = Config.DETECTOR_WAVE_CAPACITY,
+        keep_points: bool = Config.DEBUG_WAVE_POINTS
+    ) -> None:
+        """Выделяет массивы хранилища.
+
+        Args:
+            capacity: Максимальное количество волн
+            keep_points: Сохранять ли точки волн для отладки
+        """
+        self.capacity = capacity
+        self.keep_points = keep_points
+        self.origin = np.zeros((capacity, 2), dtype=np.float32)
+        self.angle = np.zeros(capacity, dtype=np.float32)
+        self.length = np.zeros(capacity, dtype=np.float32)
+        self.start_time = np.zeros(capacity, dtype=np.int64)
+        self.duration = np.zeros(capacity, dtype=np.int32)
+        self.points: List[Optional[np.ndarray]] = [None] * capacity
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(
+        self,
+        origin: Tuple[float, float],
+        angle: float,
+        length: float,
+        start_time: int,
+        duration: int,
+        points: Optional[np.ndarray] = None
+    ) -> None:
+        """Добавляет волну.
+
+        Args:
+            origin: Начальная позиция волны (x, y)
+            angle: Угол направления волны в радианах
+            length: Длина границ конуса
+            start_time: Время запуска в миллисекундах
+            duration: Длительность волны в миллисекундах
+            points: Точки волны из сканера (сохраняются только при keep_points)
+        """
+        if self._count == self.capacity:
+            self._head = (self._head + 1) % self.capacity
+            self._count -= 1
+
+        row = (self._head + self._count) % self.capacity
+        self.origin[row] = origin
+        self.angle[row] = angle
+        self.length[row] = length
+        self.start_time[row] = start_time
+        self.duration[row] = duration
+        self.points[row] = points if self.keep_points else None
+        self._count += 1
+
+    def expire(self, current_time: int) -> None:
+        """Удаляет истекшие волны из головы кольца.
+
+        Args:
+            current_time: Текущее время в миллисекундах
+        """
+        while self._count:
+            head = self._head
+            if current_time - self.start_time[head] < self.duration[head]:
+                break
+            self.points[head] = None
+            self._head = (head + 1) % self.capacity
+            self._count -= 1
+
+    def clear(self) -> None:
+        """Удаляет все волны."""
+        self.points = [None] * self.capacity
+        self._head = 0
+        self._count = 0
+
+    def active(self, current_time: int) -> List[int]:
+        """Возвращает строки волн, которые еще отображаются.
+
+        Args:
+            current_time: Текущее время в миллисекундах
+
+        Returns:
+            List[int]: Индексы строк активных волн от старых к новым
+        """
+        rows = [(self._head + i) % self.capacity for i in range(self._count)]
+        return [
+            row for row in rows
+            if current_time - self.start_time[row] < self.duration[row]
+        ]
+
+    def bounds(self, row: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Вычисляет точки левой и правой границ конуса волны.
+
+        Args:
+            row: Индекс строки волны
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Точки границ, массивы (N, 2)
+        """
+        distances = np.arange(0, self.length[row], Config.DETECTOR_SCAN_STEP)
+        spread = math.radians(Config.DETECTOR_ANGLE_MIN)
+        result = []
+        for bound_angle in (self.angle[row] - spread, self.angle[row] + spread):
+            direction = np.array([math.cos(bound_angle), math.sin(bound_angle)])
+            result.append(self.origin[row] + distances[:, None] * direction)
+        return result[0], result[1]
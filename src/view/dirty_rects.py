@@ -0,0 +1,123 @@
+"""Учет измененных областей экрана.
+
+Этот модуль содержит класс DirtyRects, который собирает прямоугольники
+отрисованных элементов и выводит на дисплей только изменившиеся области
+через pygame.display.update вместо полного pygame.display.flip.
+"""
+
+import pygame
+from typing import Dict, Hashable, List, Optional, Tuple
+from src.config import Config
+
+
+class DirtyRects:
+    """Трекер измененных областей экрана для одного представления.
+
+    Каждый элемент за кадр сообщает свои прямоугольники под постоянным
+    ключом и, при желании, состояние - любое сравнимое значение,
+    от которого зависит его вид. Элемент без состояния считается
+    меняющимся каждый кадр. Измененной считается область элемента
+    на прошлом и на текущем кадре; элемент с тем же состоянием
+    и теми же прямоугольниками пропускается.
+
+    Если измененная площадь превышает долю max_ratio экрана, выводится
+    весь кадр. Весь кадр выводится и после invalidate(), и когда
+    до этого на дисплей выводило другое представление.
+
+    Attributes:
+        screen_rect (pygame.Rect): Область экрана
+        max_ratio (float): Доля площади экрана, начиная с которой
+                           выводится весь кадр
+    """
+
+    # трекер, который последним выводил кадр на дисплей
+    _presenter: Optional['DirtyRects'] = None
+
+    def __init__(
+        self,
+        screen_rect: pygame.Rect,
+        max_ratio: float = Config.DIRTY_RECT_MAX_RATIO
+    ) -> None:
+        """Создает пустой трекер.
+
+        Args:
+            screen_rect: Область экрана
+            max_ratio: Доля площади экрана для перехода к выводу всего кадра
+        """
+        self.screen_rect = pygame.Rect(screen_rect)
+        self.max_ratio = max_ratio
+        self._previous: Dict[str, Tuple[List[pygame.Rect], Optional[Hashable]]] = {}
+        self._current: Dict[str, Tuple[List[pygame.Rect], Optional[Hashable]]] = {}
+        self._full = True
+
+    def mark(
+        self,
+        key: str,
+        rect: Optional[pygame.Rect],
+        state: Optional[Hashable] = None
+    ) -> None:
+        """Запоминает прямоугольник элемента на текущем кадре.
+
+        Повторные вызовы с тем же ключом добавляют прямоугольники
+        к элементу; состояние берется из первого вызова.
+
+        Args:
+            key: Постоянный ключ элемента
+            rect: Отрисованный прямоугольник или None, если ничего не нарисовано
+            state: Состояние, от которого зависит вид элемента
+        """
+        rects, _ = self._current.setdefault(key, ([], state))
+        if rect is not None:
+            rects.append(pygame.Rect(rect))
+
+    def owns_display(self) -> bool:
+        """Проверяет, что последний кадр на дисплей выводил этот трекер.
+
+        Returns:
+            bool: True если дисплей показывает кадр этого представления
+        """
+        return DirtyRects._presenter is self
+
+    def invalidate(self) -> None:
+        """Требует вывести весь следующий кадр."""
+        self._full = True
+
+    def collect(self) -> Optional[List[pygame.Rect]]:
+        """Вычисляет измененные области текущего кадра.
+
+        Returns:
+            Optional[List[pygame.Rect]]: Измененные прямоугольники
+                                         или None, если нужно вывести весь кадр
+        """
+        if self._full or not self.owns_display():
+            return None
+
+        dirty = []
+        empty = ([], None)
+        for key in self._previous.keys() | self._current.keys():
+            old_rects, old_state = self._previous.get(key, empty)
+            new_rects, new_state = self._current.get(key, empty)
+            if new_state is not None and new_state == old_state and new_rects == old_rects:
+                continue
+            dirty.extend(old_rects)
+            dirty.extend(new_rects)
+
+        dirty = [rect.clip(self.screen_rect) for rect in dirty]
+        dirty = [rect for rect in dirty if rect.width and rect.height]
+        area = sum(rect.width * rect.height for rect in dirty)
+        if area > self.max_ratio * self.screen_rect.width * self.screen_rect.height:
+            return None
+        return dirty
+
+    def present(self) -> None:
+        """Выводит измененные области на дисплей и начинает новый кадр."""
+        dirty = self.collect()
+        if dirty is None:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
+
+        DirtyRects._presenter = self
+        self._previous = self._current
+        self._current = {}
+        self._full = False
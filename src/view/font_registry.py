@@ -0,0 +1,79 @@
+"""Общий реестр шрифтов и кэш отрисованного текста.
+
+Этот модуль содержит класс FontRegistry, через который все представления
+и элементы интерфейса получают шрифты и готовые поверхности с текстом.
+"""
+
+import pygame
+from collections import OrderedDict
+from typing import Dict, Sequence, Tuple
+from src.config import Config
+
+
+class FontRegistry:
+    """Реестр шрифтов на весь процесс и LRU-кэш отрисованного текста.
+
+    pygame.font.SysFont перебирает системные шрифты, поэтому каждый шрифт
+    создается один раз для пары (имя, размер). Поверхности текста хранятся
+    по ключу (имя, размер, текст, цвет) и вытесняются в порядке давности
+    использования. Поверхности из кэша общие: их можно только выводить,
+    но не изменять.
+    """
+
+    _fonts: Dict[Tuple[str, int], pygame.font.Font] = {}
+    _texts: 'OrderedDict[Tuple[str, int, str, Tuple[int, ...]], pygame.Surface]' = OrderedDict()
+
+    @staticmethod
+    def get(size: int, name: str = Config.FONT_NAME) -> pygame.font.Font:
+        """Возвращает шрифт, создавая его при первом обращении.
+
+        Args:
+            size: Размер шрифта
+            name: Имя системного шрифта
+
+        Returns:
+            pygame.font.Font: Шрифт
+        """
+        key = (name, size)
+        font = FontRegistry._fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(name, size)
+            FontRegistry._fonts[key] = font
+        return font
+
+    @staticmethod
+    def render(
+        text: str,
+        color: Sequence[int],
+        size: int,
+        name: str = Config.FONT_NAME
+    ) -> pygame.Surface:
+        """Возвращает сглаженную поверхность с текстом из кэша.
+
+        Args:
+            text: Текст
+            color: Цвет текста (RGB)
+            size: Размер шрифта
+            name: Имя системного шрифта
+
+        Returns:
+            pygame.Surface: Поверхность с текстом (только для вывода)
+        """
+        texts = FontRegistry._texts
+        key = (name, size, text, tuple(color))
+        surface = texts.get(key)
+        if surface is not None:
+            texts.move_to_end(key)
+            return surface
+
+        surface = FontRegistry.get(size, name).render(text, True, key[3])
+        texts[key] = surface
+        if len(texts) > Config.TEXT_CACHE_SIZE:
+            texts.popitem(last=False)
+        return surface
+
+    @staticmethod
+    def clear() -> None:
+        """Очищает кэш текста и реестр шрифтов."""
+        FontRegistry._texts.clear()
+        FontRegistry._fonts.clear()
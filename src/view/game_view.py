@@ -6,10 +6,14 @@
 
 import pygame
 import math
+import numpy as np
 from pygame import gfxdraw
 from src.config import Config
-from src.utils import normalize_color, center_text, draw_circle
-from typing import Dict, List, Tuple, Any
+from src.utils import normalize_color, center_text
+from src.view.dirty_rects import DirtyRects
+from src.view.font_registry import FontRegistry
+from src.view.sprite_cache import SpriteCache
+from typing import Dict, List, Optional, Tuple, Any
 
 
 class GameView:
@@ -25,7 +29,10 @@ class GameView:
         screen (pygame.Surface): Основная поверхность для отрисовки
         font (pygame.font.Font): Основной шрифт для UI
         font_large (pygame.font.Font): Крупный шрифт для заголовков
-        fog_surface (pygame.Surface): Поверхность для эффекта тумана
+        fog_surface (pygame.Surface): Поверхность для эффекта тумана; обновляются
+                                      только прямоугольники отверстия вокруг игрока
+        sprites (SpriteCache): Кэш спрайтов точек и частиц
+        dirty (DirtyRects): Трекер измененных областей экрана
         pulse_time (float): Время для пульсации эффектов
     """
     
@@ -36,16 +43,15 @@ class GameView:
             screen: Основная поверхность Pygame для отрисовки
         """
         self.screen = screen
+        self.sprites = SpriteCache()
+        self.dirty = DirtyRects(screen.get_rect())
         self._init_fonts()
         self._init_surfaces()
         
     def _init_fonts(self) -> None:
         """Инициализирует шрифты для интерфейса."""
-        self.font = pygame.font.SysFont(Config.FONT_NAME, Config.UI_FONT_SIZE)
-        self.font_large = pygame.font.SysFont(
-            Config.FONT_NAME, 
-            Config.SETTINGS_FONT_SIZE
-        )
+        self.font = FontRegistry.get(Config.UI_FONT_SIZE)
+        self.font_large = FontRegistry.get(Config.SETTINGS_FONT_SIZE)
         
     def _init_surfaces(self) -> None:
         """Инициализирует поверхности для специальных эффектов."""
@@ -57,16 +63,36 @@ class GameView:
         self.pulse_time = 0.0
         self.fog_surface.fill((0, 0, 0, Config.FOG_ALPHA))
         
+        # штамп отверстия в тумане и его положение на прошлом кадре
+        self._fog_stamp = pygame.Surface((0, 0), pygame.SRCALPHA)
+        self._fog_stamp_radius = -1
+        self._fog_hole = pygame.Rect(0, 0, 0, 0)
+        
+        # цвет фона под туманом и прямоугольники, нарисованные за кадр
+        self._fogged_background = self._blend_fog(Config.DARK)
+        self._world_rects: List[pygame.Rect] = []
+        
+        # кэшированные слои: кадры пульсации выхода, путь и панель кнопок
+        self._exit_frames: List[pygame.Surface] = []
+        self._exit_style: Optional[Tuple[Tuple[int, ...], int]] = None
+        self._path_layer = pygame.Surface((0, 0))
+        self._path_source: Optional[List[Tuple[int, int]]] = None
+        self._path_style: Optional[Tuple[Tuple[int, ...], int]] = None
+        self._path_origin = (0, 0)
+        self._path_rects: List[pygame.Rect] = []
+        self._ui_bar, self._ui_bar_pos = self._render_ui_bar()
+        
     def draw(self, game_state: Dict[str, Any]) -> None:
         """Основной метод отрисовки игрового состояния.
         
         Args:
             game_state: Словарь с текущим состоянием игры
         """
+        self.sprites.sync(game_state['colors'])
         self._clear_screen(Config.DARK)
         self._draw_game_world(game_state)
         self._draw_ui(game_state)
-        pygame.display.flip()
+        self.dirty.present()
         self.pulse_time += Config.PULSE_SPEED
         
     def _clear_screen(self, bg_color: Tuple[int, int, int]) -> None:
@@ -83,6 +109,8 @@ class GameView:
         Args:
             game_state: Словарь с текущим состоянием игры
         """
+        self._world_rects = []
+        
         # путь к выходу (если включено)
         if game_state['show_path']:
             self._draw_path(
@@ -92,40 +120,48 @@ class GameView:
             )
             
         # эффекты и объекты
-        self._create_fog(game_state['player'].pos, game_state['fog_radius'])
+        self._create_fog(game_state['player_pos'], game_state['fog_radius'])
         self._draw_particles(game_state['particles'])
-        self._draw_player(game_state['player'], game_state['colors']['player'])
+        self._draw_player(
+            game_state['player'], 
+            game_state['player_pos'], 
+            game_state['colors']['player']
+        )
         self._draw_exit(
-            game_state['maze'], 
+            game_state['grid'], 
             game_state['cell_size'], 
             game_state['colors']['exit']
         )
         
         # точки локатора
         self._draw_points(
+            'locator', 
             game_state['locator_points'], 
             game_state['colors']['locator'], 
             Config.LOCATOR_PULSE_FACTOR, 
             Config.LOCATOR_BASE_RADIUS,
-            game_state['point_lifetime']
+            game_state['point_lifetime'],
+            game_state['current_time']
         )
         
         # точки и волны детектора
         self._draw_points(
+            'detector', 
             game_state['detector_points'], 
             game_state['colors']['detector'], 
             Config.DETECTOR_PULSE_FACTOR, 
             Config.DETECTOR_BASE_RADIUS,
-            game_state['point_lifetime']
+            game_state['point_lifetime'],
+            game_state['current_time']
         )
         self._draw_detector_waves(
             game_state['detector_lines'], 
-            game_state['colors']['detector']
+            game_state['colors']['detector'],
+            game_state['current_time']
         )
         
         # туман
-        if self.fog_surface:
-            self.screen.blit(self.fog_surface, (0, 0))
+        self._apply_fog()
             
     def _draw_ui(self, game_state: Dict[str, Any]) -> None:
         """Отрисовывает элементы пользовательского интерфейса.
@@ -141,20 +177,90 @@ class GameView:
         player_pos: Tuple[float, float], 
         fog_radius: int
     ) -> None:
-        """Создает эффект тумана войны вокруг игрока.
+        """Переносит отверстие в тумане к текущей позиции игрока.
+        
+        Меняются только два прямоугольника поверхности тумана: старое
+        отверстие закрашивается туманом, на новое место ставится штамп.
         
         Args:
             player_pos: Позиция игрока (x, y)
             fog_radius: Радиус видимости вокруг игрока
         """
-        self.fog_surface.fill((0, 0, 0, Config.FOG_ALPHA))
-        gfxdraw.filled_circle(
-            self.fog_surface, 
-            int(player_pos[0]), 
-            int(player_pos[1]), 
-            fog_radius, 
-            (0, 0, 0, 0)
-        )
+        stamp = self._get_fog_stamp(fog_radius)
+        hole = stamp.get_rect(center=(int(player_pos[0]), int(player_pos[1])))
+        self.dirty.mark('fog', hole, tuple(hole))
+        if hole == self._fog_hole:
+            return
+            
+        self.fog_surface.fill((0, 0, 0, Config.FOG_ALPHA), self._fog_hole)
+        self.fog_surface.blit(stamp, hole, special_flags=pygame.BLEND_RGBA_MIN)
+        self._fog_hole = hole
+        
+    def _get_fog_stamp(self, fog_radius: int) -> pygame.Surface:
+        """Возвращает штамп отверстия в тумане, перестраивая его при смене радиуса.
+        
+        Args:
+            fog_radius: Радиус видимости вокруг игрока
+            
+        Returns:
+            pygame.Surface: Квадрат тумана с прозрачным кругом в центре
+        """
+        if fog_radius == self._fog_stamp_radius:
+            return self._fog_stamp
+            
+        size = fog_radius * 2 + 1
+        stamp = pygame.Surface((size, size), pygame.SRCALPHA)
+        stamp.fill((0, 0, 0, Config.FOG_ALPHA))
+        
+        edge = Config.FOG_SOFT_EDGE
+        if edge > 0:
+            # мягкий край: туман нарастает от radius - edge до radius
+            offsets = np.arange(size) - fog_radius
+            distance = np.hypot(offsets[:, None], offsets[None, :])
+            density = np.clip((distance - (fog_radius - edge)) / edge, 0, 1)
+            alpha = pygame.surfarray.pixels_alpha(stamp)
+            alpha[:] = (density * Config.FOG_ALPHA).astype(np.uint8)
+            del alpha
+        else:
+            gfxdraw.filled_circle(stamp, fog_radius, fog_radius, fog_radius, (0, 0, 0, 0))
+            
+        self._fog_stamp = stamp
+        self._fog_stamp_radius = fog_radius
+        return stamp
+        
+    def _apply_fog(self) -> None:
+        """Накладывает туман на экран.
+        
+        Туман смешивается с экраном только в прямоугольнике, охватывающем
+        отверстие и все нарисованное за кадр. Снаружи на экране только фон,
+        поэтому там он закрашивается заранее смешанным цветом фона под туманом.
+        """
+        screen_rect = self.screen.get_rect()
+        area = self._fog_hole.unionall(self._world_rects).clip(screen_rect)
+        self.screen.blit(self.fog_surface, area, area)
+        
+        outside = [
+            (0, 0, screen_rect.width, area.top),
+            (0, area.bottom, screen_rect.width, screen_rect.height - area.bottom),
+            (0, area.top, area.left, area.height),
+            (area.right, area.top, screen_rect.width - area.right, area.height)
+        ]
+        for rect in outside:
+            self.screen.fill(self._fogged_background, rect)
+            
+    def _blend_fog(self, color: Tuple[int, int, int]) -> Tuple[int, int, int]:
+        """Вычисляет цвет, который получается под туманом.
+        
+        Args:
+            color: Цвет фона (RGB)
+            
+        Returns:
+            Tuple[int, int, int]: Цвет фона, смешанный с туманом
+        """
+        pixel = pygame.Surface((1, 1))
+        pixel.fill(color)
+        pixel.blit(self.fog_surface, (0, 0), (0, 0, 1, 1))
+        return tuple(pixel.get_at((0, 0)))[:3]
         
     def _draw_path(
         self, 
@@ -164,6 +270,9 @@ class GameView:
     ) -> None:
         """Отрисовывает путь к выходу.
         
+        Путь ищется асинхронно, поэтому здесь рисуется последний готовый
+        путь, пока модель не получит новый.
+        
         Args:
             path: Список точек пути
             cell_size: Размер ячейки лабиринта
@@ -172,101 +281,143 @@ class GameView:
         if not path:
             return
             
-        for i in range(len(path) - 1):
-            # координаты начала и конца сегмента пути
-            start = (
-                path[i][0] * cell_size + cell_size // 2,
-                path[i][1] * cell_size + cell_size // 2
-            )
-            end = (
-                path[i+1][0] * cell_size + cell_size // 2,
-                path[i+1][1] * cell_size + cell_size // 2
-            )
+        style = (tuple(color), cell_size)
+        if path is not self._path_source or style != self._path_style:
+            self._render_path_layer(path, cell_size, color)
+            self._path_source = path
+            self._path_style = style
+            
+        self.screen.blit(self._path_layer, self._path_origin)
+        for rect in self._path_rects:
+            self._mark('path', rect, self._path_layer)
             
+    def _render_path_layer(
+        self, 
+        path: List[Tuple[int, int]], 
+        cell_size: int, 
+        color: Tuple[int, int, int]
+    ) -> None:
+        """Рисует путь в отдельный слой, охватывающий только путь.
+        
+        Слой использует прозрачный цветовой ключ с RLE-сжатием, поэтому
+        пустые участки между линиями при выводе пропускаются.
+        
+        Args:
+            path: Список точек пути
+            cell_size: Размер ячейки лабиринта
+            color: Цвет пути (RGB)
+        """
+        half = cell_size // 2
+        pad = Config.PATH_LINE_WIDTH
+        centers = [(x * cell_size + half, y * cell_size + half) for x, y in path]
+        xs = [x for x, _ in centers]
+        ys = [y for _, y in centers]
+        left, top = min(xs) - pad, min(ys) - pad
+        
+        # цвет ключа гарантированно отличается от цвета пути
+        key = tuple(255 - channel for channel in color[:3])
+        layer = pygame.Surface((max(xs) - left + pad + 1, max(ys) - top + pad + 1))
+        layer.fill(key)
+        
+        self._path_rects = []
+        for (x1, y1), (x2, y2) in zip(centers, centers[1:]):
             # линия между точками
-            pygame.draw.line(
-                self.screen, 
+            rect = pygame.draw.line(
+                layer, 
                 normalize_color(color), 
-                start, 
-                end, 
+                (x1 - left, y1 - top), 
+                (x2 - left, y2 - top), 
                 Config.PATH_LINE_WIDTH
             )
+            self._path_rects.append(rect.move(left, top))
+            
+        layer.set_colorkey(key, pygame.RLEACCEL)
+        self._path_layer = layer
+        self._path_origin = (left, top)
             
     def _draw_points(
         self, 
-        points: List[Tuple[float, float, int]], 
+        key: str, 
+        points: Any, 
         base_color: Tuple[int, int, int], 
         pulse_factor: float, 
         base_radius: int,
-        point_lifetime: int
+        point_lifetime: int,
+        current_time: int
     ) -> None:
         """Отрисовывает точки с эффектом пульсации.
         
         Args:
-            points: Список точек (x, y, время создания)
+            key: Ключ слоя в трекере измененных областей
+            points: Буфер точек (PointBuffer)
             base_color: Базовый цвет точек (RGB)
             pulse_factor: Фактор пульсации
             base_radius: Базовый радиус точек
             point_lifetime: Время жизни точек в миллисекундах
+            current_time: Текущее время модели в миллисекундах
         """
-        current_time = pygame.time.get_ticks()
-        
-        for point in points:
-            x, y, t = point
-            age = (current_time - t) / point_lifetime
+        if not len(points):
+            return
             
-            # пропуск устаревших точек
-            if age >= 1.0:
-                continue
-                
-            # рачсет прозрачности и радиуса с пульсацией
-            alpha = int(255 * (1 - age))
-            pulse = math.sin(self.pulse_time) * pulse_factor
-            radius = int(base_radius + pulse)
-            color = normalize_color(base_color, alpha)
+        xs, ys, times = points.view()
+        age = (current_time - times) / point_lifetime
+        
+        # пропуск устаревших точек
+        fresh = age < 1.0
             
-            # сама точка
-            draw_circle(self.screen, x, y, radius, color)
+        # рачсет прозрачности и радиуса с пульсацией
+        pulse = math.sin(self.pulse_time) * pulse_factor
+        radius = int(base_radius + pulse)
+        
+        self._mark(key, self.sprites.draw_circles(
+            self.screen,
+            xs[fresh],
+            ys[fresh],
+            base_color,
+            radius,
+            255 * (1 - age[fresh])
+        ))
             
-    def _draw_particles(self, particles: List[Any]) -> None:
+    def _draw_particles(self, particles: Any) -> None:
         """Отрисовывает все частицы.
         
         Args:
-            particles: Список объектов частиц
+            particles: Пул частиц (ParticleSystem)
         """
-        for p in particles:
-            p.draw(self.screen)
+        self._mark('particles', self.sprites.draw_particles(self.screen, particles))
             
     def _draw_player(
         self, 
         player: Any, 
+        pos: Tuple[float, float], 
         base_color: Tuple[int, int, int]
     ) -> None:
         """Отрисовывает игрока в виде треугольника.
         
         Args:
             player: Объект игрока
+            pos: Позиция игрока для отрисовки (x, y)
             base_color: Базовый цвет игрока (RGB)
         """
         mouse_pos = pygame.mouse.get_pos()
         angle = math.atan2(
-            mouse_pos[1] - player.pos[1], 
-            mouse_pos[0] - player.pos[0]
+            mouse_pos[1] - pos[1], 
+            mouse_pos[0] - pos[0]
         )
         
         # рассчет вершин треугольника
         points = [
             (
-                player.pos[0] + math.cos(angle) * player.radius * Config.PLAYER_DIRECTION_SIZE,
-                player.pos[1] + math.sin(angle) * player.radius * Config.PLAYER_DIRECTION_SIZE
+                pos[0] + math.cos(angle) * player.radius * Config.PLAYER_DIRECTION_SIZE,
+                pos[1] + math.sin(angle) * player.radius * Config.PLAYER_DIRECTION_SIZE
             ),
             (
-                player.pos[0] + math.cos(angle + Config.PLAYER_WING_ANGLE) * player.radius * Config.PLAYER_WING_SIZE,
-                player.pos[1] + math.sin(angle + Config.PLAYER_WING_ANGLE) * player.radius * Config.PLAYER_WING_SIZE
+                pos[0] + math.cos(angle + Config.PLAYER_WING_ANGLE) * player.radius * Config.PLAYER_WING_SIZE,
+                pos[1] + math.sin(angle + Config.PLAYER_WING_ANGLE) * player.radius * Config.PLAYER_WING_SIZE
             ),
             (
-                player.pos[0] + math.cos(angle - Config.PLAYER_WING_ANGLE) * player.radius * Config.PLAYER_WING_SIZE,
-                player.pos[1] + math.sin(angle - Config.PLAYER_WING_ANGLE) * player.radius * Config.PLAYER_WING_SIZE
+                pos[0] + math.cos(angle - Config.PLAYER_WING_ANGLE) * player.radius * Config.PLAYER_WING_SIZE,
+                pos[1] + math.sin(angle - Config.PLAYER_WING_ANGLE) * player.radius * Config.PLAYER_WING_SIZE
             )
         ]
         
@@ -280,116 +431,166 @@ class GameView:
             gfxdraw.filled_polygon(self.screen, points, color)
         except Exception:
             pygame.draw.polygon(self.screen, color[:3], points)
+        
+        xs = [int(px) for px, _ in points]
+        ys = [int(py) for _, py in points]
+        self._mark('player', pygame.Rect(
+            min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1
+        ), (tuple(points), color))
             
     def _draw_exit(
         self, 
-        maze: List[List[int]], 
+        grid: Any, 
         cell_size: int, 
         base_color: Tuple[int, int, int]
     ) -> None:
         """Отрисовывает выход из лабиринта.
         
         Args:
-            maze: Матрица лабиринта
+            grid: Сетка лабиринта
             cell_size: Размер ячейки лабиринта
             base_color: Базовый цвета выхода (RGB)
         """
-        for y in range(len(maze)):
-            for x in range(len(maze[0])):
-                if maze[y][x] == 2:  # 2 это идентификатор выхода
-                    exit_rect = pygame.Rect(
-                        x * cell_size, 
-                        y * cell_size, 
-                        cell_size, 
-                        cell_size
-                    )
-                    
-                    # основной прямоугольник выхода
-                    pygame.draw.rect(
-                        self.screen, 
-                        normalize_color(base_color), 
-                        exit_rect
-                    )
-                    
-                    # пульсирующий эффект свечения
-                    pulse = math.sin(self.pulse_time) * Config.EXIT_PULSE_SIZE
-                    pygame.draw.rect(
-                        self.screen, 
-                        normalize_color(base_color, Config.EXIT_GLOW_ALPHA), 
-                        exit_rect.inflate(pulse * 2, pulse * 2)
-                    )
-                    
-    def _draw_detector_waves(
+        if grid.exit_pos is None:
+            return
+            
+        frames = self._get_exit_frames(cell_size, base_color)
+        
+        # номер кадра - величина, на которую пульсация расширяет выход
+        span = Config.EXIT_PULSE_SIZE * 2
+        pulse = math.sin(self.pulse_time) * Config.EXIT_PULSE_SIZE
+        frame = int(pulse * 2) + span
+        
+        x, y = grid.exit_pos
+        offset = span // 2
+        self._mark('exit', self.screen.blit(
+            frames[frame], 
+            (x * cell_size - offset, y * cell_size - offset)
+        ), frame)
+        
+    def _get_exit_frames(
         self, 
-        waves: List[Dict[str, Any]], 
+        cell_size: int, 
         base_color: Tuple[int, int, int]
-    ) -> None:
-        """Отрисовывает волны детектора.
+    ) -> List[pygame.Surface]:
+        """Возвращает кадры пульсации выхода, перерисовывая их при смене стиля.
         
         Args:
-            waves: Список волн детектора
-            base_color: Базовый цвет детектора (RGB)
+            cell_size: Размер ячейки лабиринта
+            base_color: Базовый цвет выхода (RGB)
+            
+        Returns:
+            List[pygame.Surface]: Кадры для расширения от -span до span пикселей
         """
-        current_time = pygame.time.get_ticks()
-        
-        for wave in waves:
-            # проверка, активна ли еще волна
-            if current_time - wave['start_time'] < wave['duration']:
-                self._draw_wave_points(wave, base_color, current_time)
-                self._draw_wave_lines(wave, base_color, current_time)
-                
-    def _draw_wave_points(
+        style = (tuple(base_color), cell_size)
+        if style == self._exit_style:
+            return self._exit_frames
+            
+        span = Config.EXIT_PULSE_SIZE * 2
+        area = pygame.Rect(0, 0, cell_size, cell_size).inflate(span, span)
+        exit_rect = pygame.Rect(-area.x, -area.y, cell_size, cell_size)
+        
+        # экран без альфа-канала, поэтому свечение на нем было непрозрачным;
+        # кадры сохраняют этот вид
+        color = normalize_color(base_color)
+        frames = []
+        for amount in range(-span, span + 1):
+            frame = pygame.Surface(area.size, pygame.SRCALPHA)
+            pygame.draw.rect(frame, color, exit_rect)
+            pygame.draw.rect(frame, color, exit_rect.inflate(amount, amount))
+            if pygame.display.get_surface() is not None:
+                frame = frame.convert_alpha()
+            frames.append(frame)
+            
+        self._exit_frames = frames
+        self._exit_style = style
+        return frames
+                    
+    def _draw_detector_waves(
         self, 
-        wave: Dict[str, Any], 
-        base_color: Tuple[int, int, int], 
+        waves: Any, 
+        base_color: Tuple[int, int, int],
         current_time: int
     ) -> None:
-        """Отрисовывает точки волны детектора.
+        """Отрисовывает волны детектора.
         
         Args:
-            wave: Данные волны детектора
-            base_color: Базовый цвет (RGB)
-            current_time: Текущее время в миллисекундах
+            waves: Хранилище волн детектора (WaveStore)
+            base_color: Базовый цвет детектора (RGB)
+            current_time: Текущее время модели в миллисекундах
         """
-        for point in wave['left_bound'] + wave['right_bound']:
-            x, y, t = point
-            # прозрачность на основе оставшегося времени
-            alpha = int(Config.DETECTOR_ALPHA * 
-                       (1 - (current_time - t) / wave['duration']))
-            color = normalize_color(base_color, alpha)
-            draw_circle(self.screen, x, y, Config.DETECTOR_POINT_SIZE, color)
+        bound_points, alphas = [], []
+        for row in waves.active(current_time):
+            # доля оставшегося времени волны
+            remaining = 1 - (current_time - waves.start_time[row]) / waves.duration[row]
+            left_bound, right_bound = waves.bounds(row)
+            
+            self._draw_wave_lines(left_bound, right_bound, base_color, remaining)
+            for bound in (left_bound, right_bound):
+                bound_points.append(bound)
+                alphas.append(np.full(len(bound), Config.DETECTOR_ALPHA * remaining))
+        
+        # точки границ всех активных волн одним слоем
+        if bound_points:
+            points = np.concatenate(bound_points)
+            self._mark('waves', self.sprites.draw_circles(
+                self.screen,
+                points[:, 0],
+                points[:, 1],
+                base_color,
+                Config.DETECTOR_POINT_SIZE,
+                np.concatenate(alphas)
+            ))
             
     def _draw_wave_lines(
         self, 
-        wave: Dict[str, Any], 
+        left_bound: np.ndarray, 
+        right_bound: np.ndarray, 
         base_color: Tuple[int, int, int], 
-        current_time: int
+        remaining: float
     ) -> None:
-        """Отрисовывает линии волны детектора.
+        """Отрисовывает линии границ волны детектора.
+        
+        Все точки границы созданы одновременно и лежат на одном луче,
+        поэтому граница рисуется одной линией от первой точки до последней.
         
         Args:
-            wave: Данные волны детектора
+            left_bound: Точки левой границы (N, 2)
+            right_bound: Точки правой границы (N, 2)
             base_color: Базовый цвет (RGB)
-            current_time: Текущее время в миллисекундах
+            remaining: Доля оставшегося времени волны
         """
-        for bound in [wave['left_bound'], wave['right_bound']]:
-            for i in range(len(bound) - 1):
-                x1, y1, t1 = bound[i]
-                x2, y2, _ = bound[i+1]
-                
-                # прозрачность линии
-                alpha = int(Config.DETECTOR_LINE_ALPHA * 
-                           (1 - (current_time - t1) / wave['duration']))
-                color = normalize_color(base_color, alpha)
+        # прозрачность линии
+        alpha = int(Config.DETECTOR_LINE_ALPHA * remaining)
+        color = normalize_color(base_color, alpha)
+        
+        for bound in (left_bound, right_bound):
+            if len(bound) < 2:
+                continue
+            self._mark('waves', pygame.draw.line(
+                self.screen, 
+                color, 
+                bound[0].tolist(), 
+                bound[-1].tolist(), 
+                Config.DETECTOR_LINE_WIDTH
+            ))
                 
-                # линия между точками
-                pygame.draw.line(
-                    self.screen, 
-                    color, 
-                    (x1, y1), 
-                    (x2, y2), 
-                    Config.DETECTOR_LINE_WIDTH
-                )
+    def _mark(
+        self, 
+        key: str, 
+        rect: Optional[pygame.Rect], 
+        state: Optional[Any] = None
+    ) -> None:
+        """Запоминает прямоугольник, нарисованный в игровом мире за кадр.
+        
+        Args:
+            key: Ключ элемента в трекере измененных областей
+            rect: Прямоугольник или None, если ничего не нарисовано
+            state: Состояние, от которого зависит вид элемента
+        """
+        self.dirty.mark(key, rect, state)
+        if rect is not None:
+            self._world_rects.append(rect)
                 
     def _draw_game_status(self, game_won: bool, game_over: bool) -> None:
         """Отрисовывает статус игры (победа/поражение).
@@ -399,45 +600,60 @@ class GameView:
             game_over: Флаг поражения в игре
         """
         if game_won:
-            text = self.font_large.render(
+            text = FontRegistry.render(
                 "ТЫ ПОБЕДИЛ!", 
-                True, 
-                Config.GREEN
+                Config.GREEN, 
+                Config.SETTINGS_FONT_SIZE
             )
-            self._draw_centered_text(text)
+            self.dirty.mark('status', self._draw_centered_text(text), 'won')
         elif game_over:
-            text = self.font_large.render(
+            text = FontRegistry.render(
                 "ИГРА ОКОНЧЕНА", 
-                True, 
-                Config.RED
+                Config.RED, 
+                Config.SETTINGS_FONT_SIZE
             )
-            self._draw_centered_text(text)
+            self.dirty.mark('status', self._draw_centered_text(text), 'lost')
             
-    def _draw_centered_text(self, text_surface: pygame.Surface) -> None:
+    def _draw_centered_text(self, text_surface: pygame.Surface) -> pygame.Rect:
         """Отрисовывает текст по центру экрана.
         
         Args:
             text_surface: Поверхность с текстом
+            
+        Returns:
+            pygame.Rect: Отрисованная область
         """
-        self.screen.blit(text_surface, center_text(self.screen, text_surface))
+        return self.screen.blit(text_surface, center_text(self.screen, text_surface))
         
     def _draw_ui_buttons(self) -> None:
         """Отрисовывает кнопки пользовательского интерфейса."""
+        self.dirty.mark('ui', self.screen.blit(self._ui_bar, self._ui_bar_pos), 'ui')
+        
+    def _render_ui_bar(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Рисует панель кнопок интерфейса в отдельную поверхность.
+        
+        Returns:
+            Tuple[pygame.Surface, Tuple[int, int]]: Панель и ее позиция на экране
+        """
         buttons = [
             (10, 10, 100, 30, "Рестарт"),
             (120, 10, 100, 30, "Меню"),
             (230, 10, 100, 30, "Путь")
         ]
         
+        area = pygame.Rect(buttons[0][:4]).unionall([pygame.Rect(b[:4]) for b in buttons])
+        bar = pygame.Surface(area.size, pygame.SRCALPHA)
+        
         for x, y, w, h, text in buttons:
-            rect = pygame.Rect(x, y, w, h)
-            pygame.draw.rect(self.screen, Config.WHITE, rect)
+            rect = pygame.Rect(x - area.x, y - area.y, w, h)
+            pygame.draw.rect(bar, Config.WHITE, rect)
             
-            text_surface = self.font.render(text, True, Config.BLACK)
-            self.screen.blit(
+            text_surface = FontRegistry.render(text, Config.BLACK, Config.UI_FONT_SIZE)
+            bar.blit(
                 text_surface, 
                 (
                     rect.centerx - text_surface.get_width() // 2,
                     rect.centery - text_surface.get_height() // 2
                 )
-            )
\ No newline at end of file
+            )
+        return bar, area.topleft
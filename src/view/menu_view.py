@@ -6,8 +6,10 @@
 
 import pygame
 from src.config import Config
+from src.view.dirty_rects import DirtyRects
+from src.view.font_registry import FontRegistry
 from src.view.ui_elements import Button, Slider, ColorPicker
-from typing import List, Tuple, Dict, Optional
+from typing import Any, List, Set, Tuple, Dict, Optional
 
 
 class MenuView:
@@ -18,12 +20,19 @@ class MenuView:
     - Отрисовку меню настроек с элементами управления
     - Визуализацию информации об инструментах игры
     
+    Меню отрисовывается с сохранением состояния: фон с заголовком
+    и статичным текстом рисуется один раз на экран меню, а элементы
+    интерфейса перерисовываются только по своему флагу dirty, поверх
+    восстановленного участка фона. Если ничего не изменилось,
+    кадр не рисуется и не выводится.
+    
     Attributes:
         screen (pygame.Surface): Основная поверхность для отрисовки
         title_font (pygame.font.Font): Шрифт для заголовков
         settings_font (pygame.font.Font): Шрифт для заголовка настроек
         ui_font (pygame.font.Font): Шрифт для элементов интерфейса
         info_font (pygame.font.Font): Шрифт для информационных текстов
+        dirty (DirtyRects): Трекер измененных областей экрана
     """
     
     def __init__(self, screen: pygame.Surface) -> None:
@@ -33,22 +42,17 @@ class MenuView:
             screen: Основная поверхность Pygame для отрисовки
         """
         self.screen = screen
-        self.title_font = pygame.font.SysFont(
-            Config.FONT_NAME, 
-            Config.TITLE_FONT_SIZE
-        )
-        self.settings_font = pygame.font.SysFont(
-            Config.FONT_NAME, 
-            Config.SETTINGS_FONT_SIZE
-        )
-        self.ui_font = pygame.font.SysFont(
-            Config.FONT_NAME, 
-            Config.UI_FONT_SIZE
-        )
-        self.info_font = pygame.font.SysFont(
-            Config.FONT_NAME, 
-            Config.INFO_FONT_SIZE
-        )
+        self.dirty = DirtyRects(screen.get_rect())
+        self.title_font = FontRegistry.get(Config.TITLE_FONT_SIZE)
+        self.settings_font = FontRegistry.get(Config.SETTINGS_FONT_SIZE)
+        self.ui_font = FontRegistry.get(Config.UI_FONT_SIZE)
+        self.info_font = FontRegistry.get(Config.INFO_FONT_SIZE)
+        
+        # фоны экранов меню, показанный экран и области элементов на нем
+        self._backgrounds: Dict[str, pygame.Surface] = {}
+        self._page: Optional[Tuple[str, bool]] = None
+        self._drawn: Dict[str, pygame.Rect] = {}
+        self._versions: Dict[str, int] = {}
 
     def draw(
         self, 
@@ -60,8 +64,8 @@ class MenuView:
         active_picker: Optional[ColorPicker], 
         color_sliders: List[Slider], 
         colors: Dict[str, Tuple[int, int, int]]
-    ) -> None:
-        """Отрисовывает текущее состояние меню.
+    ) -> bool:
+        """Отрисовывает изменения в текущем состоянии меню.
         
         Args:
             current_menu: Текущее активное меню ('main' или 'settings')
@@ -72,39 +76,148 @@ class MenuView:
             active_picker: Активный цветовой пикер (если есть)
             color_sliders: Слайдеры RGB компонентов
             colors: Словарь цветов (не используется)
+            
+        Returns:
+            bool: True если кадр был отрисован, False если ничего не изменилось
         """
         if current_menu == "main":
-            self._draw_main_menu(main_buttons)
-        elif current_menu == "settings":
-            self._draw_settings_menu(
+            widgets = self._main_menu_widgets(main_buttons)
+        else:
+            widgets = self._settings_menu_widgets(
                 settings_sliders, 
                 color_pickers, 
                 settings_buttons, 
                 active_picker, 
                 color_sliders
             )
+        
+        # экран меню рисуется целиком при его смене, при появлении
+        # RGB слайдеров и после того, как дисплей занимало другое представление
+        page = (current_menu, active_picker is not None)
+        full = page != self._page or not self.dirty.owns_display()
+        background = self._get_background(current_menu)
+        if full:
+            self.screen.blit(background, (0, 0))
+            self._page = page
+            redraw = {key for key, _ in widgets}
+        else:
+            redraw = self._damaged(widgets)
+            for key in redraw:
+                self.screen.blit(background, self._drawn[key], self._drawn[key])
+                
+        for key, widget in widgets:
+            if key in redraw:
+                self._drawn[key] = widget.draw(self.screen)
+                self._versions[key] = self._versions.get(key, 0) + 1
+            self.dirty.mark(key, self._drawn[key], self._versions[key])
             
-        pygame.display.flip()
+        if not redraw:
+            return False
+            
+        self.dirty.mark('background', self.screen.get_rect(), page)
+        self.dirty.present()
+        return True
     
-    def _draw_main_menu(self, main_buttons: List[Button]) -> None:
-        """Отрисовывает главное меню.
+    def _damaged(self, widgets: List[Tuple[str, Any]]) -> Set[str]:
+        """Находит элементы, которые нужно перерисовать.
+        
+        Кроме элементов с флагом dirty перерисовываются и те, что
+        перекрываются с ними (подписи пикеров заходят на соседние),
+        иначе восстановленный фон стер бы часть соседа.
+        
+        Args:
+            widgets: Ключи и элементы интерфейса текущего экрана
+            
+        Returns:
+            Set[str]: Ключи элементов для перерисовки
+        """
+        redraw = {key for key, widget in widgets if widget.dirty}
+        pending = list(redraw)
+        while pending:
+            area = self._drawn[pending.pop()]
+            for key, _ in widgets:
+                if key not in redraw and self._drawn[key].colliderect(area):
+                    redraw.add(key)
+                    pending.append(key)
+        return redraw
+
+    def _main_menu_widgets(self, main_buttons: List[Button]) -> List[Tuple[str, Any]]:
+        """Возвращает элементы главного меню в порядке отрисовки.
         
         Args:
             main_buttons: Список кнопок главного меню
+            
+        Returns:
+            List[Tuple[str, Any]]: Ключи и элементы интерфейса
         """
-        self.screen.fill(Config.DARK)
+        return [(f'button:{button.text}', button) for button in main_buttons]
+
+    def _settings_menu_widgets(
+        self, 
+        settings_sliders: List[Slider], 
+        color_pickers: List[ColorPicker], 
+        settings_buttons: List[Button], 
+        active_picker: Optional[ColorPicker], 
+        color_sliders: List[Slider]
+    ) -> List[Tuple[str, Any]]:
+        """Возвращает элементы меню настроек в порядке отрисовки.
+        
+        Args:
+            settings_sliders: Слайдеры настроек
+            color_pickers: Цветовые пикеры
+            settings_buttons: Кнопки меню настроек
+            active_picker: Активный цветовой пикер
+            color_sliders: Слайдеры RGB компонентов
+            
+        Returns:
+            List[Tuple[str, Any]]: Ключи и элементы интерфейса
+        """
+        widgets: List[Tuple[str, Any]] = []
+        widgets += [(f'slider:{slider.text}', slider) for slider in settings_sliders]
+        widgets += [(f'picker:{picker.text}', picker) for picker in color_pickers]
+
+        # если есть активный пикер, отрисовываем RGB слайдеры
+        if active_picker:
+            widgets += [(f'component:{slider.text}', slider) for slider in color_sliders]
+
+        widgets += [(f'button:{button.text}', button) for button in settings_buttons]
+        return widgets
+
+    def _get_background(self, current_menu: str) -> pygame.Surface:
+        """Возвращает фон экрана меню, отрисовывая его при первом обращении.
+        
+        Args:
+            current_menu: Текущее активное меню ('main' или 'settings')
+            
+        Returns:
+            pygame.Surface: Фон с заголовком и статичным текстом
+        """
+        background = self._backgrounds.get(current_menu)
+        if background is None:
+            background = pygame.Surface(self.screen.get_size())
+            if current_menu == "main":
+                self._draw_main_background(background)
+            else:
+                self._draw_settings_background(background)
+            self._backgrounds[current_menu] = background
+        return background
+
+    def _draw_main_background(self, surface: pygame.Surface) -> None:
+        """Отрисовывает фон главного меню.
+        
+        Args:
+            surface: Поверхность для отрисовки
+        """
+        surface.fill(Config.DARK)
         
         # заголовок
-        title = self.title_font.render("Sombre Maze", True, Config.WHITE)
+        title = FontRegistry.render("Sombre Maze", Config.WHITE, Config.TITLE_FONT_SIZE)
         title_rect = title.get_rect(center=(Config.WIDTH // 2, 100))
-        self.screen.blit(title, title_rect)
-
-        # кнопки
-        for button in main_buttons:
-            button.draw(self.screen)
+        surface.blit(title, title_rect)
         
         # информация о локаторе (слева главного экрана меню)
         self._draw_tool_info(
+            surface,
             x=50,
             y=500,
             title="Локатор (ЛКМ)",
@@ -120,6 +233,7 @@ class MenuView:
         
         # информация о детекторе (справа главного экрана меню)
         self._draw_tool_info(
+            surface,
             x=Config.WIDTH - 450,
             y=500,
             title="Детектор (ПКМ)",
@@ -132,48 +246,22 @@ class MenuView:
             color=Config.RED
         )
 
-    def _draw_settings_menu(
-        self, 
-        settings_sliders: List[Slider], 
-        color_pickers: List[ColorPicker], 
-        settings_buttons: List[Button], 
-        active_picker: Optional[ColorPicker], 
-        color_sliders: List[Slider]
-    ) -> None:
-        """Отрисовывает меню настроек.
+    def _draw_settings_background(self, surface: pygame.Surface) -> None:
+        """Отрисовывает фон меню настроек.
         
         Args:
-            settings_sliders: Слайдеры настроек
-            color_pickers: Цветовые пикеры
-            settings_buttons: Кнопки меню настроек
-            active_picker: Активный цветовой пикер
-            color_sliders: Слайдеры RGB компонентов
+            surface: Поверхность для отрисовки
         """
-
-        self.screen.fill(Config.IVORY)
+        surface.fill(Config.IVORY)
         
         # заголовок настроек
-        title = self.settings_font.render("Настройки", True, Config.BLACK)
+        title = FontRegistry.render("Настройки", Config.BLACK, Config.SETTINGS_FONT_SIZE)
         title_rect = title.get_rect(center=(Config.WIDTH // 2, 50))
-        self.screen.blit(title, title_rect)
-
-        # элементы интерфейса
-        for slider in settings_sliders:
-            slider.draw(self.screen)
-
-        for picker in color_pickers:
-            picker.draw(self.screen)
-
-        # если есть активный пикер, отрисовываем RGB слайдеры
-        if active_picker:
-            for slider in color_sliders:
-                slider.draw(self.screen)
-
-        for button in settings_buttons:
-            button.draw(self.screen)
+        surface.blit(title, title_rect)
     
     def _draw_tool_info(
         self, 
+        surface: pygame.Surface, 
         x: int, 
         y: int, 
         title: str, 
@@ -183,6 +271,7 @@ class MenuView:
         """Отрисовывает информацию об игровом инструменте.
         
         Args:
+            surface: Поверхность для отрисовки
             x: X-координата начала блока
             y: Y-координата начала блока
             title: Заголовок инструмента
@@ -190,10 +279,10 @@ class MenuView:
             color: Цвет заголовка (RGB)
         """
         # заголовок
-        title_surface = self.info_font.render(title, True, color)
-        self.screen.blit(title_surface, (x, y))
+        title_surface = FontRegistry.render(title, color, Config.INFO_FONT_SIZE)
+        surface.blit(title_surface, (x, y))
         
         # строки описания
         for i, line in enumerate(description):
-            text_surface = self.info_font.render(line, True, Config.WHITE)
-            self.screen.blit(text_surface, (x, y + 40 + i * 30))
\ No newline at end of file
+            text_surface = FontRegistry.render(line, Config.WHITE, Config.INFO_FONT_SIZE)
+            surface.blit(text_surface, (x, y + 40 + i * 30))
\ No newline at end of file
@@ -0,0 +1,195 @@
+"""Кэш заранее отрисованных спрайтов.
+
+Этот модуль содержит класс SpriteCache, который хранит спрайты кругов
+для каждого сочетания цвета, радиуса и квантованной прозрачности
+и рисует целые слои точек одним пакетным вызовом Surface.blits.
+"""
+
+import pygame
+import numpy as np
+from pygame import gfxdraw
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from src.config import Config
+
+
+class SpriteCache:
+    """Кэш спрайтов кругов с пакетной отрисовкой слоев.
+
+    Спрайт рисуется тем же gfxdraw.filled_circle, что и раньше,
+    поэтому форма точек не меняется. Прозрачность квантуется
+    до alpha_levels уровней, и для каждого цвета и радиуса создается
+    ряд спрайтов по всем уровням.
+
+    Attributes:
+        alpha_levels (int): Количество уровней прозрачности
+    """
+
+    def __init__(self, alpha_levels: int = Config.SPRITE_ALPHA_LEVELS) -> None:
+        """Создает пустой кэш.
+
+        Args:
+            alpha_levels: Количество уровней прозрачности
+        """
+        self.alpha_levels = alpha_levels
+        self._circles: Dict[Tuple[Tuple[int, int, int], int], List[pygame.Surface]] = {}
+        self._colors: Optional[Dict[str, Any]] = None
+
+    def sync(self, colors: Dict[str, Any]) -> None:
+        """Сбрасывает кэш, если изменились цвета из настроек.
+
+        Args:
+            colors: Словарь цветов из настроек игры
+        """
+        colors = {name: tuple(color) for name, color in colors.items()}
+        if colors != self._colors:
+            self._circles.clear()
+            self._colors = colors
+
+    def circles(self, color: Sequence[int], radius: int) -> List[pygame.Surface]:
+        """Возвращает спрайты круга для всех уровней прозрачности.
+
+        Args:
+            color: Цвет круга (RGB)
+            radius: Радиус круга
+
+        Returns:
+            List[pygame.Surface]: Спрайты по возрастанию прозрачности
+        """
+        key = (tuple(color[:3]), radius)
+        sprites = self._circles.get(key)
+        if sprites is None:
+            sprites = self._render(key[0], radius)
+            self._circles[key] = sprites
+        return sprites
+
+    def levels(self, alphas: np.ndarray) -> np.ndarray:
+        """Квантует значения прозрачности в номера уровней.
+
+        Args:
+            alphas: Значения прозрачности 0..255
+
+        Returns:
+            np.ndarray: Номера уровней
+        """
+        top = self.alpha_levels - 1
+        alphas = np.clip(np.asarray(alphas, dtype=np.float32), 0, 255)
+        return (alphas * (top / 255) + 0.5).astype(np.int32)
+
+    def draw_circles(
+        self,
+        surface: pygame.Surface,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        color: Sequence[int],
+        radius: int,
+        alphas: np.ndarray
+    ) -> Optional[pygame.Rect]:
+        """Рисует слой кругов одного цвета и радиуса одним вызовом blits.
+
+        Args:
+            surface: Поверхность для отрисовки
+            xs: X-координаты центров
+            ys: Y-координаты центров
+            color: Цвет кругов (RGB)
+            radius: Радиус кругов
+            alphas: Прозрачность каждого круга 0..255
+
+        Returns:
+            Optional[pygame.Rect]: Прямоугольник, охватывающий слой,
+                                   или None, если ничего не нарисовано
+        """
+        if radius < 0 or not len(xs):
+            return None
+
+        sprites = self.circles(color, radius)
+        left = np.asarray(xs).astype(np.int32) - radius
+        top = np.asarray(ys).astype(np.int32) - radius
+        surface.blits(
+            [
+                (sprites[level], (x, y))
+                for level, x, y in zip(self.levels(alphas).tolist(), left.tolist(), top.tolist())
+            ],
+            False
+        )
+        return self._bounds(left, top, np.full(len(left), radius * 2 + 1))
+
+    def draw_particles(self, surface: pygame.Surface, particles: Any) -> Optional[pygame.Rect]:
+        """Рисует пул частиц одним вызовом blits.
+
+        Args:
+            surface: Поверхность для отрисовки
+            particles: Пул частиц (ParticleSystem)
+
+        Returns:
+            Optional[pygame.Rect]: Прямоугольник, охватывающий частицы,
+                                   или None, если частиц нет
+        """
+        count = particles.count
+        if not count:
+            return None
+
+        # прозрачность на основе оставшегося времени жизни
+        alphas = 255 * (1 - particles.age[:count] / particles.lifetime[:count])
+        radii = particles.radius[:count].astype(np.int32)
+        left = particles.x[:count].astype(np.int32) - radii
+        top = particles.y[:count].astype(np.int32) - radii
+
+        palette = particles.palette
+        series: Dict[Tuple[int, int], List[pygame.Surface]] = {}
+        blits = []
+        for color, radius, level, x, y in zip(
+            particles.color_index[:count].tolist(),
+            radii.tolist(),
+            self.levels(alphas).tolist(),
+            left.tolist(),
+            top.tolist()
+        ):
+            sprites = series.get((color, radius))
+            if sprites is None:
+                sprites = series[(color, radius)] = self.circles(palette[color], radius)
+            blits.append((sprites[level], (x, y)))
+        surface.blits(blits, False)
+        return self._bounds(left, top, radii * 2 + 1)
+
+    @staticmethod
+    def _bounds(left: np.ndarray, top: np.ndarray, sizes: np.ndarray) -> pygame.Rect:
+        """Вычисляет прямоугольник, охватывающий набор спрайтов.
+
+        Args:
+            left: Левые края спрайтов
+            top: Верхние края спрайтов
+            sizes: Стороны спрайтов
+
+        Returns:
+            pygame.Rect: Охватывающий прямоугольник
+        """
+        x0, y0 = int(left.min()), int(top.min())
+        x1, y1 = int((left + sizes).max()), int((top + sizes).max())
+        return pygame.Rect(x0, y0, x1 - x0, y1 - y0)
+
+    def _render(self, color: Tuple[int, int, int], radius: int) -> List[pygame.Surface]:
+        """Рисует спрайты круга для всех уровней прозрачности.
+
+        Args:
+            color: Цвет круга (RGB)
+            radius: Радиус круга
+
+        Returns:
+            List[pygame.Surface]: Спрайты по возрастанию прозрачности
+        """
+        size = radius * 2 + 1
+        base = pygame.Surface((size, size), pygame.SRCALPHA)
+        gfxdraw.filled_circle(base, radius, radius, radius, (*color, 255))
+
+        top = self.alpha_levels - 1
+        sprites = []
+        for level in range(self.alpha_levels):
+            sprite = base.copy()
+            alpha = round(level * 255 / top)
+            sprite.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+
+            # формат экрана ускоряет blits
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            sprites.append(sprite)
+        return sprites
@@ -8,7 +8,8 @@
 
 import pygame
 from src.config import Config
-from typing import Tuple
+from src.view.font_registry import FontRegistry
+from typing import List, Tuple
 from pygame.event import Event
 
 
@@ -22,6 +23,7 @@ class Button:
         hover_color (Tuple[int, int, int]): Цвет кнопки при наведении (RGB)
         is_hovered (bool): Флаг наведения курсора
         font (pygame.font.Font): Шрифт для текста кнопки
+        dirty (bool): Флаг изменения вида с последней отрисовки
     """
     
     def __init__(
@@ -50,13 +52,17 @@ class Button:
         self.color = color
         self.hover_color = hover_color
         self.is_hovered = False
-        self.font = pygame.font.SysFont(Config.FONT_NAME, Config.UI_FONT_SIZE)
+        self.font = FontRegistry.get(Config.UI_FONT_SIZE)
+        self.dirty = True
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
         """Отрисовывает кнопку на указанной поверхности.
         
         Args:
             surface: Поверхность для отрисовки
+            
+        Returns:
+            pygame.Rect: Отрисованная область
         """
         # цвет в зависимости от состояния наведения
         color = self.hover_color if self.is_hovered else self.color
@@ -77,7 +83,7 @@ class Button:
             text_color = Config.WHITE
             
         # текст кнопки
-        text_surface = self.font.render(self.text, True, text_color)
+        text_surface = FontRegistry.render(self.text, text_color, Config.UI_FONT_SIZE)
         surface.blit(
             text_surface, 
             (
@@ -85,6 +91,8 @@ class Button:
                 self.rect.centery - text_surface.get_height() // 2
             )
         )
+        self.dirty = False
+        return self.rect.copy()
 
     def check_hover(self, pos: Tuple[int, int]) -> bool:
         """Проверяет, находится ли курсор над кнопкой.
@@ -95,7 +103,10 @@ class Button:
         Returns:
             bool: True если курсор над кнопкой, иначе False
         """
-        self.is_hovered = self.rect.collidepoint(pos)
+        hovered = self.rect.collidepoint(pos)
+        if hovered != self.is_hovered:
+            self.is_hovered = hovered
+            self.dirty = True
         return self.is_hovered
 
     def is_clicked(
@@ -127,6 +138,7 @@ class Slider:
         text (str): Текст слайдера
         font (pygame.font.Font): Шрифт для текста
         dragging (bool): Флаг перетаскивания ползунка
+        dirty (bool): Флаг изменения вида с последней отрисовки
     """
     
     def __init__(
@@ -158,8 +170,9 @@ class Slider:
         self.max = max_val
         self.value = initial_val
         self.text = text
-        self.font = pygame.font.SysFont(Config.FONT_NAME, Config.UI_FONT_SIZE)
+        self.font = FontRegistry.get(Config.UI_FONT_SIZE)
         self.dragging = False
+        self.dirty = True
         self.update_knob()
 
     def update_knob(self) -> None:
@@ -168,12 +181,16 @@ class Slider:
         # позиция ползунка как процент от диапазона
         knob_pos = ((self.value - self.min) / value_range) * (self.rect.width - Config.SLIDER_KNOB_WIDTH)
         self.knob_rect.x = self.rect.x + knob_pos
+        self.dirty = True
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
         """Отрисовывает слайдер на указанной поверхности.
         
         Args:
             surface: Поверхность для отрисовки
+            
+        Returns:
+            pygame.Rect: Отрисованная область вместе с текстом
         """
         # фон слайдера
         pygame.draw.rect(surface, Config.LIGHT_GRAY, self.rect)
@@ -194,15 +211,17 @@ class Slider:
         )
         
         # текст с текущим значением
-        text_surface = self.font.render(
+        text_surface = FontRegistry.render(
             f"{self.text}: {int(self.value)}", 
-            True, 
-            Config.BLACK
+            Config.BLACK, 
+            Config.UI_FONT_SIZE
         )
-        surface.blit(
+        text_rect = surface.blit(
             text_surface, 
             (self.rect.x, self.rect.y - Config.SLIDER_TEXT_OFFSET)
         )
+        self.dirty = False
+        return self.rect.union(text_rect)
 
     def handle_event(self, event: Event) -> bool:
         """Обрабатывает события слайдера.
@@ -241,6 +260,7 @@ class ColorPicker:
         text (str): Текст пикера
         font (pygame.font.Font): Шрифт для текста
         active (bool): Флаг активности пикера
+        dirty (bool): Флаг изменения вида с последней отрисовки
     """
     
     def __init__(
@@ -265,14 +285,28 @@ class ColorPicker:
         self.rect = pygame.Rect(x, y, width, height)
         self.color = list(color)  # сохранение как списка для возможного изменения
         self.text = text
-        self.font = pygame.font.SysFont(Config.FONT_NAME, Config.UI_FONT_SIZE)
+        self.font = FontRegistry.get(Config.UI_FONT_SIZE)
         self.active = False
+        self.dirty = True
 
-    def draw(self, surface: pygame.Surface) -> None:
+    @property
+    def color(self) -> List[int]:
+        """Текущий цвет (RGB)."""
+        return self._color
+
+    @color.setter
+    def color(self, color: List[int]) -> None:
+        self._color = color
+        self.dirty = True
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
         """Отрисовывает пикер цвета на указанной поверхности.
         
         Args:
             surface: Поверхность для отрисовки
+            
+        Returns:
+            pygame.Rect: Отрисованная область вместе с текстом
         """
         # прямоугольник с текущим цветом
         pygame.draw.rect(surface, self.color, self.rect)
@@ -284,11 +318,13 @@ class ColorPicker:
         )
         
         # текст пикера
-        text_surface = self.font.render(self.text, True, Config.BLACK)
-        surface.blit(
+        text_surface = FontRegistry.render(self.text, Config.BLACK, Config.UI_FONT_SIZE)
+        text_rect = surface.blit(
             text_surface, 
             (self.rect.x, self.rect.y - Config.SLIDER_TEXT_OFFSET)
         )
+        self.dirty = False
+        return self.rect.union(text_rect)
 
     def handle_event(self, event: Event) -> bool:
         """Обрабатывает события пикера.